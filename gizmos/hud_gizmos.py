@@ -110,6 +110,8 @@ class PS_GIZMO_HUD(bpy.types.GizmoGroup):
     bl_region_type = "WINDOW"
     bl_options = {'PERSISTENT', 'SCALE', 'EXCLUDE_MODAL'}
     RECALC = True
+    # Bumped from prop updates that affect the layout
+    PREFS_REVISION = 0
 
     @classmethod
     def poll(cls, context):
@@ -118,51 +120,65 @@ class PS_GIZMO_HUD(bpy.types.GizmoGroup):
 
     def setup(self, context):
         self.gizmos.clear()
-        self.refresh(context)
+        self.build_gizmos(context)
 
 
-    def refresh(self, context):
-        self.mode = context.mode
-        self.gizmos.clear()
+    def build_gizmos(self, context):
+        self.layout_key = None
+        self.mode_gizmos = {}
         icon_scale = get_icon_scale()
         prefs = user_prefs().hud_gizmos
-        for color_type, icon, operator in get_operators(context):
-            gizmo = self.gizmos.new("GIZMO_GT_button_2d")
-            gizmo.draw_options = {'BACKDROP', 'OUTLINE'}
-            gizmo.icon = icon
-            gizmo.scale_basis = icon_scale
-            gizmo.target_set_operator(operator)
-            gizmo.use_tooltip = True
-            gizmo.show_drag = False
-            gizmo.use_draw_value = True
-            if color_type == 'COL_SEL':
-                gizmo.color = prefs.select_color
-                gizmo.color_highlight = prefs.select_color
-            elif color_type == 'COL_EDI':
-                gizmo.color = prefs.edit_color
-                gizmo.color_highlight = prefs.edit_color
-            elif color_type == 'COL_MAR':
-                gizmo.color = prefs.marks_color
-                gizmo.color_highlight = prefs.marks_color
-            elif color_type == 'COL_RAZ':
-                gizmo.color = prefs.razor_color
-                gizmo.color_highlight = prefs.razor_color
-            gizmo.alpha = .875
-            gizmo.alpha_highlight = 0.5
-            gizmo.use_grab_cursor = False
+        for mode, operators in (('EDIT_MESH', OPERATORS_EDIT_MODE), ('OBJECT', OPERATORS_OBJECT_MODE)):
+            gizmos = []
+            for color_type, icon, operator in operators:
+                gizmo = self.gizmos.new("GIZMO_GT_button_2d")
+                gizmo.draw_options = {'BACKDROP', 'OUTLINE'}
+                gizmo.icon = icon
+                gizmo.scale_basis = icon_scale
+                gizmo.target_set_operator(operator)
+                gizmo.use_tooltip = True
+                gizmo.show_drag = False
+                gizmo.use_draw_value = True
+                if color_type == 'COL_SEL':
+                    gizmo.color = prefs.select_color
+                    gizmo.color_highlight = prefs.select_color
+                elif color_type == 'COL_EDI':
+                    gizmo.color = prefs.edit_color
+                    gizmo.color_highlight = prefs.edit_color
+                elif color_type == 'COL_MAR':
+                    gizmo.color = prefs.marks_color
+                    gizmo.color_highlight = prefs.marks_color
+                elif color_type == 'COL_RAZ':
+                    gizmo.color = prefs.razor_color
+                    gizmo.color_highlight = prefs.razor_color
+                gizmo.alpha = .875
+                gizmo.alpha_highlight = 0.5
+                gizmo.use_grab_cursor = False
+                gizmo.hide = True
+                gizmos.append(gizmo)
+            self.mode_gizmos[mode] = gizmos
 
 
     def draw_prepare(self, context):
         if PS_GIZMO_HUD.RECALC:
             PS_GIZMO_HUD.RECALC = False
             self.setup(context)
-        if self.mode != context.mode:
-            self.setup(context)
+
+        mode = context.mode
+        layout_key = (context.area.width, context.area.height, screen_factor(), PS_GIZMO_HUD.PREFS_REVISION, mode)
+        if self.layout_key == layout_key:
+            return
+        self.layout_key = layout_key
+
+        for gizmos_mode, gizmos in self.mode_gizmos.items():
+            if gizmos_mode != mode:
+                for gizmo in gizmos:
+                    gizmo.hide = True
 
         icon_scale = get_icon_scale()
         icon_offset = get_icon_offset()
         horizontal, x, y = get_icon_row_location(context)
-        for gizmo in self.gizmos:
+        for gizmo in self.mode_gizmos.get(mode, []):
             gizmo.hide = False
             gizmo.scale_basis = icon_scale
             gizmo.matrix_basis[0][3] = x
@@ -171,3 +187,7 @@ class PS_GIZMO_HUD(bpy.types.GizmoGroup):
                 x += icon_offset
             else:
                 y += icon_offset
+
+
+def update_hud_layout(self, context):
+    PS_GIZMO_HUD.PREFS_REVISION += 1
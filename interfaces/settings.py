@@ -105,6 +105,8 @@ class PS_OT_SettingsPopup(bpy.types.Operator):
         row = box.row(align=True)
         row.prop(settings, 'undo_limit')
         row = box.row(align=True)
+        row.prop(settings, 'undo_vert_budget')
+        row = box.row(align=True)
         row.prop(settings, 'mesh_fade_geo_limit')
         row = box.row(align=True)
         row.prop(settings, 'poly_debug_display_limit')
@@ -31,11 +31,7 @@ class PS_OT_AdjustCurves(bpy.types.Operator):
             utils.notifications.init(context, messages=[("$Error", "No curves found")])
             return {'CANCELLED'}
         # Backup Data
-        self.revert_data = dict()
-        for curve in self.curves:
-            copied_curve_data = utils.curve.create_copy(curve)
-            if isinstance(copied_curve_data, bpy.types.Curve):
-                self.revert_data[curve.name] = copied_curve_data
+        self.snapshots = [utils.curve.CurveSnapshot(curve) for curve in self.curves]
         # Props
         self.spline_types = ['BEZIER', 'POLY', 'NURBS']
         self.spline_type = self.spline_types[0]
@@ -108,18 +104,12 @@ class PS_OT_AdjustCurves(bpy.types.Operator):
         def shut_down():
             if self.modal_status in {MODAL_STATUS.ERROR, MODAL_STATUS.CANCEL}:
                 self.std_ops.close(context, revert=True)
-                for curve in self.curves:
-                    if curve.name in self.revert_data:
-                        copied_curve_data = self.revert_data[curve.name]
-                        if isinstance(copied_curve_data, bpy.types.Curve):
-                            utils.curve.swap_curve_data_and_remove_current(context, curve, copied_curve_data)
+                toggle = utils.context.object_mode_toggle_start(context)
+                for snapshot in self.snapshots:
+                    snapshot.restore()
+                if toggle: utils.context.object_mode_toggle_end(context)
             else:
                 self.std_ops.close(context, revert=False)
-                for curve in self.curves:
-                    if curve.name in self.revert_data:
-                        copied_curve_data = self.revert_data[curve.name]
-                        if isinstance(copied_curve_data, bpy.types.Curve):
-                            utils.curve.delete_curve_data(copied_curve_data)
         utils.guards.except_guard(try_func=shut_down, try_args=None)
         utils.modal_ops.standard_modal_shutdown(self, context, utils)
 
@@ -169,8 +159,7 @@ class PS_OT_AdjustCurves(bpy.types.Operator):
                 utils.curve.set_radius(curve, radius=self.radius)
         elif label == "Type":
             self.spline_type = self.spline_types[slide_prop.index]
-            self.update_curves_to_copy(context)
-            self.sync_curve_settings()
+            self.update_spline_types(context)
         elif label == "Smooth":
             for curve in self.curves:
                 utils.curve.set_smooth(curve, smooth=self.use_smooth)
@@ -191,23 +180,19 @@ class PS_OT_AdjustCurves(bpy.types.Operator):
 
     # --- UTILS --- #
 
-    def update_curves_to_copy(self, context):
-        utils.context.object_mode_toggle_start(context)
-        for curve in self.curves:
-            if curve.name in self.revert_data:
-                copied_curve_data = self.revert_data[curve.name]
-                if isinstance(copied_curve_data, bpy.types.Curve):
-                    utils.curve.swap_curve_data_and_remove_current(context, curve, copied_curve_data)
-                copied_curve_data = utils.curve.create_copy(curve)
-                if isinstance(copied_curve_data, bpy.types.Curve):
-                    self.revert_data[curve.name] = copied_curve_data
-        utils.context.object_mode_toggle_end(context)
+    def update_spline_types(self, context):
+        toggle = utils.context.object_mode_toggle_start(context)
+        for snapshot in self.snapshots:
+            snapshot.set_spline_type(spline_type=self.spline_type)
+        if toggle: utils.context.object_mode_toggle_end(context)
 
 
     def sync_curve_settings(self):
-        for curve in self.curves:
+        for snapshot in self.snapshots:
+            curve = snapshot.curve
             utils.curve.set_smooth(curve, smooth=self.use_smooth)
             utils.curve.set_radius(curve, radius=self.radius)
             utils.curve.set_fill_end_caps(curve, fill_end_caps=self.fill_end_caps)
             utils.curve.set_bevel_resolution(curve, resolution=self.resolution)
-            utils.curve.set_spline_type(curve, spline_type=self.spline_type)
+            if any([spline_type != self.spline_type for spline_type in snapshot.spline_types]):
+                snapshot.set_spline_type(spline_type=self.spline_type)
@@ -42,39 +42,29 @@ class PS_OT_CleanMesh(bpy.types.Operator):
         if not objs:
             return {'FINISHED'}
 
-        mode = context.mode
-        if context.mode != 'EDIT_MESH':
-            if not context.active_object:
-                context.view_layer.objects.active = objs[0]
-            utils.context.set_mode(target_mode='EDIT_MESH')
-
         # Clean All if no verts selected
         clean_all = True
-        if mode == 'EDIT_MESH':
+        if context.mode == 'EDIT_MESH':
             if utils.bmu.query_any_sel_verts(objs):
                 clean_all = False
 
-        for obj in objs:
-            # Clean
-            utils.bmu.ops_clean_mesh(context, obj,
-                clean_all=clean_all,
-                dissolve_angle=self.dissolve_angle,
-                remove_interior=self.remove_interior,
-                clean_hidden=self.clean_hidden,
-                epsilon=self.epsilon)
-            # Poly Fade
-            if mode == 'EDIT_MESH' and not clean_all:
-                mat_ws = obj.matrix_world
-                mesh = obj.data
-                bm = bmesh.from_edit_mesh(mesh)
-                lines = [mat_ws @ vert.co.copy() for edge in bm.edges if edge.select and edge.is_valid for vert in edge.verts if vert.is_valid]
-                utils.poly_fade.init(obj=obj, lines=lines)
+        # Clean
+        cleaned = utils.bmu.ops_clean_meshes(context, objs,
+            clean_all=clean_all,
+            dissolve_angle=self.dissolve_angle,
+            remove_interior=self.remove_interior,
+            clean_hidden=self.clean_hidden,
+            epsilon=self.epsilon)
+
+        # Poly Fade
+        for obj in cleaned:
+            if context.mode == 'EDIT_MESH' and not clean_all:
+                bm = bmesh.from_edit_mesh(obj.data)
+                edges = [edge for edge in bm.edges if edge.select]
+                utils.poly_fade.init(obj=obj, coords=utils.poly_fade.bmesh_edge_arrays(edges))
             else:
                 utils.poly_fade.init(obj=obj)
 
-        if mode != 'EDIT_MESH':
-            utils.context.set_mode(target_mode=mode)
-
         msgs = [
             ("Operation"      , "Clean Mesh"),
             ("Objects"        , str(len(objs))),
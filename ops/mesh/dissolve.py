@@ -47,6 +47,8 @@ class PS_OT_Dissolve(bpy.types.Operator):
         # Ops
         self.angle_limit = 35
         self.planar_limit = 2
+        # KEY -> Object name || VAL -> AngleField of the editor bmesh
+        self.angle_fields = dict()
         # Graphics
         self.mode = 'None'
         self.p1 = Vector((0,0,0))
@@ -246,7 +248,8 @@ class PS_OT_Dissolve(bpy.types.Operator):
         face = bmed.get_bm_elem(index=hit_info.face_index, elem_type='FACE')
         if face is None: return
 
-        faces = utils.bmu.connected_faces_to_face_by_angle(face, angle=math.radians(self.planar_limit))
+        field = self.angle_field(obj, bm)
+        faces = utils.bmu.connected_faces_to_face_by_angle(face, angle=math.radians(self.planar_limit), field=field)
         if not faces: return
         perimeter_edges = utils.bmu.perimeter_edges_from_faces(faces, convert_to_list=False)
         if not perimeter_edges: return
@@ -266,7 +269,8 @@ class PS_OT_Dissolve(bpy.types.Operator):
             return
 
         angle_lim = math.radians(self.angle_limit)
-        edges = {e for f in faces for e in f.edges if e not in perimeter_edges and e.calc_face_angle(math.inf) <= angle_lim}
+        within = field.mask_at_most(angle_lim).tolist()
+        edges = {e for f in faces for e in f.edges if e not in perimeter_edges and within[e.index]}
 
         if len(edges) == len(bm.edges):
             utils.notifications.init(context, messages=[("$Error", "All geometry would be dissolved")])
@@ -374,14 +378,24 @@ class PS_OT_Dissolve(bpy.types.Operator):
 
     def undo(self, context):
         self.bmeCON.save_pool_undo(context, update_ray=True)
+        self.angle_fields.clear()
         self.reset(context)
 
 
     def save(self, context, obj):
+        self.angle_fields.pop(obj.name, None)
         if self.bmeCON.save_in_pool(context, obj, update_ray=True):
             self.bmeCON.save_pool_push()
 
 
+    def angle_field(self, obj, bm):
+        field = self.angle_fields.get(obj.name)
+        if field is None or field.key != utils.angle_field.bmesh_topology_key(bm):
+            field = utils.angle_field.field_from_bmesh(bm)
+            self.angle_fields[obj.name] = field
+        return field
+
+
     def reset(self, context):
         self.mode = "None"
         self.bmeCON.mesh_graphics.clear_batches(verts=True, edges=True, faces=True)
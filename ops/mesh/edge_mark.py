@@ -63,8 +63,8 @@ class PS_OT_EdgeMark(bpy.types.Operator):
                     selected_only=selected_only,
                     seam=self.remove_seam,
                     sharp=self.remove_sharp,
-                    e_crease=self.remove_bevel_weight,
-                    b_weight=self.remove_crease_weight)
+                    e_crease=self.remove_crease_weight,
+                    b_weight=self.remove_bevel_weight)
             msgs = [
                 ("Operation"      , "All Removed" if selected_only else "Selected Removed"),
                 ("Objects"        , str(len(objs))),
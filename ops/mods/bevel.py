@@ -9,6 +9,8 @@ from ... import utils
 from ...utils.modal_status import MODAL_STATUS, UX_STATUS
 except_guard_prop_set = utils.guards.except_guard_prop_set
 
+SYNC_PROPS = ['show_viewport', 'angle_limit', 'material', 'profile', 'width', 'segments', 'use_clamp_overlap', 'harden_normals', 'mark_seam', 'mark_sharp', 'offset_type', 'miter_outer', 'miter_inner']
+
 DESC = """Bevel\n
 • Object Mode
 \t\t→ (LMB) Adjust last or create new
@@ -218,13 +220,13 @@ class PS_OT_Bevel(bpy.types.Operator):
         # BEVEL
         elif label == "Offset Type":
             self.mod.offset_type = self.offset_type[slide_prop.index]
-            self.sync_settings()
+            self.sync_settings(props={'offset_type'})
         elif label == "Miter Outer":
             self.mod.miter_outer = self.miter_outer[slide_prop.index]
-            self.sync_settings()
+            self.sync_settings(props={'miter_outer'})
         elif label == "Miter Inner":
             self.mod.miter_inner = self.miter_inner[slide_prop.index]
-            self.sync_settings()
+            self.sync_settings(props={'miter_inner'})
         elif label == "Apply Scale":
             if self.apply_scale:
                 self.std_ops.set_object_scale()
@@ -250,7 +252,7 @@ class PS_OT_Bevel(bpy.types.Operator):
         elif label == "Affect Type":
             self.mod.affect = self.affect_types[slide_prop.index]
         else:
-            self.sync_settings()
+            self.sync_settings(props={slide_prop.prop_name} & set(SYNC_PROPS) if slide_prop.instance == self.mod else None)
 
 
     def mods_panel_shift_callback(self, context, event, slide_prop):
@@ -277,12 +279,12 @@ class PS_OT_Bevel(bpy.types.Operator):
 
     def angle_label_callback(self, context, event, slide_prop):
         self.mod.angle_limit = math.radians(30)
-        self.sync_settings()
+        self.sync_settings(props={'angle_limit'})
 
 
     def profile_label_callback(self, context, event, slide_prop):
         self.mod.profile = 0.5
-        self.sync_settings()
+        self.sync_settings(props={'profile'})
 
 
     def obj_preview_callback(self, context, event, slide_prop, index=0, initialized=False):
@@ -384,27 +386,12 @@ class PS_OT_Bevel(bpy.types.Operator):
             utils.object.select_obj(context, self.obj, make_active=True)
 
 
-    def sync_settings(self):
+    def sync_settings(self, props=None):
         if self.sync_mode == False:
             return
+        props = SYNC_PROPS if props is None else props
         for controller in self.mod_controllers:
-            if controller.mod == self.mod:
-                continue
-            mod = controller.mod
-            mod.show_viewport = self.mod.show_viewport
-            mod.angle_limit = self.mod.angle_limit
-            mod.material = self.mod.material
-            mod.profile = self.mod.profile
-            mod.width = self.mod.width
-            mod.use_clamp_overlap = self.mod.use_clamp_overlap
-            mod.harden_normals = self.mod.harden_normals
-            mod.mark_seam = self.mod.mark_seam
-            mod.mark_sharp = self.mod.mark_sharp
-            # Possibly Slower to Set
-            if mod.width != self.mod.width:
-                mod.width = self.mod.width
-            if mod.segments != self.mod.segments:
-                mod.segments = self.mod.segments
+            controller.sync_from(self.mod, props)
 
 
     def smooth_angle_setup(self):
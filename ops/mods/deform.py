@@ -8,6 +8,9 @@ from ... import utils
 from ...utils.modal_status import MODAL_STATUS, UX_STATUS
 except_guard_prop_set = utils.guards.except_guard_prop_set
 
+SYNC_PROPS = ['deform_method', 'deform_axis', 'factor', 'angle', 'limits']
+SYNC_LABEL_PROPS = {"Method": {'deform_method'}, "Axis": {'deform_axis'}, "Factor": {'factor', 'angle'}, "Limit 0": {'limits'}, "Limit 1": {'limits'}}
+
 DESC = """Deform\n
 • Object Mode
 \t\t→ (LMB) Adjust last or create new
@@ -225,8 +228,12 @@ class PS_OT_Deform(bpy.types.Operator):
             self.mod.limits[0] = self.limit_0
         elif label == "Limit 1":
             self.mod.limits[1] = self.limit_1
+        # Sync Mode
+        elif label == "Sync Mode":
+            self.sync_settings()
+            return
 
-        self.sync_settings()
+        self.sync_settings(props=SYNC_LABEL_PROPS.get(label, set()))
 
 
     def mods_panel_shift_callback(self, context, event, slide_prop):
@@ -272,7 +279,7 @@ class PS_OT_Deform(bpy.types.Operator):
         self.factor = value
         self.mod.factor = value
         self.mod.angle = value
-        self.sync_settings()
+        self.sync_settings(props={'factor', 'angle'})
 
 
     def rebuild_slides_menu_if_valid(self, context, event, slide_prop):
@@ -382,17 +389,10 @@ class PS_OT_Deform(bpy.types.Operator):
             utils.object.select_obj(context, self.obj, make_active=True)
 
 
-    def sync_settings(self):
+    def sync_settings(self, props=None):
         if self.sync_mode == False:
             return
+        props = SYNC_PROPS if props is None else props
         for controller in self.mod_controllers:
-            if controller.mod == self.mod:
-                continue
-            mod = controller.mod
-            mod.deform_method = self.mod.deform_method
-            mod.deform_axis = self.mod.deform_axis
-            mod.factor = self.mod.factor
-            mod.angle = self.mod.angle
-            mod.limits[0] = self.mod.limits[0]
-            mod.limits[1] = self.mod.limits[1]
+            controller.sync_from(self.mod, props)
 
@@ -51,7 +51,7 @@ class PS_OT_ObjectShading(bpy.types.Operator):
                 weighted_normal=self.weighted_normal,
                 angle=self.auto_smooth_angle)
             if self.shade_booleans and obj.type == 'MESH':
-                boolean_objs = utils.modifiers.referenced_booleans(obj)
+                boolean_objs = utils.ref_graph.referenced_booleans(obj)
                 for boolean_obj in boolean_objs:
                     shaded_booleans_count += 1
                     utils.mesh.shade_polygons(boolean_obj, use_smooth=self.smooth)
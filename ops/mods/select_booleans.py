@@ -46,7 +46,7 @@ class PS_OT_SelectBooleans(bpy.types.Operator):
         self.recursive_objs = []
         self.recursive_objs_map = {}
         for obj in self.boolean_objs:
-            objs = utils.modifiers.referenced_booleans(obj)
+            objs = utils.ref_graph.referenced_booleans(obj)
             if objs:
                 self.recursive_objs.append(obj)
                 self.recursive_objs.extend(objs)
@@ -8,6 +8,8 @@ from ... import utils
 from ...utils.modal_status import MODAL_STATUS, UX_STATUS
 except_guard_prop_set = utils.guards.except_guard_prop_set
 
+SYNC_PROPS = ['solidify_mode', 'thickness', 'offset', 'use_even_offset', 'use_rim', 'use_rim_only', 'use_flip_normals', 'use_quality_normals', 'material_offset', 'material_offset_rim', 'edge_crease_inner', 'edge_crease_outer', 'edge_crease_rim', 'bevel_convex', 'thickness_clamp']
+
 DESC = """Solidify\n
 • Object Mode
 \t\t→ (LMB) Adjust last or create new
@@ -181,7 +183,7 @@ class PS_OT_Solidify(bpy.types.Operator):
             self.rebuild_slides_menu_if_valid(context, event, slide_prop)
         # SOLIDIFY
         else:
-            self.sync_settings()
+            self.sync_settings(props={slide_prop.prop_name} & set(SYNC_PROPS) if slide_prop.instance == self.mod else None)
 
 
     def mods_panel_shift_callback(self, context, event, slide_prop):
@@ -208,12 +210,12 @@ class PS_OT_Solidify(bpy.types.Operator):
 
     def offset_label_callback(self, context, event, slide_prop):
         self.mod.offset = 0
-        self.sync_settings()
+        self.sync_settings(props={'offset'})
 
 
     def thickness_label_callback(self, context, event, slide_prop):
         self.mod.thickness = 0.125
-        self.sync_settings()
+        self.sync_settings(props={'thickness'})
 
 
     def obj_preview_callback(self, context, event, slide_prop, index=0, initialized=False):
@@ -312,27 +314,11 @@ class PS_OT_Solidify(bpy.types.Operator):
             utils.object.select_obj(context, self.obj, make_active=True)
 
 
-    def sync_settings(self):
+    def sync_settings(self, props=None):
         if self.sync_mode == False:
             return
+        props = SYNC_PROPS if props is None else props
         for controller in self.mod_controllers:
-            if controller.mod == self.mod:
-                continue
-            mod = controller.mod
-            mod.solidify_mode = self.mod.solidify_mode
-            mod.thickness = self.mod.thickness
-            mod.offset = self.mod.offset
-            mod.use_even_offset = self.mod.use_even_offset
-            mod.use_rim = self.mod.use_rim
-            mod.use_rim_only = self.mod.use_rim_only
-            mod.use_flip_normals = self.mod.use_flip_normals
-            mod.use_quality_normals = self.mod.use_quality_normals
-            mod.material_offset = self.mod.material_offset
-            mod.material_offset_rim = self.mod.material_offset_rim
-            mod.edge_crease_inner = self.mod.edge_crease_inner
-            mod.edge_crease_outer = self.mod.edge_crease_outer
-            mod.edge_crease_rim = self.mod.edge_crease_rim
-            mod.bevel_convex = self.mod.bevel_convex
-            mod.thickness_clamp = self.mod.thickness_clamp
+            controller.sync_from(self.mod, props)
 
 
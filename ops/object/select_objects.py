@@ -60,14 +60,14 @@ class PS_OT_SelectObjects(bpy.types.Operator):
             elif self.selection_opt == 'CHILD_PARENT':
                 found_objs.update(utils.object.objs_parents_and_children(obj))
             elif self.selection_opt == 'MOD_OBJECTS':
-                found_objs.update(utils.modifiers.referenced_objects(obj))
+                found_objs.update(utils.ref_graph.referenced_objects(obj))
             elif self.selection_opt == 'ALL':
-                found_objs.update(utils.modifiers.referenced_objects(obj))
+                found_objs.update(utils.ref_graph.referenced_objects(obj))
                 selected = utils.object.objs_parents_and_children(obj)
                 if selected:
                     found_objs.update(selected)
                     for selected_obj in selected:
-                        found_objs.update(utils.modifiers.referenced_objects(selected_obj))
+                        found_objs.update(utils.ref_graph.referenced_objects(selected_obj))
         for obj in found_objs:
             if not obj.visible_get(view_layer=context.view_layer):
                 utils.collections.ensure_object_collections_visible(context, obj)
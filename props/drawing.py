@@ -5,6 +5,7 @@
 import bpy
 from bpy.types import PropertyGroup
 from bpy.props import BoolProperty, FloatProperty, EnumProperty, IntProperty, FloatVectorProperty
+from ..gizmos.hud_gizmos import update_hud_layout
 
 
 class PS_PROPS_Drawing(PropertyGroup):
@@ -12,7 +13,7 @@ class PS_PROPS_Drawing(PropertyGroup):
     # --- PAD --- #
     padding: IntProperty(
         name="UI Padding", description="UI Padding",
-        min=3, max=10, default=6)
+        min=3, max=10, default=6, update=update_hud_layout)
     screen_padding: IntProperty(
         name="Screen Padding", description="Panel offset from screen boundary",
         min=15, max=150, default=24)
@@ -221,6 +221,20 @@ def register_addon():
     from .utils.mesh import remove_backup_meshes
     bpy.app.handlers.undo_post.append(remove_backup_meshes)
 
+    # Reference Graph
+    from .utils.ref_graph import tag_ref_graph, reset_ref_graph
+    bpy.app.handlers.depsgraph_update_post.append(tag_ref_graph)
+    bpy.app.handlers.undo_post.append(reset_ref_graph)
+
+    # Collections
+    from .utils.collections import reset_collection_cache
+    bpy.app.handlers.undo_post.append(reset_collection_cache)
+
+    # Angle Fields
+    from .utils.angle_field import tag_angle_fields, reset_angle_fields
+    bpy.app.handlers.depsgraph_update_post.append(tag_angle_fields)
+    bpy.app.handlers.undo_post.append(reset_angle_fields)
+
     # Pointers
     bpy.types.Object.ps = PointerProperty(name="PolyOps Props", type=PS_PROPS_Object)
     bpy.types.Mesh.ps = PointerProperty(name="PolyOps Props", type=PS_PROPS_Mesh)
@@ -251,6 +265,25 @@ def unregister_addon():
     if remove_backup_meshes in bpy.app.handlers.undo_post:
         bpy.app.handlers.undo_post.remove(remove_backup_meshes)
 
+    # Reference Graph
+    from .utils.ref_graph import tag_ref_graph, reset_ref_graph
+    if tag_ref_graph in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(tag_ref_graph)
+    if reset_ref_graph in bpy.app.handlers.undo_post:
+        bpy.app.handlers.undo_post.remove(reset_ref_graph)
+
+    # Collections
+    from .utils.collections import reset_collection_cache
+    if reset_collection_cache in bpy.app.handlers.undo_post:
+        bpy.app.handlers.undo_post.remove(reset_collection_cache)
+
+    # Angle Fields
+    from .utils.angle_field import tag_angle_fields, reset_angle_fields
+    if tag_angle_fields in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(tag_angle_fields)
+    if reset_angle_fields in bpy.app.handlers.undo_post:
+        bpy.app.handlers.undo_post.remove(reset_angle_fields)
+
     # Pointers
     del bpy.types.Object.ps
     del bpy.types.Mesh.ps
@@ -276,6 +309,12 @@ def load_post_append():
     from .utils.modal_labels import remove_label_fade_handle
     # Ops Poly Display
     from .ops.handles.poly_debug import remove_poly_debug_handle
+    # Reference Graph
+    from .utils.ref_graph import reset_ref_graph
+    # Collections
+    from .utils.collections import reset_collection_cache
+    # Angle Fields
+    from .utils.angle_field import reset_angle_fields
 
     functions = (
         remove_notify_handle,
@@ -284,6 +323,9 @@ def load_post_append():
         remove_vec_fade_handle,
         remove_label_fade_handle,
         remove_poly_debug_handle,
+        reset_ref_graph,
+        reset_collection_cache,
+        reset_angle_fields,
     )
 
     for function in functions:
@@ -303,6 +345,12 @@ def load_post_remove():
     from .utils.modal_labels import remove_label_fade_handle
     # Ops Poly Display
     from .ops.handles.poly_debug import remove_poly_debug_handle
+    # Reference Graph
+    from .utils.ref_graph import reset_ref_graph
+    # Collections
+    from .utils.collections import reset_collection_cache
+    # Angle Fields
+    from .utils.angle_field import reset_angle_fields
 
     functions = (
         remove_notify_handle,
@@ -311,6 +359,9 @@ def load_post_remove():
         remove_vec_fade_handle,
         remove_label_fade_handle,
         remove_poly_debug_handle,
+        reset_ref_graph,
+        reset_collection_cache,
+        reset_angle_fields,
     )
 
     for function in functions:
@@ -0,0 +1,161 @@
+########################•########################
+"""                  KenzoCG                  """
+########################•########################
+
+# Loads utils/algos.py and utils/mod_sort.py without utils/__init__ so no bpy is needed
+
+import os
+import sys
+import types
+import random
+import importlib
+import unittest
+from types import SimpleNamespace
+
+UTILS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'utils')
+PACKAGE = 'ps_sort_utils'
+
+if PACKAGE not in sys.modules:
+    package = types.ModuleType(PACKAGE)
+    package.__path__ = [UTILS_DIR]
+    sys.modules[PACKAGE] = package
+
+algos = importlib.import_module(f'{PACKAGE}.algos')
+mod_sort = importlib.import_module(f'{PACKAGE}.mod_sort')
+TYPES = mod_sort.TYPES
+ModSortDesc = mod_sort.ModSortDesc
+
+########################•########################
+"""                  HELPERS                  """
+########################•########################
+
+def sort_options(**overrides):
+    '''
+    RET : Options with the PS_PROPS_Sort defaults
+    '''
+    options = SimpleNamespace(
+        sort_enabled=True,
+        ignore_sort_str="<R7>",
+        top_mirror=True, top_mirror_count=1, top_mirror_check_no_bisect=True, top_mirror_check_no_object=True,
+        top_bevel=True, top_bevel_count=1, top_bevel_require_vgroup=True,
+        top_solidify=True, top_solidify_count=1, top_solidify_require_vgroup=True,
+        top_deform=True, top_deform_count=1, top_deform_require_vgroup=True,
+        top_edge_split=True, top_edge_split_count=1, top_edge_split_require_sharp=True,
+        top_subsurf=True, top_subsurf_count=1,
+        boolean_to_bevel=True, boolean_to_solidify=True, boolean_to_subsurf=True, boolean_to_mirror=True, boolean_to_array=False,
+        bottom_mirror=True, bottom_weld=True, bottom_autosmooth=True, bottom_weighted_normal=True, bottom_array=True, bottom_deform=True, bottom_triangulate=True)
+    for key, value in overrides.items():
+        setattr(options, key, value)
+    return options
+
+
+def apply_moves(items, moves):
+    items = list(items)
+    for from_index, to_index in moves:
+        items.insert(to_index, items.pop(from_index))
+    return items
+
+
+def sorted_names(descs, options):
+    return apply_moves([desc.name for desc in descs], mod_sort.plan_mod_moves(descs, options))
+
+########################•########################
+"""                   TESTS                   """
+########################•########################
+
+class TestReorderMoves(unittest.TestCase):
+
+    def test_sorted_needs_no_moves(self):
+        self.assertEqual(algos.reorder_moves([0, 1, 2, 3]), [])
+        self.assertEqual(algos.reorder_moves([]), [])
+
+
+    def test_single_item_moves_once(self):
+        self.assertEqual(len(algos.reorder_moves([1, 2, 3, 0])), 1)
+        self.assertEqual(len(algos.reorder_moves([3, 0, 1, 2])), 1)
+
+
+    def test_minimal_move_count(self):
+        rng = random.Random(7)
+        for count in range(1, 12):
+            for _ in range(25):
+                order = list(range(count))
+                rng.shuffle(order)
+                moves = algos.reorder_moves(order)
+                self.assertEqual(apply_moves(range(count), moves), order)
+                self.assertEqual(len(moves), count - len(algos.longest_increasing_subsequence(order)))
+
+
+class TestPlanModMoves(unittest.TestCase):
+
+    def test_top_rules(self):
+        descs = [
+            ModSortDesc(name="Boolean", type=TYPES.BOOLEAN),
+            ModSortDesc(name="Bevel", type=TYPES.BEVEL, has_vgroup=True),
+            ModSortDesc(name="Mirror", type=TYPES.MIRROR)]
+        self.assertEqual(sorted_names(descs, sort_options()), ["Mirror", "Bevel", "Boolean"])
+
+
+    def test_top_rule_requirements(self):
+        descs = [
+            ModSortDesc(name="Boolean", type=TYPES.BOOLEAN),
+            ModSortDesc(name="Bevel", type=TYPES.BEVEL),
+            ModSortDesc(name="Mirror", type=TYPES.MIRROR, bisect=True)]
+        self.assertEqual(sorted_names(descs, sort_options()), ["Boolean", "Bevel", "Mirror"])
+
+
+    def test_mid_keeps_boolean_order(self):
+        descs = [
+            ModSortDesc(name="Bevel", type=TYPES.BEVEL),
+            ModSortDesc(name="Boolean A", type=TYPES.BOOLEAN),
+            ModSortDesc(name="Boolean B", type=TYPES.BOOLEAN),
+            ModSortDesc(name="Boolean C", type=TYPES.BOOLEAN)]
+        self.assertEqual(sorted_names(descs, sort_options()), ["Boolean A", "Boolean B", "Boolean C", "Bevel"])
+
+
+    def test_bottom_rules(self):
+        descs = [
+            ModSortDesc(name="Triangulate", type=TYPES.TRIANGULATE),
+            ModSortDesc(name="Weld", type=TYPES.WELD),
+            ModSortDesc(name="Boolean", type=TYPES.BOOLEAN)]
+        self.assertEqual(sorted_names(descs, sort_options()), ["Boolean", "Weld", "Triangulate"])
+
+
+    def test_ignored_keep_their_index(self):
+        descs = [
+            ModSortDesc(name="Triangulate", type=TYPES.TRIANGULATE),
+            ModSortDesc(name="Weld <R7>", type=TYPES.WELD),
+            ModSortDesc(name="Boolean", type=TYPES.BOOLEAN)]
+        self.assertEqual(sorted_names(descs, sort_options()), ["Boolean", "Weld <R7>", "Triangulate"])
+
+
+    def test_empty_ignore_string(self):
+        descs = [
+            ModSortDesc(name="Triangulate", type=TYPES.TRIANGULATE),
+            ModSortDesc(name="Boolean", type=TYPES.BOOLEAN)]
+        self.assertEqual(sorted_names(descs, sort_options(ignore_sort_str="")), ["Boolean", "Triangulate"])
+        self.assertEqual(sorted_names(descs, sort_options(ignore_sort_str=" ")), ["Boolean", "Triangulate"])
+
+
+    def test_disabled_and_sorted_stacks(self):
+        descs = [
+            ModSortDesc(name="Triangulate", type=TYPES.TRIANGULATE),
+            ModSortDesc(name="Boolean", type=TYPES.BOOLEAN)]
+        self.assertEqual(mod_sort.plan_mod_moves(descs, sort_options(sort_enabled=False)), [])
+        descs.reverse()
+        self.assertEqual(mod_sort.plan_mod_moves(descs, sort_options()), [])
+
+
+    def test_moves_are_minimal(self):
+        descs = [
+            ModSortDesc(name="Triangulate", type=TYPES.TRIANGULATE),
+            ModSortDesc(name="Boolean A", type=TYPES.BOOLEAN),
+            ModSortDesc(name="Boolean B", type=TYPES.BOOLEAN),
+            ModSortDesc(name="Boolean C", type=TYPES.BOOLEAN)]
+        moves = mod_sort.plan_mod_moves(descs, sort_options())
+        self.assertEqual(len(moves), 1)
+        self.assertEqual(apply_moves([desc.name for desc in descs], moves), ["Boolean A", "Boolean B", "Boolean C", "Triangulate"])
+
+
+if __name__ == '__main__':
+    unittest.main()
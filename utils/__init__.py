@@ -4,8 +4,10 @@
 
 from . import addon
 from . import algos
+from . import angle_field
 from . import bme
 from . import bmu
+from . import chains
 from . import collections
 from . import context
 from . import curve
@@ -22,12 +24,14 @@ from . import modal_labels
 from . import modal_ops
 from . import modal_status
 from . import modal_ux
+from . import mod_sort
 from . import modifiers
 from . import notifications
 from . import object
 from . import physics
 from . import poly_fade
 from . import ray
+from . import ref_graph
 from . import screen
 from . import vec_fade
 
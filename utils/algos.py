@@ -2,6 +2,7 @@
 """                  KenzoCG                  """
 ########################•########################
 
+from bisect import bisect_left
 from collections import deque
 
 
@@ -87,3 +88,52 @@ def bubble_sort(arr):
         for j in range(0, n - i - 1):
             if arr[j] > arr[j + 1]:
                 arr[j], arr[j + 1] = arr[j + 1], arr[j]
+
+
+def longest_increasing_subsequence(seq):
+    '''
+    RET : set of positions in seq forming one longest strictly increasing subsequence
+    '''
+    if not seq: return set()
+    tails = []
+    tail_positions = []
+    parents = [-1] * len(seq)
+    for position, value in enumerate(seq):
+        index = bisect_left(tails, value)
+        if index == len(tails):
+            tails.append(value)
+            tail_positions.append(position)
+        else:
+            tails[index] = value
+            tail_positions[index] = position
+        parents[position] = tail_positions[index - 1] if index > 0 else -1
+    positions = set()
+    position = tail_positions[-1]
+    while position >= 0:
+        positions.add(position)
+        position = parents[position]
+    return positions
+
+
+def reorder_moves(order):
+    '''
+    RET : [(from_index, to_index)] moves in (pop / insert) semantics
+    IFO : order[k] is the current index of the item that should end at index k
+    IFO : Items on the longest increasing subsequence stay put, every other item moves once
+    '''
+    stable = longest_increasing_subsequence(order)
+    current = list(range(len(order)))
+    moves = []
+    for position, item in enumerate(order):
+        if position in stable:
+            continue
+        from_index = current.index(item)
+        if position == 0:
+            to_index = 0
+        else:
+            prev_index = current.index(order[position - 1])
+            to_index = prev_index if from_index < prev_index else prev_index + 1
+        if from_index != to_index:
+            current.insert(to_index, current.pop(from_index))
+            moves.append((from_index, to_index))
+    return moves
@@ -0,0 +1,173 @@
+########################•########################
+"""                  KenzoCG                  """
+########################•########################
+
+import bpy
+import numpy as np
+from bpy.app.handlers import persistent
+from .mesh import edge_vert_array, loop_edge_array
+
+# KEY -> Mesh session uid || VAL -> AngleField
+ANGLE_FIELDS = dict()
+
+########################•########################
+"""                   FIELD                   """
+########################•########################
+
+def dihedral_angles(edge_count, loop_edges, loop_faces, face_normals):
+    '''
+    RET : (M,) float32 angle between the two face normals of each edge
+    IFO : NaN where the edge does not have exactly two faces
+    '''
+
+    angles = np.full(edge_count, np.nan, dtype=np.float32)
+    if not edge_count or not len(loop_edges):
+        return angles
+    counts = np.bincount(loop_edges, minlength=edge_count)
+    order = np.argsort(loop_edges, kind='stable')
+    offsets = np.cumsum(counts) - counts
+    manifold = np.flatnonzero(counts == 2)
+    if not manifold.size:
+        return angles
+    faces_a = loop_faces[order[offsets[manifold]]]
+    faces_b = loop_faces[order[offsets[manifold] + 1]]
+    dots = np.einsum('ij,ij->i', face_normals[faces_a], face_normals[faces_b])
+    angles[manifold] = np.arccos(np.clip(dots, -1.0, 1.0))
+    return angles
+
+
+class AngleField:
+    '''
+    IFO : Edge dihedral angles of one mesh state
+    IFO : Non manifold edges hold NaN so they fail every threshold
+    '''
+
+    __slots__ = ('key', 'edge_verts', 'face_counts', 'edge_angles', 'sorted_edges', 'sorted_angles')
+
+    def __init__(self, edge_verts, loop_edges, loop_faces, face_normals, key=None):
+        self.key = key
+        self.edge_verts = np.asarray(edge_verts, dtype=np.int32).reshape(-1, 2)
+        edge_count = len(self.edge_verts)
+        loop_edges = np.asarray(loop_edges, dtype=np.int32)
+        loop_faces = np.asarray(loop_faces, dtype=np.int32)
+        face_normals = np.asarray(face_normals, dtype=np.float32).reshape(-1, 3)
+        # Edges
+        self.face_counts = np.bincount(loop_edges, minlength=edge_count)
+        self.edge_angles = dihedral_angles(edge_count, loop_edges, loop_faces, face_normals)
+        # Thresholds
+        manifold = np.flatnonzero(~np.isnan(self.edge_angles))
+        order = np.argsort(self.edge_angles[manifold], kind='stable')
+        self.sorted_edges = manifold[order].astype(np.int32)
+        self.sorted_angles = self.edge_angles[self.sorted_edges]
+
+
+    @property
+    def edge_count(self):
+        return len(self.edge_verts)
+
+
+    def edges_at_most(self, angle):
+        '''
+        RET : Edge indices with a face angle <= angle
+        '''
+
+        return self.sorted_edges[:np.searchsorted(self.sorted_angles, angle, side='right')]
+
+
+    def edges_at_least(self, angle):
+        '''
+        RET : Edge indices with a face angle >= angle
+        '''
+
+        return self.sorted_edges[np.searchsorted(self.sorted_angles, angle, side='left'):]
+
+
+    def mask_at_most(self, angle):
+        mask = np.zeros(self.edge_count, dtype=bool)
+        mask[self.edges_at_most(angle)] = True
+        return mask
+
+
+    def mask_at_least(self, angle):
+        mask = np.zeros(self.edge_count, dtype=bool)
+        mask[self.edges_at_least(angle)] = True
+        return mask
+
+########################•########################
+"""                  BUILDERS                 """
+########################•########################
+
+def mesh_topology_key(mesh):
+    return (len(mesh.vertices), len(mesh.edges), len(mesh.loops), len(mesh.polygons))
+
+
+def field_from_mesh(mesh):
+    '''
+    IFO : Edit mode meshes need obj.update_from_editmode first
+    '''
+
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get('loop_total', loop_totals)
+    loop_faces = np.repeat(np.arange(len(mesh.polygons), dtype=np.int32), loop_totals)
+    face_normals = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+    mesh.polygon_normals.foreach_get('vector', face_normals)
+    return AngleField(edge_vert_array(mesh), loop_edge_array(mesh), loop_faces, face_normals, key=mesh_topology_key(mesh))
+
+
+def field_from_bmesh(bm):
+    '''
+    IFO : Updates the bmesh indices || Field indices follow them until the bmesh changes
+    '''
+
+    bm.verts.index_update()
+    bm.edges.index_update()
+    bm.faces.index_update()
+    edge_verts = [vert.index for edge in bm.edges for vert in edge.verts]
+    loops = [(loop.edge.index, face.index) for face in bm.faces for loop in face.loops]
+    loops = np.array(loops, dtype=np.int32).reshape(-1, 2)
+    face_normals = [co for face in bm.faces for co in face.normal]
+    return AngleField(edge_verts, loops[:, 0], loops[:, 1], face_normals, key=bmesh_topology_key(bm))
+
+
+def bmesh_topology_key(bm):
+    return (len(bm.verts), len(bm.edges), len(bm.faces))
+
+########################•########################
+"""                   CACHE                   """
+########################•########################
+
+def angle_field(mesh):
+    '''
+    RET : Cached AngleField of the mesh
+    IFO : Rebuilt after a geometry update or a topology count change
+    '''
+
+    key = mesh.session_uid
+    field = ANGLE_FIELDS.get(key)
+    if field is not None and field.key == mesh_topology_key(mesh):
+        return field
+    field = field_from_mesh(mesh)
+    ANGLE_FIELDS[key] = field
+    return field
+
+########################•########################
+"""                  HANDLES                  """
+########################•########################
+
+@persistent
+def tag_angle_fields(scene, depsgraph):
+    if not ANGLE_FIELDS:
+        return
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+        data = update.id
+        if isinstance(data, bpy.types.Object) and isinstance(data.data, bpy.types.Mesh):
+            ANGLE_FIELDS.pop(data.data.session_uid, None)
+        elif isinstance(data, bpy.types.Mesh):
+            ANGLE_FIELDS.pop(data.session_uid, None)
+
+
+@persistent
+def reset_angle_fields(null=''):
+    ANGLE_FIELDS.clear()
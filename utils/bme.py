@@ -18,9 +18,10 @@ from mathutils.kdtree import KDTree
 from mathutils.bvhtree import BVHTree
 from . import math3
 from .addon import user_prefs
-from .bmu import ensure_bmesh_type_tables_normals_selections, ensure_bmesh_normals_selections
+from .bmu import REFRESH, refresh_bmesh
 from .context import object_mode_toggle_reset, object_mode_toggle_start, object_mode_toggle_end
 from .graphics import COLORS
+from .mesh import track_backup_mesh, touch_backup_mesh, remove_backup_mesh
 from .vec_fade import init as init_vec_fade
 
 ########################•########################
@@ -166,8 +167,8 @@ class Ray:
             eval_obj.to_mesh_clear()
         else:
             self.BM.from_mesh(obj.data)
-        # TREES
-        if ensure_bmesh_type_tables_normals_selections(self.BM):
+        # TREES (Normals and selections are not used by the trees)
+        if refresh_bmesh(self.BM, REFRESH.TABLES | REFRESH.INDICES):
             self.BM.transform(self.mat_ws)
             self.BOUNDS_BVH = math3.bvh_tree_from_bmesh_bounds(self.BM, tolerance=0.25)
             self.FACE_BVH = BVHTree.FromBMesh(self.BM, epsilon=0.0)
@@ -399,7 +400,7 @@ class BmeshEditor:
         self.ogmesh = obj.data.copy()
         self.ogmesh_uid = self.ogmesh.session_uid
         self.ogmesh.calc_loop_triangles()
-        self.ogmesh.ps.is_backup = True
+        track_backup_mesh(self.ogmesh)
         # MESH BACKUPS
         self.backups = []
         # BMESH
@@ -428,28 +429,31 @@ class BmeshEditor:
             self.BM.free()
             self.BM = None
             gc.collect()
+        refresh = REFRESH.ALL
         if self.obj.data.is_editmode:
             self.BM = bmesh.from_edit_mesh(self.obj.data)
         else:
             self.BM = bmesh.new(use_operators=True)
             self.BM.from_mesh(self.obj.data, face_normals=True, vertex_normals=True, use_shape_key=False, shape_key_index=0)
-        if ensure_bmesh_type_tables_normals_selections(self.BM): return True
+            refresh &= ~REFRESH.NORMALS
+        if refresh_bmesh(self.BM, refresh): return True
         return False
 
 
     def restore(self):
         if not self.validator(): return False
         backup = self.backups[-1] if self.backups else self.ogmesh
+        touch_backup_mesh(backup)
         bmesh.ops.delete(self.BM, geom=self.BM.verts, context='VERTS')
         self.BM.from_mesh(backup, face_normals=True, vertex_normals=True, use_shape_key=False, shape_key_index=0)
-        return ensure_bmesh_type_tables_normals_selections(self.BM)
+        return refresh_bmesh(self.BM, REFRESH.TABLES | REFRESH.INDICES | REFRESH.SELECTION)
 
 
-    def update(self):
+    def update(self, refresh=REFRESH.NORMALS | REFRESH.SELECTION, destructive=True):
         if not self.validator(): return False
-        ensure_bmesh_normals_selections(self.BM)
+        refresh_bmesh(self.BM, refresh)
         if self.obj.data.is_editmode:
-            bmesh.update_edit_mesh(self.obj.data, loop_triangles=True, destructive=True)
+            bmesh.update_edit_mesh(self.obj.data, loop_triangles=True, destructive=destructive)
         elif not self.BM.is_wrapped:
             self.BM.to_mesh(self.obj.data)
             self.obj.data.calc_loop_triangles()
@@ -462,26 +466,26 @@ class BmeshEditor:
             self.obj.update_from_editmode()
         backup = self.obj.data.copy()
         backup.calc_loop_triangles()
-        backup.ps.is_backup = True
         self.backups.append(backup)
         # Undo Limit
         if len(self.backups) > self.undo_limit:
-            backup = self.backups[0]
-            self.backups.remove(backup)
-            if isinstance(backup, bpy.types.Mesh):
-                if backup.session_uid != self.uid and backup.session_uid != self.ogmesh_uid:
-                    if backup.name in bpy.data.meshes:
-                        bpy.data.meshes.remove(backup, do_unlink=True, do_id_user=True, do_ui_user=True)
+            self.drop_backup(self.backups[0])
+        # Vertex Budget
+        track_backup_mesh(backup, owner=self)
         return True
 
 
+    def drop_backup(self, backup):
+        if backup in self.backups:
+            self.backups.remove(backup)
+        if isinstance(backup, bpy.types.Mesh):
+            if backup.session_uid != self.uid and backup.session_uid != self.ogmesh_uid:
+                remove_backup_mesh(backup)
+
+
     def undo(self):
         if self.backups:
-            backup = self.backups.pop()
-            if isinstance(backup, bpy.types.Mesh):
-                if backup.session_uid != self.uid and backup.session_uid != self.ogmesh_uid:
-                    if backup.name in bpy.data.meshes:
-                        bpy.data.meshes.remove(backup, do_unlink=True, do_id_user=True, do_ui_user=True)
+            self.drop_backup(self.backups[-1])
         if self.restore():
             if self.update():
                 return True
@@ -490,11 +494,8 @@ class BmeshEditor:
 
     def close(self, revert=False):
         # Remove Backups
-        for backup in self.backups:
-            if isinstance(backup, bpy.types.Mesh):
-                if backup.session_uid != self.uid and backup.session_uid != self.ogmesh_uid:
-                    if backup.name in bpy.data.meshes:
-                        bpy.data.meshes.remove(backup)
+        for backup in self.backups[:]:
+            self.drop_backup(backup)
         self.backups = []
         # Revert to Original Mesh
         if revert: self.restore()
@@ -513,8 +514,7 @@ class BmeshEditor:
         if isinstance(self.ogmesh, bpy.types.Mesh):
             try:
                 if self.ogmesh.session_uid != self.uid:
-                    if self.ogmesh.name in bpy.data.meshes:
-                        bpy.data.meshes.remove(self.ogmesh)
+                    remove_backup_mesh(self.ogmesh)
             except: pass
         self.ogmesh = None
         # Delete
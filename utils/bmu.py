@@ -5,17 +5,22 @@
 import bpy
 import bmesh
 import math
+import enum
+import numpy as np
 from collections import deque
 from math import cos, sin, radians
-from mathutils import geometry, Vector, Matrix, Euler, Quaternion
+from mathutils import Vector, Matrix, Euler, Quaternion
+from mathutils.bvhtree import BVHTree
 from mathutils.geometry import distance_point_to_plane, intersect_line_plane, intersect_point_line
 from . import math3
-from .addon import user_prefs
+from .angle_field import angle_field, field_from_bmesh
+from .chains import EdgeChains, vert_adjacency, connected_edge_order, chain_verts, cumulative_lengths, slice_by_distance
 from .context import set_component_selection, object_mode_toggle_start, object_mode_toggle_end
-from .curve import create as create_curve
+from .curve import create as create_curve, fill_bezier_spline
 from .graphics import COLORS
-from .object import parent_object
-from .poly_fade import init as init_poly_fade
+from .mesh import attribute_array, set_attribute_array, edge_seam_array, set_edge_seam_array, select_arrays, edge_vert_array, edge_face_counts, verts_on_axis_planes, verts_under_axis_planes
+from .object import parent_object, mesh_coords
+from .poly_fade import init as init_poly_fade, bmesh_edge_arrays
 from .vec_fade import init as init_vec_fade
 
 ########################•########################
@@ -23,6 +28,7 @@ from .vec_fade import init as init_vec_fade
 ########################•########################
 
 EPSILON = 0.0001
+RAY_OFFSET = 0.000001
 DEG_01 = radians(1)
 DEG_15 = radians(15)
 DEG_30 = radians(30)
@@ -35,32 +41,147 @@ VEC3_ZERO = Vector((0,0,0))
 """                   MANAGE                  """
 ########################•########################
 
-def open_bmesh(context, obj):
+class REFRESH(enum.Flag):
+    NONE = 0
+    # Lookup tables for index access
+    TABLES = enum.auto()
+    # Element indices
+    INDICES = enum.auto()
+    # Face and vert normals
+    NORMALS = enum.auto()
+    # Select mode, select history, and flush
+    SELECTION = enum.auto()
+    ALL = TABLES | INDICES | NORMALS | SELECTION
+
+
+class MUTATION(enum.Flag):
+    NONE = 0
+    # Vert positions
+    COORDS = enum.auto()
+    # Elements added or removed
+    TOPOLOGY = enum.auto()
+    # Select and hide flags
+    SELECTION = enum.auto()
+    # Layers, seams, sharps and other element data
+    ATTRIBUTES = enum.auto()
+    ALL = COORDS | TOPOLOGY | SELECTION | ATTRIBUTES
+
+
+def open_bmesh(context, obj, refresh=REFRESH.ALL, read_only=False, session=None):
+    '''
+    IFO : read_only -> Object mode meshes are loaded without operator support
+    IFO : Pass the same read_only to close_bmesh
+    IFO : session -> BMeshSession that owns the bmesh
+    '''
+    if session is not None:
+        return session.open(obj, refresh=refresh)
     if isinstance(obj, bpy.types.Object) and isinstance(obj.data, bpy.types.Mesh):
         bm = None
         if obj.data.is_editmode:
             bm = bmesh.from_edit_mesh(obj.data)
         else:
-            bm = bmesh.new(use_operators=True)
+            bm = bmesh.new(use_operators=not read_only)
             bm.from_mesh(obj.data, face_normals=True, vertex_normals=True, use_shape_key=False, shape_key_index=0)
-        if ensure_bmesh_type_tables_normals_selections(bm):
+            # Normals are loaded from the mesh
+            refresh &= ~REFRESH.NORMALS
+        if refresh_bmesh(bm, refresh):
             return bm
     return None
 
 
-def close_bmesh(context, obj, bm):
-    if isinstance(obj, bpy.types.Object) and isinstance(obj.data, bpy.types.Mesh):
-        if ensure_bmesh_normals_selections(bm):
+def close_bmesh(context, obj, bm, refresh=REFRESH.NORMALS | REFRESH.SELECTION, read_only=False, destructive=True, loop_triangles=True, session=None, mutated=MUTATION.ALL):
+    '''
+    IFO : read_only -> Skips writing back to the mesh
+    IFO : destructive -> Set False when the topology did not change
+    IFO : session -> Only records mutated || The session flushes on exit
+    '''
+    if session is not None:
+        if not read_only:
+            session.mark(obj, mutated if destructive else mutated & ~MUTATION.TOPOLOGY)
+        return
+    if not read_only and isinstance(obj, bpy.types.Object) and isinstance(obj.data, bpy.types.Mesh):
+        if refresh_bmesh(bm, refresh):
             if bm.is_wrapped and obj.data.is_editmode:
-                bmesh.update_edit_mesh(obj.data, loop_triangles=True, destructive=True)
+                bmesh.update_edit_mesh(obj.data, loop_triangles=loop_triangles, destructive=destructive)
             elif not bm.is_wrapped and not obj.data.is_editmode:
                 bm.to_mesh(obj.data)
-                obj.data.calc_loop_triangles()
+                if loop_triangles:
+                    obj.data.calc_loop_triangles()
     if isinstance(bm, bmesh.types.BMesh):
         bm.free()
     bm = None
 
 
+class BMeshSession:
+    '''
+    IFO : Shares one open bmesh per mesh across utils.bmu calls and writes back once on exit
+    IFO : Objects that share a mesh share its bmesh
+    IFO : with BMeshSession(context) as session: select_boundary(context, obj, session=session)
+    IFO : Object mode marks skip their attribute array fast paths in a session || Only worth it for edit mode chains
+    '''
+
+    def __init__(self, context):
+        self.context = context
+        # KEY -> Mesh session uid || VAL -> [Object that opened it, BMesh, MUTATION, REFRESH still valid]
+        self.entries = dict()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+    def open(self, obj, refresh=REFRESH.ALL):
+        entry = self.entries.get(obj.data.session_uid)
+        if entry is None:
+            bm = open_bmesh(self.context, obj, refresh=refresh)
+            if not bm: return None
+            valid = refresh if obj.data.is_editmode else refresh | REFRESH.NORMALS
+            self.entries[obj.data.session_uid] = [obj, bm, MUTATION.NONE, valid]
+            return bm
+        bm = entry[1]
+        if not bmesh_instance_valid(bm):
+            return None
+        # Only redo what earlier mutations made stale
+        pending = refresh & ~entry[3]
+        refresh_bmesh(bm, pending)
+        entry[3] |= pending
+        return bm
+
+
+    def mark(self, obj, mutated=MUTATION.ALL):
+        entry = self.entries.get(obj.data.session_uid)
+        if entry is None:
+            return
+        entry[2] |= mutated
+        if MUTATION.TOPOLOGY in mutated:
+            entry[3] = REFRESH.NONE
+        if MUTATION.COORDS in mutated:
+            entry[3] &= ~REFRESH.NORMALS
+        if MUTATION.SELECTION in mutated:
+            entry[3] &= ~REFRESH.SELECTION
+
+
+    def close(self):
+        for obj, bm, mutated, valid in self.entries.values():
+            geometry = bool(mutated & (MUTATION.COORDS | MUTATION.TOPOLOGY))
+            refresh = REFRESH.NONE
+            if geometry:
+                refresh |= REFRESH.NORMALS
+            if mutated & (MUTATION.SELECTION | MUTATION.TOPOLOGY):
+                refresh |= REFRESH.SELECTION
+            close_bmesh(self.context, obj, bm,
+                refresh=refresh & ~valid,
+                read_only=mutated == MUTATION.NONE,
+                destructive=MUTATION.TOPOLOGY in mutated,
+                loop_triangles=geometry)
+        self.entries.clear()
+
+
 def close_bmesh_no_update(bm):
     if isinstance(bm, bmesh.types.BMesh):
         bm.free()
@@ -68,29 +189,24 @@ def close_bmesh_no_update(bm):
     del bm
 
 
-def ensure_bmesh_type_tables_normals_selections(bm):
-    if isinstance(bm, bmesh.types.BMesh) and bm.is_valid:
-        tool_sel_mode = bpy.context.tool_settings.mesh_select_mode
-        bm.select_mode = {mode for mode, sel in zip(['VERT', 'EDGE', 'FACE'], tool_sel_mode) if sel}
-        bm.verts.ensure_lookup_table()
-        bm.edges.ensure_lookup_table()
-        bm.faces.ensure_lookup_table()
-        bm.verts.index_update()
-        bm.edges.index_update()
-        bm.faces.index_update()
-        bm.select_history.validate()
-        bm.select_flush_mode()
-        bm.normal_update()
-        return True
-    return False
-
-
-def ensure_bmesh_normals_selections(bm):
+def refresh_bmesh(bm, refresh=REFRESH.ALL):
     if isinstance(bm, bmesh.types.BMesh) and bm.is_valid:
-        tool_sel_mode = bpy.context.tool_settings.mesh_select_mode
-        bm.select_mode = {mode for mode, sel in zip(['VERT', 'EDGE', 'FACE'], tool_sel_mode) if sel}
-        bm.select_flush_mode()
-        bm.normal_update()
+        if REFRESH.SELECTION in refresh:
+            tool_sel_mode = bpy.context.tool_settings.mesh_select_mode
+            bm.select_mode = {mode for mode, sel in zip(['VERT', 'EDGE', 'FACE'], tool_sel_mode) if sel}
+        if REFRESH.TABLES in refresh:
+            bm.verts.ensure_lookup_table()
+            bm.edges.ensure_lookup_table()
+            bm.faces.ensure_lookup_table()
+        if REFRESH.INDICES in refresh:
+            bm.verts.index_update()
+            bm.edges.index_update()
+            bm.faces.index_update()
+        if REFRESH.SELECTION in refresh:
+            bm.select_history.validate()
+            bm.select_flush_mode()
+        if REFRESH.NORMALS in refresh:
+            bm.normal_update()
         return True
     return False
 
@@ -180,15 +296,14 @@ def query_any_sel_faces(objs=[]):
     return False
 
 
-def query_vert_indices_from_boundary_or_wire(context, obj):
+def query_vert_indices_from_boundary_or_wire(context, obj, session=None):
     '''
     RET : LIST -> of Vert Indices if Vert is Boundary or Wire and not Hidden
     '''
-    bm = open_bmesh(context, obj)
+    bm = open_bmesh(context, obj, refresh=REFRESH.INDICES, read_only=True, session=session)
     if not bm: return []
     indices = [vert.index for vert in bm.verts if vert.is_valid and (not vert.hide) and (vert.is_boundary or vert.is_wire)]
-    bm.free()
-    bm = None
+    close_bmesh(context, obj, bm, read_only=True, session=session)
     del bm
     return indices
 
@@ -214,7 +329,9 @@ def query_any_polygons_shaded_smooth(obj):
     if isinstance(obj, bpy.types.Object) and isinstance(obj.data, bpy.types.Mesh):
         if obj.data.is_editmode:
             obj.update_from_editmode()
-        return any([p.use_smooth for p in obj.data.polygons])
+        values = np.empty(len(obj.data.polygons), dtype=bool)
+        obj.data.polygons.foreach_get('use_smooth', values)
+        return bool(np.any(values))
     return False
 
 ########################•########################
@@ -313,11 +430,11 @@ def layer_from_bmesh(bm, elem_type='', data_type='', layer_name=''):
                 return bm.verts.layers.float.new(layer_name)
 
 
-def layer_deform_vert_map(context, obj, remove_empty=False):
+def layer_deform_vert_map(context, obj, remove_empty=False, session=None):
     '''
     RET : {Vert Index : {V-Group Name : Weight}}
     '''
-    bm = open_bmesh(context, obj)
+    bm = open_bmesh(context, obj, refresh=REFRESH.INDICES, read_only=True, session=session)
     if not bm: return
     obj_vgroups = obj.vertex_groups
     vgroup_weights = {v.index: {} for v in bm.verts}
@@ -332,7 +449,7 @@ def layer_deform_vert_map(context, obj, remove_empty=False):
                 vgroup_weights[vert.index][vgroup_name] += weight
     if remove_empty:
         vgroup_weights = {k: v for k, v in vgroup_weights.items() if v}
-    close_bmesh(context, obj, bm)
+    close_bmesh(context, obj, bm, read_only=True, session=session)
     del bm
     return vgroup_weights
 
@@ -357,17 +474,15 @@ def verts_in_planes(bm, plane_co=Vector((0,0,0)), plane_normals=[], only_center_
     '''
     Ret : Vertices along the plane or if not only center line, return everything on or below the plane
     '''
-    verts = set()
-    distance_point_to_plane = geometry.distance_point_to_plane
-    for vert in bm.verts:
-        for plane_no in plane_normals:
-            if only_center_line:
-                if abs(distance_point_to_plane(vert.co, plane_co, plane_no)) <= epsilon:
-                    verts.add(vert)
-            else:
-                if distance_point_to_plane(vert.co, plane_co, plane_no) <= epsilon:
-                    verts.add(vert)
-    return list(verts)
+    if not plane_normals:
+        return []
+    verts = list(bm.verts)
+    normals = np.array([plane_no.normalized() for plane_no in plane_normals], dtype=np.float64).reshape(-1, 3)
+    distances = (vert_coord_array(verts) - np.array(plane_co, dtype=np.float64)) @ normals.T
+    if only_center_line:
+        distances = np.abs(distances)
+    mask = (distances <= epsilon).any(axis=1)
+    return [vert for vert, keep in zip(verts, mask.tolist()) if keep]
 
 
 def geom_in_plane(bm, plane_co=Vector((0,0,0)), plane_no=Vector((1,0,0)), only_center_line=True, epsilon=EPSILON):
@@ -395,19 +510,37 @@ def project_verts_to_plane(plane_co=Vector((0,0,0)), plane_no=Vector((0,0,1)), v
         if point:
             vert.co = point
 
+
+def vert_coord_array(verts):
+    return np.array([vert.co for vert in verts], dtype=np.float64).reshape(-1, 3)
+
+
+def set_vert_coords(verts, coords, mask=None):
+    '''
+    IFO : Single pass write back || mask -> (N,) bool of the verts to write
+    '''
+
+    if mask is not None:
+        verts = [vert for vert, keep in zip(verts, mask.tolist()) if keep]
+        coords = coords[mask]
+    for vert, co in zip(verts, coords.tolist()):
+        vert.co = co
+
 ########################•########################
 """                   MARKS                   """
 ########################•########################
 
-def assign_edge_marks(context, obj, recalc=True, recalc_angle=DEG_30, recalc_append=True, mark_boundary=True, omit_x_axis=True, omit_y_axis=False, omit_z_axis=False, seam=True, sharp=True, e_crease=0, b_weight=0, show_poly_fade=False):
-    bm = open_bmesh(context, obj)
+def assign_edge_marks(context, obj, recalc=True, recalc_angle=DEG_30, recalc_append=True, mark_boundary=True, omit_x_axis=True, omit_y_axis=False, omit_z_axis=False, seam=True, sharp=True, e_crease=0, b_weight=0, show_poly_fade=False, session=None):
+    if session is None and mesh_in_object_mode(obj):
+        assign_mesh_edge_marks(obj, recalc=recalc, recalc_angle=recalc_angle, recalc_append=recalc_append, mark_boundary=mark_boundary, omit_x_axis=omit_x_axis, omit_y_axis=omit_y_axis, omit_z_axis=omit_z_axis, seam=seam, sharp=sharp, e_crease=e_crease, b_weight=b_weight, show_poly_fade=show_poly_fade)
+        return
+    bm = open_bmesh(context, obj, refresh=REFRESH.NORMALS if recalc else REFRESH.NONE, session=session)
     if not bm: return
     smooth = not sharp
     bevel_layer = layer_from_bmesh(bm, elem_type='EDGE', data_type='FLOAT', layer_name='bevel_weight_edge')
     crease_edge_layer = layer_from_bmesh(bm, elem_type='EDGE', data_type='FLOAT', layer_name='crease_edge')
     # Poly Fade
-    poly_fade_lines = []
-    mat_ws = obj.matrix_world
+    poly_fade_edges = []
     # Auto Assign
     if recalc:
         for edge in bm.edges:
@@ -429,13 +562,7 @@ def assign_edge_marks(context, obj, recalc=True, recalc_angle=DEG_30, recalc_app
                 edge[crease_edge_layer] = e_crease
                 # Poly Fade
                 if show_poly_fade:
-                    vert_1, vert_2 = edge.verts
-                    vert_1_co = vert_1.co.copy()
-                    vert_2_co = vert_2.co.copy()
-                    if vert_1.is_valid:
-                        poly_fade_lines.append(mat_ws @ vert_1_co)
-                    if vert_2.is_valid:
-                        poly_fade_lines.append(mat_ws @ vert_2_co)
+                    poly_fade_edges.append(edge)
             else:
                 if not recalc_append:
                     edge.seam = False
@@ -455,22 +582,19 @@ def assign_edge_marks(context, obj, recalc=True, recalc_angle=DEG_30, recalc_app
                 edge[crease_edge_layer] = e_crease
                 # Poly Fade
                 if show_poly_fade:
-                    vert_1, vert_2 = edge.verts
-                    vert_1_co = vert_1.co.copy()
-                    vert_2_co = vert_2.co.copy()
-                    if vert_1.is_valid:
-                        poly_fade_lines.append(mat_ws @ vert_1_co)
-                    if vert_2.is_valid:
-                        poly_fade_lines.append(mat_ws @ vert_2_co)
+                    poly_fade_edges.append(edge)
     # Poly Fade
-    if show_poly_fade and poly_fade_lines:
-        init_poly_fade(obj, lines=poly_fade_lines)
-    close_bmesh(context, obj, bm)
+    if show_poly_fade and poly_fade_edges:
+        init_poly_fade(obj, coords=bmesh_edge_arrays(poly_fade_edges))
+    close_bmesh(context, obj, bm, refresh=REFRESH.NONE, session=session, mutated=MUTATION.ATTRIBUTES)
     del bm
 
 
-def assign_vert_marks(context, obj, v_crease=0, mark_boundary=True, omit_x_axis=True, omit_y_axis=False, omit_z_axis=False):
-    bm = open_bmesh(context, obj)
+def assign_vert_marks(context, obj, v_crease=0, mark_boundary=True, omit_x_axis=True, omit_y_axis=False, omit_z_axis=False, session=None):
+    if session is None and mesh_in_object_mode(obj):
+        assign_mesh_vert_marks(obj, v_crease=v_crease, mark_boundary=mark_boundary, omit_x_axis=omit_x_axis, omit_y_axis=omit_y_axis, omit_z_axis=omit_z_axis)
+        return
+    bm = open_bmesh(context, obj, refresh=REFRESH.NONE, session=session)
     if not bm: return
     vert_crease_layer = layer_from_bmesh(bm, elem_type='VERT', data_type='FLOAT', layer_name='crease_vert')
     for vert in bm.verts:
@@ -485,12 +609,15 @@ def assign_vert_marks(context, obj, v_crease=0, mark_boundary=True, omit_x_axis=
             mark_vert = False
         if mark_vert:
             vert[vert_crease_layer] = v_crease
-    close_bmesh(context, obj, bm)
+    close_bmesh(context, obj, bm, refresh=REFRESH.NONE, session=session, mutated=MUTATION.ATTRIBUTES)
     del bm
 
 
-def remove_edge_marks(context, obj, selected_only=True, seam=True, sharp=True, e_crease=True, b_weight=True):
-    bm = open_bmesh(context, obj)
+def remove_edge_marks(context, obj, selected_only=True, seam=True, sharp=True, e_crease=True, b_weight=True, session=None):
+    if session is None and mesh_in_object_mode(obj):
+        remove_mesh_edge_marks(obj, selected_only=selected_only, seam=seam, sharp=sharp, e_crease=e_crease, b_weight=b_weight)
+        return
+    bm = open_bmesh(context, obj, refresh=REFRESH.NONE, session=session)
     if not bm: return
 
     bevel_layer = layer_from_bmesh(bm, elem_type='EDGE', data_type='FLOAT', layer_name='bevel_weight_edge')
@@ -504,9 +631,9 @@ def remove_edge_marks(context, obj, selected_only=True, seam=True, sharp=True, e
                 if sharp:
                     edge.smooth = True
                 if e_crease:
-                    edge[bevel_layer] = 0.0
-                if b_weight:
                     edge[crease_edge_layer] = 0.0
+                if b_weight:
+                    edge[bevel_layer] = 0.0
     # Remove All
     else:
         for edge in bm.edges:
@@ -515,15 +642,18 @@ def remove_edge_marks(context, obj, selected_only=True, seam=True, sharp=True, e
             if sharp:
                 edge.smooth = True
             if e_crease:
-                edge[bevel_layer] = 0.0
-            if b_weight:
                 edge[crease_edge_layer] = 0.0
-    close_bmesh(context, obj, bm)
+            if b_weight:
+                edge[bevel_layer] = 0.0
+    close_bmesh(context, obj, bm, refresh=REFRESH.NONE, session=session, mutated=MUTATION.ATTRIBUTES)
     del bm
 
 
-def remove_vert_marks(context, obj, remove_all=True):
-    bm = open_bmesh(context, obj)
+def remove_vert_marks(context, obj, remove_all=True, session=None):
+    if session is None and mesh_in_object_mode(obj):
+        remove_mesh_vert_marks(obj, remove_all=remove_all)
+        return
+    bm = open_bmesh(context, obj, refresh=REFRESH.NONE, session=session)
     if not bm: return
 
     vert_crease_layer = layer_from_bmesh(bm, elem_type='VERT', data_type='FLOAT', layer_name='crease_vert')
@@ -536,15 +666,144 @@ def remove_vert_marks(context, obj, remove_all=True):
         for vert in bm.verts:
             if vert.select == False: continue
             vert[vert_crease_layer] = 0.0
-    close_bmesh(context, obj, bm)
+    close_bmesh(context, obj, bm, refresh=REFRESH.NONE, session=session, mutated=MUTATION.ATTRIBUTES)
     del bm
 
+
+def mesh_in_object_mode(obj):
+    return isinstance(obj, bpy.types.Object) and isinstance(obj.data, bpy.types.Mesh) and not obj.data.is_editmode
+
+########################•########################
+"""               MARKS || ARRAYS             """
+########################•########################
+
+def assign_mesh_edge_marks(obj, recalc=True, recalc_angle=DEG_30, recalc_append=True, mark_boundary=True, omit_x_axis=True, omit_y_axis=False, omit_z_axis=False, seam=True, sharp=True, e_crease=0, b_weight=0, show_poly_fade=False):
+    '''
+    IFO : Object mode version of assign_edge_marks working on the mesh attributes
+    '''
+
+    mesh = obj.data
+    edge_verts = edge_vert_array(mesh)
+    # Auto Assign
+    if recalc:
+        field = angle_field(mesh)
+        marked = field.mask_at_least(recalc_angle)
+        if mark_boundary:
+            marked |= field.face_counts == 1
+        if omit_x_axis or omit_y_axis or omit_z_axis:
+            on_planes = verts_on_axis_planes(mesh_coords(mesh).reshape(-1, 3), x=omit_x_axis, y=omit_y_axis, z=omit_z_axis, epsilon=EPSILON)
+            marked &= ~np.any(on_planes[edge_verts[:, 0]] & on_planes[edge_verts[:, 1]], axis=1)
+        cleared = None if recalc_append else ~marked
+    # Manual Assign
+    else:
+        marked = select_arrays(mesh)[1]
+        cleared = None
+    # Values
+    seams = edge_seam_array(mesh)
+    sharps = attribute_array(mesh, 'sharp_edge', domain='EDGE', data_type='BOOLEAN')
+    bevels = attribute_array(mesh, 'bevel_weight_edge', domain='EDGE', data_type='FLOAT')
+    creases = attribute_array(mesh, 'crease_edge', domain='EDGE', data_type='FLOAT')
+    seams[marked] = seam
+    sharps[marked] = sharp
+    bevels[marked] = b_weight
+    creases[marked] = e_crease
+    if cleared is not None:
+        seams[cleared] = False
+        sharps[cleared] = False
+        bevels[cleared] = 0
+        creases[cleared] = 0
+    # Write
+    changed = set_edge_seam_array(mesh, seams)
+    changed |= set_attribute_array(mesh, 'sharp_edge', sharps, domain='EDGE', data_type='BOOLEAN')
+    changed |= set_attribute_array(mesh, 'bevel_weight_edge', bevels, domain='EDGE', data_type='FLOAT')
+    changed |= set_attribute_array(mesh, 'crease_edge', creases, domain='EDGE', data_type='FLOAT')
+    if changed:
+        mesh.update()
+    # Poly Fade
+    if show_poly_fade and np.any(marked):
+        init_poly_fade(obj, coords=mesh_coords(mesh).reshape(-1, 3), edges=edge_verts[marked])
+
+
+def assign_mesh_vert_marks(obj, v_crease=0, mark_boundary=True, omit_x_axis=True, omit_y_axis=False, omit_z_axis=False):
+    mesh = obj.data
+    marked = select_arrays(mesh)[0]
+    if mark_boundary:
+        boundary = edge_vert_array(mesh)[edge_face_counts(mesh) == 1]
+        marked[boundary.ravel()] = True
+    if omit_x_axis or omit_y_axis or omit_z_axis:
+        on_planes = verts_on_axis_planes(mesh_coords(mesh).reshape(-1, 3), x=omit_x_axis, y=omit_y_axis, z=omit_z_axis, epsilon=EPSILON)
+        marked &= ~np.any(on_planes, axis=1)
+    creases = attribute_array(mesh, 'crease_vert', domain='POINT', data_type='FLOAT')
+    creases[marked] = v_crease
+    if set_attribute_array(mesh, 'crease_vert', creases, domain='POINT', data_type='FLOAT'):
+        mesh.update()
+
+
+def remove_mesh_edge_marks(obj, selected_only=True, seam=True, sharp=True, e_crease=True, b_weight=True):
+    mesh = obj.data
+    cleared = select_arrays(mesh)[1] if selected_only else np.ones(len(mesh.edges), dtype=bool)
+    changed = False
+    if seam:
+        seams = edge_seam_array(mesh)
+        seams[cleared] = False
+        changed |= set_edge_seam_array(mesh, seams)
+    for enabled, name, data_type in ((sharp, 'sharp_edge', 'BOOLEAN'), (e_crease, 'crease_edge', 'FLOAT'), (b_weight, 'bevel_weight_edge', 'FLOAT')):
+        if enabled:
+            values = attribute_array(mesh, name, domain='EDGE', data_type=data_type)
+            values[cleared] = 0
+            changed |= set_attribute_array(mesh, name, values, domain='EDGE', data_type=data_type)
+    if changed:
+        mesh.update()
+
+
+def remove_mesh_vert_marks(obj, remove_all=True):
+    mesh = obj.data
+    creases = attribute_array(mesh, 'crease_vert', domain='POINT', data_type='FLOAT')
+    if remove_all:
+        creases.fill(0)
+    else:
+        creases[select_arrays(mesh)[0]] = 0
+    if set_attribute_array(mesh, 'crease_vert', creases, domain='POINT', data_type='FLOAT'):
+        mesh.update()
+
+
+def select_mesh_marks(obj, sharp_edges=True, seamed_edges=True, bevel_edges=True, crease_edges=True, creased_verts=True):
+    mesh = obj.data
+    vert_sel, edge_sel = select_arrays(mesh)
+    if sharp_edges:
+        edge_sel |= attribute_array(mesh, 'sharp_edge', domain='EDGE', data_type='BOOLEAN')
+    if seamed_edges:
+        edge_sel |= edge_seam_array(mesh)
+    if bevel_edges:
+        edge_sel |= attribute_array(mesh, 'bevel_weight_edge', domain='EDGE', data_type='FLOAT') > 0
+    if crease_edges:
+        edge_sel |= attribute_array(mesh, 'crease_edge', domain='EDGE', data_type='FLOAT') > 0
+    if creased_verts:
+        vert_sel |= attribute_array(mesh, 'crease_vert', domain='POINT', data_type='FLOAT') > 0
+    # Flush
+    vert_sel[edge_vert_array(mesh)[edge_sel].ravel()] = True
+    mesh.vertices.foreach_set('select', vert_sel)
+    mesh.edges.foreach_set('select', edge_sel)
+    if len(mesh.polygons):
+        loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get('vertex_index', loop_verts)
+        loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get('loop_start', loop_starts)
+        face_sel = np.empty(len(mesh.polygons), dtype=bool)
+        mesh.polygons.foreach_get('select', face_sel)
+        face_sel |= np.logical_and.reduceat(vert_sel[loop_verts], loop_starts)
+        mesh.polygons.foreach_set('select', face_sel)
+    mesh.update()
+
 ########################•########################
 """                 SELECTIONS                """
 ########################•########################
 
-def select_marks(context, obj, sharp_edges=True, seamed_edges=True, bevel_edges=True, crease_edges=True, creased_verts=True):
-    bm = open_bmesh(context, obj)
+def select_marks(context, obj, sharp_edges=True, seamed_edges=True, bevel_edges=True, crease_edges=True, creased_verts=True, session=None):
+    if session is None and mesh_in_object_mode(obj):
+        select_mesh_marks(obj, sharp_edges=sharp_edges, seamed_edges=seamed_edges, bevel_edges=bevel_edges, crease_edges=crease_edges, creased_verts=creased_verts)
+        return
+    bm = open_bmesh(context, obj, refresh=REFRESH.NONE, session=session)
     if not bm: return
 
     bevel_layer = layer_from_bmesh(bm, elem_type='EDGE', data_type='FLOAT', layer_name='bevel_weight_edge')
@@ -567,83 +826,71 @@ def select_marks(context, obj, sharp_edges=True, seamed_edges=True, bevel_edges=
         for vert in bm.verts:
             if vert[vert_crease_layer] > 0.0:
                 vert.select = True
-    close_bmesh(context, obj, bm)
+    close_bmesh(context, obj, bm, refresh=REFRESH.SELECTION, destructive=False, session=session, mutated=MUTATION.SELECTION)
     del bm
 
 
 def select_boundary_of_faces(bm, faces=[]):
-    boundary_edges = set()
-    for face in faces:
-        for edge in face.edges:
-            if edge.is_boundary:
-                edge.select = True
-                boundary_edges.add(edge)
-                continue
-            for edge_face in edge.link_faces:
-                if edge_face not in faces:
-                    edge.select = True
-                    boundary_edges.add(edge)
-                    break
-    return list(boundary_edges)
-
-
-def select_boundary(context, obj, omit_axis_x=True, omit_axis_y=False, omit_axis_z=False, flip_axis_x=True, flip_axis_y=False, flip_axis_z=False):
-    bm = open_bmesh(context, obj)
+    '''
+    RET : LIST -> Edges used by exactly one of the faces || Edges are selected
+    IFO : faces must be unique || Updates the edge indices and lookup table
+    '''
+    bm.edges.index_update()
+    bm.edges.ensure_lookup_table()
+    loop_edges = np.fromiter((loop.edge.index for face in faces for loop in face.loops), dtype=np.int32)
+    counts = np.bincount(loop_edges, minlength=len(bm.edges))
+    edges = bm.edges
+    boundary_edges = [edges[index] for index in np.flatnonzero(counts == 1).tolist()]
+    for edge in boundary_edges:
+        edge.select = True
+    return boundary_edges
+
+
+def select_open_edges(bm):
+    '''
+    RET : LIST -> Boundary edges and edges of hidden faces || Edges are selected
+    IFO : Updates the edge indices and lookup table
+    '''
+    bm.edges.index_update()
+    bm.edges.ensure_lookup_table()
+    loops = np.array([(loop.edge.index, face.hide) for face in bm.faces for loop in face.loops], dtype=np.int32).reshape(-1, 2)
+    counts = np.bincount(loops[:, 0], minlength=len(bm.edges))
+    hidden = np.bincount(loops[:, 0], weights=loops[:, 1], minlength=len(bm.edges))
+    edges = bm.edges
+    open_edges = [edges[index] for index in np.flatnonzero((counts == 1) | (hidden > 0)).tolist()]
+    for edge in open_edges:
+        edge.select = True
+    return open_edges
+
+
+def select_boundary(context, obj, omit_axis_x=True, omit_axis_y=False, omit_axis_z=False, flip_axis_x=True, flip_axis_y=False, flip_axis_z=False, session=None):
+    bm = open_bmesh(context, obj, refresh=REFRESH.SELECTION, session=session)
     if not bm: return
 
     # Capture boundary of selected faces
     sel_faces = [face for face in bm.faces if face.select]
-    boundary_edges = []
-    # Everything Selected
-    if len(sel_faces) == len(bm.faces):
-        set_component_selection(context, values=(False, True, False))
-        select_all_elements(bm, select=False)
-        for edge in bm.edges:
-            if edge.is_boundary:
-                edge.select = True
+    # No faces selected --> check if verts are selected
+    if not sel_faces:
+        sel_verts = [vert for vert in bm.verts if vert.select]
+        if sel_verts:
+            sel_faces = faces_connected_to_verts(verts=sel_verts)
+    set_component_selection(context, values=(False, True, False))
+    select_all_elements(bm, select=False)
+    # Select boundary of selection
+    if sel_faces:
+        boundary_edges = select_boundary_of_faces(bm, faces=sel_faces)
+    # Select boundary edges
     else:
-        # No faces selected --> check if verts are selected
-        if not sel_faces:
-            sel_verts = [vert for vert in bm.verts if vert.select]
-            if sel_verts:
-                sel_faces = faces_connected_to_verts(verts=sel_verts)
-        set_component_selection(context, values=(False, True, False))
-        select_all_elements(bm, select=False)
-        # Select boundary of selection
-        if sel_faces:
-            edges = select_boundary_of_faces(bm, faces=sel_faces)
-            boundary_edges.extend(edges)
-        # Select boundary edges
-        else:
-            for edge in bm.edges:
-                if edge.is_boundary or any([face.hide for face in edge.link_faces]):
-                    edge.select = True
-                    boundary_edges.append(edge)
-    # Get axis vertices to remove
-    if omit_axis_x or omit_axis_y or omit_axis_z:
-        plane_normals = []
-        if omit_axis_x:
-            if flip_axis_x:
-                plane_normals.append(Vector((-1,0,0)))
-            else:
-                plane_normals.append(Vector((1,0,0)))
-        if omit_axis_y:
-            if flip_axis_y:
-                plane_normals.append(Vector((0,-1,0)))
-            else:
-                plane_normals.append(Vector((0,1,0)))
-        if omit_axis_z:
-            if flip_axis_z:
-                plane_normals.append(Vector((0,0,-1)))
-            else:
-                plane_normals.append(Vector((0,0,1)))
-        if plane_normals:
-            verts_to_omit = verts_in_planes(bm, Vector((0,0,0)), plane_normals, only_center_line=False)
-            verts_to_omit = set(verts_to_omit)
-            for edge in boundary_edges:
-                if (edge.verts[0] in verts_to_omit) and (edge.verts[1] in verts_to_omit):
-                    edge.select = False
-    close_bmesh(context, obj, bm)
+        boundary_edges = select_open_edges(bm)
+    # Remove edges with both verts on or below the axis planes
+    signs = [(-1 if flip else 1) if omit else 0 for omit, flip in ((omit_axis_x, flip_axis_x), (omit_axis_y, flip_axis_y), (omit_axis_z, flip_axis_z))]
+    if any(signs) and boundary_edges:
+        coords = vert_coord_array([vert for edge in boundary_edges for vert in edge.verts])
+        omit = verts_under_axis_planes(coords, signs=signs).reshape(-1, 2).all(axis=1)
+        for edge, deselect in zip(boundary_edges, omit.tolist()):
+            if deselect:
+                edge.select = False
+    close_bmesh(context, obj, bm, refresh=REFRESH.SELECTION, destructive=False, session=session, mutated=MUTATION.SELECTION)
     del bm
 
 
@@ -653,12 +900,24 @@ def select_all_elements(bm, select=True):
     bm.select_flush(select)
 
 
+def reveal_all_elements(bm, select=True):
+    '''
+    IFO : Same as the reveal operator || Revealed elements are selected
+    '''
+    for elems in (bm.verts, bm.edges, bm.faces):
+        for elem in elems:
+            if elem.hide:
+                elem.hide = False
+                if select:
+                    elem.select = True
+
+
 def select_flush(bm, select=True):
     bm.select_flush(select)
 
 
-def select_axis_verts(context, obj, x=True, y=False, z=False, only_center_line=True, invert=False):
-    bm = open_bmesh(context, obj)
+def select_axis_verts(context, obj, x=True, y=False, z=False, only_center_line=True, invert=False, session=None):
+    bm = open_bmesh(context, obj, refresh=REFRESH.NONE, session=session)
     if not bm: return
 
     set_component_selection(context, values=(True, False, False))
@@ -674,7 +933,7 @@ def select_axis_verts(context, obj, x=True, y=False, z=False, only_center_line=T
     for vert in verts:
         vert.select_set(True)
     bm.select_flush(True)
-    close_bmesh(context, obj, bm)
+    close_bmesh(context, obj, bm, refresh=REFRESH.SELECTION, destructive=False, session=session, mutated=MUTATION.SELECTION)
     del bm
 
 ########################•########################
@@ -737,6 +996,147 @@ def trace_edge_by_angle(bm, edge, vert, step_limit=150, angle_limit=DEG_30, brea
                 next_vert_breaks = True
     return list(edges)
 
+
+class EdgeGraph:
+    '''
+    IFO : Index arrays of a mesh edge network with CSR vertex → edge adjacency
+    IFO : Tracing mirrors trace_edge_by_angle and is memoized per (edge, vert, limits)
+    '''
+
+    MEMO_LIMIT = 4096
+
+    def __init__(self, edge_verts, coords, edge_face_counts):
+        # Arrays
+        self.edge_verts = np.asarray(edge_verts, dtype=np.int32).reshape(-1, 2)
+        self.coords = np.asarray(coords, dtype=np.float32).reshape(-1, 3)
+        self.edge_face_counts = np.asarray(edge_face_counts, dtype=np.int32)
+        self.vert_edges, self.vert_offsets = vert_adjacency(self.edge_verts, len(self.coords))
+        # Scalar access for walks
+        self.__edge_verts = self.edge_verts.tolist()
+        self.__coords = self.coords.tolist()
+        self.__vert_edges = self.vert_edges.tolist()
+        self.__vert_offsets = self.vert_offsets.tolist()
+        self.__boundary = (self.edge_face_counts == 1).tolist()
+        self.memo = dict()
+
+
+    @property
+    def edge_count(self):
+        return len(self.edge_verts)
+
+
+    def link_edges(self, vert):
+        return self.__vert_edges[self.__vert_offsets[vert] : self.__vert_offsets[vert + 1]]
+
+
+    def other_vert(self, edge, vert):
+        v1, v2 = self.__edge_verts[edge]
+        return v2 if v1 == vert else v1
+
+
+    def trace(self, edge, vert, step_limit=150, angle_limit=DEG_30, break_at_intersections=False, break_at_boundary=False):
+        '''
+        RET : tuple of edge indices
+        '''
+
+        key = (edge, vert, step_limit, angle_limit, break_at_intersections, break_at_boundary)
+        traced = self.memo.get(key)
+        if traced is not None:
+            return traced
+        if vert not in self.__edge_verts[edge]:
+            return ()
+        coords = self.__coords
+        boundary = self.__boundary
+        edges = set()
+        verts = {self.other_vert(edge, vert)}
+        next_vert_breaks = False
+        for i in range(step_limit):
+            # Boundary
+            if break_at_boundary and boundary[edge]:
+                break
+            # Add
+            edges.add(edge)
+            verts.add(vert)
+            # Next Edge by Largest Angle
+            x2, y2, z2 = coords[vert]
+            x1, y1, z1 = coords[self.other_vert(edge, vert)]
+            n1x, n1y, n1z = x1 - x2, y1 - y2, z1 - z2
+            n1_len = math.sqrt(n1x * n1x + n1y * n1y + n1z * n1z)
+            if n1_len == 0:
+                break
+            delta_angle = 0
+            next_edge = -1
+            for link_edge in self.link_edges(vert):
+                if link_edge in edges:
+                    continue
+                x3, y3, z3 = coords[self.other_vert(link_edge, vert)]
+                n2x, n2y, n2z = x3 - x2, y3 - y2, z3 - z2
+                n2_len = math.sqrt(n2x * n2x + n2y * n2y + n2z * n2z)
+                if n2_len == 0:
+                    continue
+                # Angle
+                dot = (n1x * n2x + n1y * n2y + n1z * n2z) / (n1_len * n2_len)
+                angle = math.acos(max(-1.0, min(1.0, dot)))
+                # Limit
+                if math.pi - angle > angle_limit:
+                    continue
+                # Delta
+                if angle > delta_angle:
+                    delta_angle = angle
+                    next_edge = link_edge
+            # No next edges
+            if next_edge < 0:
+                break
+            # Set for next
+            edge = next_edge
+            vert = self.other_vert(edge, vert)
+            # Intersection
+            if next_vert_breaks:
+                break
+            if break_at_intersections and vert in verts:
+                next_vert_breaks = True
+        traced = tuple(edges)
+        if len(self.memo) >= self.MEMO_LIMIT:
+            self.memo.clear()
+        self.memo[key] = traced
+        return traced
+
+
+    def trace_from_edge(self, edge, vert_dir_index=-1, step_limit=150, angle_limit=DEG_30, break_at_intersections=False, break_at_boundary=False):
+        '''
+        RET : list of edge indices traced both ways (vert_dir_index < 0) or from one of the edge verts
+        '''
+
+        if edge < 0 or edge >= self.edge_count:
+            return []
+        v1, v2 = self.__edge_verts[edge]
+        verts = (v1, v2) if vert_dir_index < 0 else ((v1,) if vert_dir_index < 1 else (v2,))
+        traced = set()
+        for vert in verts:
+            traced.update(self.trace(edge, vert, step_limit=step_limit, angle_limit=angle_limit, break_at_intersections=break_at_intersections, break_at_boundary=break_at_boundary))
+        return list(traced)
+
+
+    def edge_lines(self, edge_indices, matrix=MAT_IDENTITY):
+        '''
+        RET : (2N,3) float32 array of world space line coords
+        '''
+
+        indices = self.edge_verts[np.asarray(edge_indices, dtype=np.int32)].ravel()
+        mat = np.array(matrix, dtype=np.float32)
+        return self.coords[indices] @ mat[:3, :3].T + mat[:3, 3]
+
+
+def edge_graph_from_mesh(mesh):
+    edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get('vertices', edge_verts)
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', coords)
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('edge_index', loop_edges)
+    edge_face_counts = np.bincount(loop_edges, minlength=len(mesh.edges))
+    return EdgeGraph(edge_verts, coords, edge_face_counts)
+
 ########################•########################
 """                  TAGGING                  """
 ########################•########################
@@ -898,7 +1298,7 @@ def face_islands_from_faces(faces=[]):
             visited[current_face] = True
             for loop in current_face.loops:
                 next_face = loop.link_loop_radial_next.face
-                if next_face in faces and not visited[next_face]:
+                if next_face in visited and not visited[next_face]:
                     queue.append(next_face)
         return island
 
@@ -950,6 +1350,7 @@ def vert_island_containing_vert(vert):
 
 def perimeter_edges_from_faces(faces=[], convert_to_list=True):
     edges = set()
+    faces = faces if isinstance(faces, (set, frozenset)) else set(faces)
     for face in faces:
         for edge in face.edges:
             if edge.is_boundary:
@@ -964,7 +1365,11 @@ def perimeter_edges_from_faces(faces=[], convert_to_list=True):
     return edges
 
 
-def connected_faces_to_face_by_angle(face, angle=DEG_15):
+def connected_faces_to_face_by_angle(face, angle=DEG_15, field=None):
+    '''
+    IFO : field -> AngleField of the face bmesh for repeated queries
+    '''
+    within = field.mask_at_most(angle).tolist() if field is not None else None
     island = set()
     que = deque([face])
     while que:
@@ -975,8 +1380,15 @@ def connected_faces_to_face_by_angle(face, angle=DEG_15):
         for edge in face.edges:
             if edge.is_boundary:
                 continue
+            if within is not None:
+                if not within[edge.index]:
+                    continue
+                for edge_face in edge.link_faces:
+                    if edge_face != face:
+                        que.append(edge_face)
+                continue
             edge_angle = edge.calc_face_angle(None)
-            if angle is None:
+            if edge_angle is None:
                 continue
             if edge_angle <= angle:
                 for edge_face in edge.link_faces:
@@ -984,6 +1396,36 @@ def connected_faces_to_face_by_angle(face, angle=DEG_15):
                         que.append(edge_face)
     return list(island)
 
+def interior_faces(bm, ray_offset=RAY_OFFSET):
+    '''
+    RET : Faces where every edge has more than two faces and both sides are inside a volume
+    IFO : A side is inside when its ray first hits the back of a face || Needs consistent normals
+    '''
+    bm.edges.index_update()
+    face_counts = [len(edge.link_faces) for edge in bm.edges]
+    candidates = [face for face in bm.faces if all([face_counts[edge.index] > 2 for edge in face.edges])]
+    if not candidates:
+        return []
+    bvh = BVHTree.FromBMesh(bm)
+
+    def inside(origin, direction):
+        location, hit_normal, index, distance = bvh.ray_cast(origin, direction)
+        return location is not None and hit_normal.dot(direction) > 0
+
+    faces = []
+    for face in candidates:
+        normal = face.normal
+        if normal.length == 0:
+            continue
+        center = face.calc_center_median()
+        offset = normal * ray_offset
+        if not inside(center + offset, normal):
+            continue
+        if not inside(center - offset, -normal):
+            continue
+        faces.append(face)
+    return faces
+
 ########################•########################
 """                DIMENSIONAL                """
 ########################•########################
@@ -1048,30 +1490,20 @@ def farthest_vert_to_vert_on_face(face, target_vert):
 """                  CHAINS                   """
 ########################•########################
 
-def vert_chain_from_edge_chain(edge_chain=[]):
-    if not edge_chain: return []
-    if len(edge_chain) == 1:
-        return [v for v in edge_chain[0].verts]
-    if len(edge_chain) == 2:
-        v2 = shared_vert_between_connected_edges(edge_chain[0], edge_chain[1])
-        v1 = edge_chain[0].other_vert(v2)
-        v3 = edge_chain[1].other_vert(v2)
-        return [v1, v2, v3]
-
-    vert_chain = []
-    curr_vert = None
-
-    if edge_chain[0].verts[0] in edge_chain[1].verts:
-        curr_vert = edge_chain[0].verts[1]
-    else:
-        curr_vert = edge_chain[0].verts[0]
+def bmesh_edge_pairs(edges=[]):
+    '''
+    RET : (M, 2) int32 local vert indices of the edges, [BMVert] at each local index
+    IFO : Leaves the bmesh indices untouched
+    '''
+    vert_ids = dict()
+    pairs = [vert_ids.setdefault(vert, len(vert_ids)) for edge in edges for vert in edge.verts]
+    return np.array(pairs, dtype=np.int32).reshape(-1, 2), list(vert_ids)
 
-    vert_chain.append(curr_vert)
-    for edge in edge_chain:
-        vert_chain.append(edge.other_vert(curr_vert))
-        curr_vert = edge.other_vert(curr_vert)
 
-    return vert_chain
+def vert_chain_from_edge_chain(edge_chain=[]):
+    if not edge_chain: return []
+    pairs, verts = bmesh_edge_pairs(edge_chain)
+    return [verts[index] for index in chain_verts(pairs).tolist()]
 
 
 def vert_chain_to_distance_map(vert_chain=[]):
@@ -1093,101 +1525,29 @@ def vert_chain_to_distance_map(vert_chain=[]):
     return distance_map
 
 
-def edge_chains_from_unsorted_edges(edges=[]):
-    if not edges: return []
+def vert_chains_from_edge_pairs(pairs=[]):
+    '''
+    RET : [[vert index]] chains split where a vert does not have exactly two edges
+    IFO : Closed chains end with their first vert
+    '''
+    return [chain.tolist() for chain in EdgeChains(pairs).vert_chains()]
 
-    edge_chains = []
-    traversed = []
 
-    while True:
-        remaining = [e for e in edges if e not in traversed]
-        if not remaining: break
-
-        edge = remaining[0]
-        conn_a = [e for e in edges_connected_to_vert(edge.verts[0]) if e != edge and e in edges]
-        conn_b = [e for e in edges_connected_to_vert(edge.verts[1]) if e != edge and e in edges]
-        
-        # --- Single edge cases --- #
-        if len(conn_a) == len(conn_b):
-            if len(conn_a) == 0 or len(conn_a) > 1:
-                edge_chains.append([edge])
-                traversed.append(edge)
-                continue
-        if len(conn_a) > 1 and len(conn_b) == 0:
-            edge_chains.append([edge])
-            traversed.append(edge)
-            continue
-        if len(conn_b) > 1 and len(conn_a) == 0:
-            edge_chains.append([edge])
-            traversed.append(edge)
-            continue
-
-        # --- Follow Chain --- #
-        chain = [edge]
-        stack = []
-        if len(conn_a) == 1:
-            stack.append(conn_a[0])
-        if len(conn_b) == 1:
-            stack.append(conn_b[0])
-
-        while stack:
-            queued_edge = stack.pop()
-            chain.append(queued_edge)
-            for i in range(2):
-                connections = [e for e in queued_edge.verts[i].link_edges if e != queued_edge and e in edges]
-                if len(connections) == 1:
-                    connected_edge = connections[0]
-                    if connected_edge not in chain:
-                        stack.append(connected_edge)
-
-        # Assign Edge Chain
-        edge_chains.append(edge_chain_from_connected_edges(chain))
-        traversed.extend(chain)
-    
-    return edge_chains
+def edge_chains_from_unsorted_edges(edges=[]):
+    '''
+    RET : [[BMEdge]] ordered chains split where a vert does not have exactly two edges
+    '''
+    if not edges: return []
+    edges = list(dict.fromkeys(edges))
+    pairs, _ = bmesh_edge_pairs(edges)
+    return [[edges[index] for index in chain.tolist()] for chain in EdgeChains(pairs).edge_chains()]
 
 
 def edge_chain_from_connected_edges(edges=[]):
     if not edges: return []
-
-    sorted_edges = []
-    curr_edge = None
-    curr_vert = None
-
-    # Create a map of vertex to edges
-    vert_edge_map = {}
-    for edge in edges:
-        for vert in edge.verts:
-            if vert not in vert_edge_map:
-                vert_edge_map[vert] = []
-            vert_edge_map[vert].append(edge)
-
-    # Find an edge starting from an endpoint if possible
-    for vert, vert_edges in vert_edge_map.items():
-        if len(vert_edges) == 1:  # This vertex is an endpoint
-            curr_edge = vert_edges[0]
-            curr_vert = vert
-            break
-
-    # If no endpoint is found, start from any edge
-    if curr_edge is None:
-        curr_edge = edges[0]
-        curr_vert = curr_edge.verts[0]
-
-    sorted_edges.append(curr_edge)
-    # Determine the initial direction
-    curr_vert = curr_edge.other_vert(curr_vert)
-
-    while True:
-        next_edges = [e for e in curr_vert.link_edges if e in edges and e not in sorted_edges]
-        if next_edges:
-            curr_edge = next_edges[0]
-            sorted_edges.append(curr_edge)
-            curr_vert = curr_edge.other_vert(curr_vert)
-        else:
-            break
-
-    return sorted_edges
+    edges = list(dict.fromkeys(edges))
+    pairs, _ = bmesh_edge_pairs(edges)
+    return [edges[index] for index in connected_edge_order(pairs).tolist()]
 
 
 def edge_chain_dissolve_iso_verts(bm, edge_chain=[], dissolve_distance=EPSILON):
@@ -1195,9 +1555,10 @@ def edge_chain_dissolve_iso_verts(bm, edge_chain=[], dissolve_distance=EPSILON):
     Ops : Dissolve verts that only have edges on the chain and are close enough to another vert
     '''
     vert_chain = vert_chain_from_edge_chain(edge_chain)
+    chain_edges = set(edge_chain)
     dissole_verts = set()
     for vert in vert_chain:
-        if len( [ e for e in vert.link_edges if e not in edge_chain ] ) > 0: continue
+        if any(e not in chain_edges for e in vert.link_edges): continue
         conn_verts = verts_connected_to_vert(vert)
         for conn_vert in conn_verts:
             if (vert.co - conn_vert.co).magnitude <= dissolve_distance:
@@ -1439,7 +1800,7 @@ def edge_chain_adjacency_face_map(edge_chain=[]):
     if len(edge_chain) == 1:
         f1 = edge_chain[0].link_faces[0]
         f2 = edge_chain[0].link_faces[1]
-        return {edge_chain: (f1, f2)}
+        return {edge_chain[0]: (f1, f2)}
 
     curr_vert = edge_chain_first_vert(edge_chain)
     # Case : Edge chain not consistent
@@ -1499,33 +1860,12 @@ def edge_chain_slice_map_from_distance(edge_chain=[], start_vert=None, end_verts
     vert_chain = vert_chain_from_edge_chain(edge_chain)
     if not vert_chain: return None
     if start_vert not in vert_chain: return None
-    if forward == False: vert_chain.reverse()
-    travel_distance = 0
-    slice_map = []
-    index = vert_chain.index(start_vert)
-    curr_vert = start_vert
     cyclic = vert_chain[0] == vert_chain[-1]
-    while True:
-        index += 1
-        if index >= len(vert_chain) - 1:
-            if cyclic: index = 0
-            else: break
-        next_vert = vert_chain[index]
-        travel_distance += (curr_vert.co - next_vert.co).magnitude
-        if travel_distance > max_travel_dist:
-            break
-        slice_map.append((travel_distance, next_vert))
-        if next_vert == start_vert or next_vert in end_verts:
-            break
-        curr_vert = next_vert
-    return slice_map
-
-########################•########################
-"""                BMESH OPS                  """
-########################•########################
-
-def remove_doubles_safe(bm, verts=[], dist=EPSILON):
-    bmesh.ops.remove_doubles(bm, verts=list(set(v for v in verts if v.is_valid)), dist=dist)
+    end_verts = set(end_verts)
+    stops = np.array([vert in end_verts for vert in vert_chain], dtype=bool)
+    distances = cumulative_lengths(vert_coord_array(vert_chain))
+    positions, travelled = slice_by_distance(distances, vert_chain.index(start_vert), max_travel_dist, forward=forward, cyclic=cyclic, stops=stops)
+    return [(distance, vert_chain[position]) for distance, position in zip(travelled.tolist(), positions.tolist())]
 
 
 def split_edge_at_center(edge):
@@ -1595,8 +1935,8 @@ def bisect_mesh(bm, plane_co=Vector((0,0,0)), plane_no=Vector((0,0,0)), cut_hidd
 """               OBJECT OPS                  """
 ########################•########################
 
-def ops_trace_edges(context, obj, step_limit=150, angle_limit=DEG_30, select_traced=True, from_selected=True, from_index=-1, vert_dir_index=-1, break_at_intersections=True, break_at_boundary=True):
-    bm = open_bmesh(context, obj)
+def ops_trace_edges(context, obj, step_limit=150, angle_limit=DEG_30, select_traced=True, from_selected=True, from_index=-1, vert_dir_index=-1, break_at_intersections=True, break_at_boundary=True, session=None):
+    bm = open_bmesh(context, obj, refresh=REFRESH.TABLES | REFRESH.INDICES, read_only=not select_traced, session=session)
     if not bm: return []
 
     traced_edges = set()
@@ -1626,7 +1966,7 @@ def ops_trace_edges(context, obj, step_limit=150, angle_limit=DEG_30, select_tra
         select_flush(bm, select=True)
     # Edge Indices / Close / Ret
     traced_indices = [edge.index for edge in traced_edges]
-    close_bmesh(context, obj, bm)
+    close_bmesh(context, obj, bm, refresh=REFRESH.SELECTION, read_only=not select_traced, destructive=False, session=session, mutated=MUTATION.SELECTION)
     del bm
     return traced_indices
 
@@ -1727,12 +2067,9 @@ def ops_mirror_and_weld(obj, bm, axis='X', flip=False, only_sel_geo=False, show_
     ret = bmesh.ops.mirror(bm, geom=geom, matrix=mat, merge_dist=EPSILON, axis=axis)
     # Poly Fade
     if show_poly_fade:
-        if int(len(bm.edges)) < user_prefs().settings.mesh_fade_geo_limit:
-            mat_ws = obj.matrix_world
-            geom_set = set(geom)
-            faces = [face for face in bm.faces if face.is_valid and face not in geom_set]
-            lines = [mat_ws @ vert.co for face in faces if face.is_valid for edge in face.edges if edge.is_valid for vert in edge.verts if vert.is_valid]
-            init_poly_fade(obj, lines=lines, color_a=COLORS.WHITE, color_b=color)
+        edges = [elem for elem in ret['geom'] if isinstance(elem, bmesh.types.BMEdge)]
+        if edges:
+            init_poly_fade(obj, coords=bmesh_edge_arrays(edges), color_a=COLORS.WHITE, color_b=color)
         else:
             init_poly_fade(obj, bounding_box_only=True, color_a=COLORS.WHITE, color_b=color)
     # Doubles
@@ -1747,13 +2084,16 @@ def ops_mirror_and_weld(obj, bm, axis='X', flip=False, only_sel_geo=False, show_
         bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
 
 
-def ops_clean_mesh(context, obj, clean_all=True, dissolve_angle=DEG_01, remove_interior=True, clean_hidden=True, epsilon=EPSILON):
-    bm = open_bmesh(context, obj)
+def ops_clean_mesh(context, obj, clean_all=True, dissolve_angle=DEG_01, remove_interior=True, clean_hidden=True, epsilon=EPSILON, session=None):
+    '''
+    IFO : No operators || Works on edit mode and object mode meshes
+    '''
+    bm = open_bmesh(context, obj, session=session)
     if not bm: return
 
-    # Show hidden (Ops : Always Selects on Reveal)
+    # Show hidden (Always Selects on Reveal)
     if clean_hidden:
-        bpy.ops.mesh.reveal()
+        reveal_all_elements(bm, select=True)
     select_flush(bm, select=True)
     not_all_faces_selected = False
     if not clean_all:
@@ -1762,17 +2102,16 @@ def ops_clean_mesh(context, obj, clean_all=True, dissolve_angle=DEG_01, remove_i
                 not_all_faces_selected = True
                 break
     # Dissolve Edges
+    bm.edges.ensure_lookup_table()
+    flat_edges = [bm.edges[index] for index in field_from_bmesh(bm).edges_at_most(dissolve_angle).tolist()]
     edges = []
     if clean_all:
-        edges = [e for e in bm.edges if e.calc_face_angle(math.pi) <= dissolve_angle]
+        edges = flat_edges
     else:
-        perimeter_edges = []
+        perimeter_edges = set()
         if not_all_faces_selected:
-            perimeter_edges = perimeter_edges_from_faces(faces=[f for f in bm.faces if f.select])
-        if perimeter_edges:
-            edges = [e for e in bm.edges if e.select and e not in perimeter_edges and e.calc_face_angle(math.pi) <= dissolve_angle]
-        else:
-            edges = [e for e in bm.edges if e.select and e.calc_face_angle(math.pi) <= dissolve_angle]
+            perimeter_edges = perimeter_edges_from_faces(faces=[f for f in bm.faces if f.select], convert_to_list=False)
+        edges = [e for e in flat_edges if e.select and e not in perimeter_edges]
     bmesh.ops.dissolve_edges(bm, edges=edges, use_verts=False, use_face_split=False)
     # Doubles
     verts = bm.verts if clean_all else [v for v in bm.verts if v.select]
@@ -1788,8 +2127,7 @@ def ops_clean_mesh(context, obj, clean_all=True, dissolve_angle=DEG_01, remove_i
     else:
         if not_all_faces_selected:
             select_flush(bm, select=True)
-            perimeter_edges = set(perimeter_edges_from_faces(faces=[f for f in bm.faces if f.select]))
-            perimeter_verts = set([v for e in perimeter_edges for v in e.verts])
+            perimeter_edges = perimeter_edges_from_faces(faces=[f for f in bm.faces if f.select], convert_to_list=False)
             verts = [v for v in bm.verts if v.select]
             edges = [e for e in bm.edges if e.select and e not in perimeter_edges]
             bmesh.ops.dissolve_limit(bm, angle_limit=dissolve_angle, use_dissolve_boundaries=False, verts=verts, edges=edges)
@@ -1803,72 +2141,110 @@ def ops_clean_mesh(context, obj, clean_all=True, dissolve_angle=DEG_01, remove_i
     # Interior Faces
     if remove_interior and clean_all:
         select_all_elements(bm, select=False)
-        bpy.ops.mesh.select_interior_faces()
-        faces = [f for f in bm.faces if f.select]
-        bmesh.ops.delete(bm, geom=faces, context='FACES')
-    close_bmesh(context, obj, bm)
+        bm.normal_update()
+        faces = interior_faces(bm)
+        if faces:
+            bmesh.ops.delete(bm, geom=faces, context='FACES')
+    close_bmesh(context, obj, bm, session=session)
     del bm
 
 
-def ops_flatten_geometry(context, obj, project_boundary_verts=True, clean_surface=False):
-    bm = open_bmesh(context, obj)
+def ops_clean_meshes(context, objs, clean_all=True, dissolve_angle=DEG_01, remove_interior=True, clean_hidden=True, epsilon=EPSILON, session=None):
+    '''
+    RET : Objects that were cleaned (One per mesh)
+    IFO : Batched in the current mode || Shared meshes are cleaned once
+    '''
+    cleaned = []
+    meshes = set()
+    for obj in objs:
+        if not isinstance(obj, bpy.types.Object) or not isinstance(obj.data, bpy.types.Mesh):
+            continue
+        if obj.data in meshes:
+            continue
+        meshes.add(obj.data)
+        ops_clean_mesh(context, obj, clean_all=clean_all, dissolve_angle=dissolve_angle, remove_interior=remove_interior, clean_hidden=clean_hidden, epsilon=epsilon, session=session)
+        cleaned.append(obj)
+    return cleaned
+
+
+def ops_flatten_geometry(context, obj, project_boundary_verts=True, clean_surface=False, session=None):
+    bm = open_bmesh(context, obj, refresh=REFRESH.SELECTION, session=session)
     if not bm: return
 
     # Selections
     active_elem = bm.select_history.active
     sel_verts = [v for v in bm.verts if v.select]
-    sel_edges = [e for e in bm.edges if e.select]
+    sel_edges = {e for e in bm.edges if e.select}
     sel_faces = [f for f in bm.faces if f.select and f != active_elem]
     # Project verts by face normal and boundary edges
     if active_elem and isinstance(active_elem, bmesh.types.BMFace) and sel_faces:
         active_elem.normal_update()
-        plane_co = active_elem.calc_center_median()
-        plane_no = active_elem.normal
-        # Tag
-        for vert in sel_verts:
-            vert.tag = False
+        plane_co = np.array(active_elem.calc_center_median(), dtype=np.float64)
+        plane_no = np.array(active_elem.normal, dtype=np.float64)
+        slid_verts = set()
         if project_boundary_verts:
-            outter_edges = perimeter_edges_from_faces(sel_faces)
+            outter_edges = perimeter_edges_from_faces(sel_faces, convert_to_list=False)
             outter_verts = {vert for edge in outter_edges for vert in edge.verts}
+            slide_verts = []
+            slide_others = []
             for vert in outter_verts:
-                project_edges = [edge for edge in vert.link_edges if edge not in sel_edges]
-                if not project_edges:
-                    continue
-                project_edge = project_edges[0]
-                direction = (vert.co - project_edge.other_vert(vert).co).normalized()
-                line_a = vert.co
-                line_b = vert.co + direction
-                intersection = intersect_line_plane(line_a, line_b, plane_co, plane_no)
-                if not intersection:
+                project_edge = next((edge for edge in vert.link_edges if edge not in sel_edges), None)
+                if project_edge is None:
                     continue
-                vert.co = intersection
-                vert.tag = True
-        for vert in sel_verts:
-            if vert.tag:
-                continue
-            if vert in active_elem.verts:
-                continue
-            offset = distance_point_to_plane(vert.co, plane_co, plane_no)
-            vert.co -= plane_no * offset
+                slide_verts.append(vert)
+                slide_others.append(project_edge.other_vert(vert))
+            if slide_verts:
+                points = vert_coord_array(slide_verts)
+                directions = points - vert_coord_array(slide_others)
+                points, valid = math3.intersect_lines_planes(points, directions, plane_co, plane_no)
+                set_vert_coords(slide_verts, points, mask=valid)
+                slid_verts = {vert for vert, keep in zip(slide_verts, valid.tolist()) if keep}
+        face_verts = set(active_elem.verts)
+        verts = [vert for vert in sel_verts if vert not in slid_verts and vert not in face_verts]
+        if verts:
+            set_vert_coords(verts, math3.project_points_to_planes(vert_coord_array(verts), plane_co, plane_no))
     # Project verts to triangulated plane
     elif sel_verts:
-        for face in query_for_faces_containing_verts(bm, target_verts=sel_verts):
-            sel_face_verts = [vert for vert in face.verts if vert.select]
-            plane_co = math3.center_of_coords([vert.co for vert in sel_face_verts])
-            plane_no = math3.normal_from_points(v1=sel_face_verts[0].co, v2=sel_face_verts[1].co, v3=sel_face_verts[2].co)
+        sel_vert_set = set(sel_verts)
+        # Selected verts of every face holding three or more of them
+        plane_verts = []
+        plane_counts = []
+        # KEY -> Vert || VAL -> (Plane index, Slide vert or None) : The last face wins
+        targets = dict()
+        for face in dict.fromkeys(face for vert in sel_verts for face in vert.link_faces):
+            sel_face_verts = [vert for vert in face.verts if vert in sel_vert_set]
+            if len(sel_face_verts) < 3:
+                continue
+            plane_index = len(plane_counts)
+            plane_verts.extend(sel_face_verts)
+            plane_counts.append(len(sel_face_verts))
+            face_edges = set(face.edges)
             for vert in face.verts:
-                slide_edge = [edge for edge in vert.link_edges if edge not in face.edges]
-                if slide_edge:
-                    slide_edge = slide_edge[0]
-                    direction = vert.co - slide_edge.other_vert(vert).co
-                    p1 = vert.co
-                    p2 = p1 + direction
-                    intersection_point = intersect_line_plane(p1, p2, plane_co, plane_no, False)
-                    if intersection_point:
-                        vert.co = intersection_point
-                else:
-                    offset = distance_point_to_plane(vert.co, plane_co, plane_no)
-                    vert.co -= plane_no * offset
+                slide_edge = next((edge for edge in vert.link_edges if edge not in face_edges), None)
+                targets[vert] = (plane_index, slide_edge.other_vert(vert) if slide_edge else None)
+        if plane_counts:
+            counts = np.array(plane_counts)
+            offsets = np.cumsum(counts) - counts
+            coords = vert_coord_array(plane_verts)
+            plane_cos = np.add.reduceat(coords, offsets, axis=0) / counts[:, None]
+            plane_nos = np.cross(coords[offsets + 1] - coords[offsets], coords[offsets + 2] - coords[offsets])
+            lengths = np.linalg.norm(plane_nos, axis=1)
+            flat = lengths > 1e-12
+            plane_nos = np.divide(plane_nos, lengths[:, None], out=np.zeros_like(plane_nos), where=flat[:, None])
+            flat = flat.tolist()
+            # Slide along the edge leaving the face
+            slide_verts = [vert for vert, (index, other) in targets.items() if other is not None and flat[index]]
+            if slide_verts:
+                planes = [targets[vert][0] for vert in slide_verts]
+                points = vert_coord_array(slide_verts)
+                directions = points - vert_coord_array([targets[vert][1] for vert in slide_verts])
+                points, valid = math3.intersect_lines_planes(points, directions, plane_cos[planes], plane_nos[planes])
+                set_vert_coords(slide_verts, points, mask=valid)
+            # Project the rest
+            verts = [vert for vert, (index, other) in targets.items() if other is None and flat[index]]
+            if verts:
+                planes = [targets[vert][0] for vert in verts]
+                set_vert_coords(verts, math3.project_points_to_planes(vert_coord_array(verts), plane_cos[planes], plane_nos[planes]))
     # Clean
     if clean_surface:
         bmesh.ops.remove_doubles(bm, verts=sel_verts, dist=EPSILON)
@@ -1876,12 +2252,12 @@ def ops_flatten_geometry(context, obj, project_boundary_verts=True, clean_surfac
         bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
         bmesh.ops.dissolve_limit(bm, angle_limit=radians(1), use_dissolve_boundaries=False, verts=[v for v in bm.verts if v.select], edges=[e for e in bm.edges if e.select])
     shade_recalc_normals(bm)
-    close_bmesh(context, obj, bm)
+    close_bmesh(context, obj, bm, refresh=REFRESH.NORMALS | REFRESH.SELECTION, destructive=clean_surface, session=session, mutated=MUTATION.ALL if clean_surface else MUTATION.COORDS | MUTATION.SELECTION)
     del bm
 
 
-def ops_selections_to_curves(context, obj, simplify=True):
-    bm = open_bmesh(context, obj)
+def ops_selections_to_curves(context, obj, simplify=True, session=None):
+    bm = open_bmesh(context, obj, session=session)
     if not bm: return
     if any([e.select for e in bm.edges]) == False:
         return None
@@ -1890,7 +2266,6 @@ def ops_selections_to_curves(context, obj, simplify=True):
     # Matrix
     mat_ws = obj.matrix_world
     loc, rot, sca = mat_ws.decompose()
-    sca_mat = math3.sca_matrix(sca)
     curve_obj.matrix_world = math3.loc_matrix(loc) @ math3.rot_matrix(rot)
     # Parent
     parent_object(child=curve_obj, parent=obj)
@@ -1910,68 +2285,34 @@ def ops_selections_to_curves(context, obj, simplify=True):
             elem.tag = True
         clean_tagged_geo(bm)
 
-    def set_spline_data(spline, add_new=True, coord=Vector((0,0,0))):
-        spline_point = None
-        if add_new:
-            spline.bezier_points.add(1)
-            spline_point = spline.bezier_points[-1]
-        else:
-            spline_point = spline.bezier_points[0]
-        spline_point.co = coord
-        spline_point.handle_left_type = 'VECTOR'
-        spline_point.handle_right_type = 'VECTOR'
-
+    # Vert Chains
+    bm.verts.index_update()
+    chains = []
     # Boundary Edges
+    island_edges = set()
     sel_faces = [f for f in bm.faces if f.select]
-    face_islands = face_islands_from_faces(faces=sel_faces)
-    for face_island in face_islands:
-        for face in face_island:
-            face.select = False
-        spline = curve_data.splines.new(type='BEZIER')
-
-        # Travel Sorted edges
-        perimeter_edges = perimeter_edges_from_faces(faces=face_island)
-        edge_chain = edge_chain_from_connected_edges(edges=perimeter_edges)
-        vert_chain = vert_chain_from_edge_chain(edge_chain=edge_chain)
-        if not vert_chain: continue
-
-        # Continious edge chain
-        applied_coords = []
-        if vert_chain[0] == vert_chain[-1]:
-            coord = sca_mat @ vert_chain[-1].co
-            applied_coords.append(coord)
-            spline.use_cyclic_u = True
-            set_spline_data(spline, add_new=False, coord=coord)
-
-        # Create Spline Points
-        for index, vert in enumerate(vert_chain):
-            coord = sca_mat @ vert.co
-            if coord in applied_coords: continue
-            applied_coords.append(coord)
-            set_spline_data(spline, add_new=True, coord=coord)
-
+    for face_island in face_islands_from_faces(faces=sel_faces):
+        island_edges.update(e for f in face_island for e in f.edges)
+        perimeter_edges = perimeter_edges_from_faces(faces=face_island, convert_to_list=False)
+        chains.extend(vert_chains_from_edge_pairs([(e.verts[0].index, e.verts[1].index) for e in perimeter_edges]))
     # Edge Chains
-    sel_edges = [e for e in bm.edges if e.select]
-    edge_chains = edge_chains_from_unsorted_edges(edges=sel_edges)
-    for edge_chain in edge_chains:
-
-        vert_chain = vert_chain_from_edge_chain(edge_chain=edge_chain)
-        if not vert_chain: continue
+    sel_edges = [e for e in bm.edges if e.select and e not in island_edges]
+    chains.extend(vert_chains_from_edge_pairs([(e.verts[0].index, e.verts[1].index) for e in sel_edges]))
 
+    # Splines
+    used_verts = np.unique(np.concatenate(chains)) if chains else np.empty(0, dtype=np.int32)
+    bm.verts.ensure_lookup_table()
+    coords = vert_coord_array([bm.verts[index] for index in used_verts.tolist()]) * np.array(sca, dtype=np.float64)
+    for chain in chains:
+        cyclic = len(chain) > 2 and chain[0] == chain[-1]
+        if cyclic:
+            chain = chain[:-1]
+        chain_coords = coords[np.searchsorted(used_verts, chain)]
+        _, first = np.unique(chain_coords, axis=0, return_index=True)
+        if len(first) < 2:
+            continue
         spline = curve_data.splines.new(type='BEZIER')
-        if vert_chain[0] == vert_chain[-1]:
-            spline.use_cyclic_u = True
-        
-        applied_coords = []
-        coord = sca_mat @ vert_chain[0].co
-        applied_coords.append(coord)
-        set_spline_data(spline, add_new=False, coord=coord)
-        
-        # Create Spline Points
-        for index, vert in enumerate(vert_chain):
-            coord = sca_mat @ vert.co
-            if coord in applied_coords: continue
-            set_spline_data(spline, add_new=True, coord=coord)
+        fill_bezier_spline(spline, chain_coords[np.sort(first)], cyclic=cyclic, handle_type='VECTOR')
 
     # Remove Simplified Geo and restore selection
     if simplify:
@@ -1979,7 +2320,7 @@ def ops_selections_to_curves(context, obj, simplify=True):
         for elem in original_geometry:
             elem.select = True
 
-    close_bmesh(context, obj, bm)
+    close_bmesh(context, obj, bm, session=session, mutated=MUTATION.ALL if simplify else MUTATION.SELECTION)
     del bm
     return curve_obj
 
@@ -0,0 +1,225 @@
+########################•########################
+"""                  KenzoCG                  """
+########################•########################
+
+# No bpy in here : chains are built from edge vert index pairs
+
+import numpy as np
+
+########################•########################
+"""                 ADJACENCY                 """
+########################•########################
+
+def vert_adjacency(edge_verts, vert_count):
+    '''
+    RET : (2M,) int32 edge indices grouped by vert, (N+1,) int32 offsets into them
+    IFO : Edges of vert v -> vert_edges[offsets[v] : offsets[v + 1]] in edge order
+    '''
+
+    flat_verts = np.asarray(edge_verts, dtype=np.int32).ravel()
+    vert_edges = (np.argsort(flat_verts, kind='stable') // 2).astype(np.int32)
+    offsets = np.zeros(vert_count + 1, dtype=np.int32)
+    np.cumsum(np.bincount(flat_verts, minlength=vert_count), out=offsets[1:])
+    return vert_edges, offsets
+
+########################•########################
+"""                   CHAINS                  """
+########################•########################
+
+class EdgeChains:
+    '''
+    IFO : Ordered chains of an edge set split where a vert does not have exactly two edges
+    IFO : Chain k -> edges[offsets[k] : offsets[k + 1]] || verts[vert_offsets[k] : vert_offsets[k + 1]]
+    IFO : Edge indices are rows of edge_verts || Closed chains end with their first vert
+    '''
+
+    __slots__ = ('edge_verts', 'edges', 'offsets', 'verts', 'vert_offsets', 'cyclic')
+
+    def __init__(self, edge_verts):
+        self.edge_verts = np.asarray(edge_verts, dtype=np.int32).reshape(-1, 2)
+        # Compact the vert indices
+        vert_ids, local = np.unique(self.edge_verts.ravel(), return_inverse=True)
+        local = local.reshape(-1, 2)
+        vert_edges, vert_offsets = vert_adjacency(local, len(vert_ids))
+        degrees = np.diff(vert_offsets)
+        # Scalar access for walks
+        pairs = local.tolist()
+        vert_edges = vert_edges.tolist()
+        vert_offsets = vert_offsets.tolist()
+        two_edges = (degrees == 2).tolist()
+        visited = [False] * len(pairs)
+        chain_edges = []
+        chain_verts = []
+        counts = []
+
+        def walk(vert, edge):
+            count = 0
+            chain_verts.append(vert)
+            while True:
+                visited[edge] = True
+                chain_edges.append(edge)
+                count += 1
+                v1, v2 = pairs[edge]
+                vert = v2 if v1 == vert else v1
+                chain_verts.append(vert)
+                if not two_edges[vert]:
+                    break
+                e1, e2 = vert_edges[vert_offsets[vert] : vert_offsets[vert] + 2]
+                edge = e1 if e2 == edge else e2
+                if visited[edge]:
+                    break
+            counts.append(count)
+
+        # Open chains from ends and junctions
+        for vert in np.flatnonzero(degrees != 2).tolist():
+            for edge in vert_edges[vert_offsets[vert] : vert_offsets[vert + 1]]:
+                if not visited[edge]:
+                    walk(vert, edge)
+        # Closed chains
+        for edge in range(len(pairs)):
+            if not visited[edge]:
+                walk(pairs[edge][0], edge)
+        # Arrays
+        self.edges = np.array(chain_edges, dtype=np.int32)
+        self.offsets = np.zeros(len(counts) + 1, dtype=np.int32)
+        np.cumsum(counts, out=self.offsets[1:])
+        self.verts = vert_ids[np.array(chain_verts, dtype=np.int64)].astype(np.int32)
+        self.vert_offsets = self.offsets + np.arange(len(counts) + 1, dtype=np.int32)
+        self.cyclic = self.verts[self.vert_offsets[:-1]] == self.verts[self.vert_offsets[1:] - 1]
+
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+
+    def chain(self, index):
+        return self.edges[self.offsets[index] : self.offsets[index + 1]]
+
+
+    def vert_chain(self, index):
+        return self.verts[self.vert_offsets[index] : self.vert_offsets[index + 1]]
+
+
+    def edge_chains(self):
+        offsets = self.offsets.tolist()
+        return [self.edges[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+
+    def vert_chains(self):
+        offsets = self.vert_offsets.tolist()
+        return [self.verts[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+
+    def distances(self, coords):
+        '''
+        RET : (len(verts),) distance travelled along each chain up to each vert
+        IFO : coords -> (N, 3) indexed by the vert indices of edge_verts
+        '''
+
+        if not len(self.verts):
+            return np.empty(0, dtype=np.float64)
+        points = np.asarray(coords, dtype=np.float64).reshape(-1, 3)[self.verts]
+        steps = np.zeros(len(points), dtype=np.float64)
+        steps[1:] = np.linalg.norm(points[1:] - points[:-1], axis=1)
+        starts = self.vert_offsets[:-1]
+        steps[starts] = 0
+        travelled = np.cumsum(steps)
+        return travelled - np.repeat(travelled[starts], np.diff(self.vert_offsets))
+
+
+def connected_edge_order(edge_verts):
+    '''
+    RET : (M,) edge indices walked from the first end vert, or edge 0 when there is none
+    IFO : Takes the first unwalked edge at each vert || Stops at a dead end
+    '''
+
+    edge_verts = np.asarray(edge_verts, dtype=np.int32).reshape(-1, 2)
+    if not len(edge_verts):
+        return np.empty(0, dtype=np.int32)
+    vert_ids, local = np.unique(edge_verts.ravel(), return_inverse=True)
+    vert_edges, vert_offsets = vert_adjacency(local, len(vert_ids))
+    degrees = np.diff(vert_offsets)
+    ends = np.flatnonzero(degrees[local] == 1)
+    start = ends[0] if ends.size else 0
+    pairs = local.reshape(-1, 2).tolist()
+    vert_edges = vert_edges.tolist()
+    vert_offsets = vert_offsets.tolist()
+    edge = int(start) // 2
+    vert = int(local[start])
+    visited = {edge}
+    order = [edge]
+    while True:
+        v1, v2 = pairs[edge]
+        vert = v2 if v1 == vert else v1
+        edge = next((link_edge for link_edge in vert_edges[vert_offsets[vert] : vert_offsets[vert + 1]] if link_edge not in visited), None)
+        if edge is None:
+            break
+        visited.add(edge)
+        order.append(edge)
+    return np.array(order, dtype=np.int32)
+
+
+def chain_verts(edge_verts):
+    '''
+    RET : (M+1,) vert indices of an ordered edge chain || Closed chains end with their first vert
+    '''
+
+    edge_verts = np.asarray(edge_verts, dtype=np.int32).reshape(-1, 2)
+    if len(edge_verts) < 2:
+        return edge_verts.ravel().copy()
+    prev_edges = edge_verts[:-1]
+    next_edges = edge_verts[1:]
+    first_shared = (prev_edges[:, 0] == next_edges[:, 0]) | (prev_edges[:, 0] == next_edges[:, 1])
+    shared = np.where(first_shared, prev_edges[:, 0], prev_edges[:, 1])
+    first = edge_verts[0, 1] if edge_verts[0, 0] == shared[0] else edge_verts[0, 0]
+    last = edge_verts[-1, 1] if edge_verts[-1, 0] == shared[-1] else edge_verts[-1, 0]
+    return np.concatenate(([first], shared, [last])).astype(np.int32)
+
+########################•########################
+"""                  DISTANCE                 """
+########################•########################
+
+def cumulative_lengths(points):
+    '''
+    RET : (N,) distance travelled along the points up to each point
+    '''
+
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    travelled = np.zeros(len(points), dtype=np.float64)
+    if len(points) > 1:
+        np.cumsum(np.linalg.norm(points[1:] - points[:-1], axis=1), out=travelled[1:])
+    return travelled
+
+
+def slice_by_distance(distances, start, max_distance, forward=True, cyclic=False, stops=None):
+    '''
+    RET : (K,) positions walked past start within max_distance, (K,) distance travelled to each
+    IFO : distances -> cumulative_lengths of a vert chain || Cyclic chains end with their first vert
+    IFO : stops -> (N,) bool where the walk ends after reaching the position
+    '''
+
+    distances = np.asarray(distances, dtype=np.float64)
+    count = len(distances)
+    positions = np.arange(count)
+    if not forward:
+        distances = distances[-1] - distances[::-1]
+        positions = positions[::-1]
+        start = count - 1 - start
+        stops = stops[::-1] if stops is not None else None
+    if cyclic and count > 2:
+        loop = count - 1
+        start %= loop
+        steps = np.arange(start + 1, start + loop + 1)
+        walked = np.where(steps <= loop, distances[np.minimum(steps, loop)], distances[-1] + distances[np.maximum(steps - loop, 0)])
+        steps %= loop
+    else:
+        steps = np.arange(start + 1, count)
+        walked = distances[steps]
+    walked = walked - distances[start]
+    end = np.flatnonzero(walked > max_distance)
+    end = end[0] if end.size else len(steps)
+    if stops is not None:
+        stopped = np.flatnonzero(stops[steps[:end]])
+        if stopped.size:
+            end = stopped[0] + 1
+    return positions[steps[:end]], walked[:end]
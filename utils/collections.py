@@ -4,6 +4,7 @@
 
 import bpy
 from enum import Enum
+from bpy.app.handlers import persistent
 from .misc import last_created_by_name_ext
 
 ########################•########################
@@ -97,10 +98,14 @@ def link_object_to_collection(target_collection, obj):
         target_collection.objects.link(obj)
 
 
-def unlink_object_from_all_collections(context, obj):
+def unlink_object_from_all_collections(context, obj, collections=None):
+    '''
+    IFO : Pass collections (set of scene collections) when unlinking many objects
+    '''
+
     if not obj:
         return
-    collections = scence_collections(context)
+    collections = collections if collections is not None else set(scence_collections(context))
     for collection in obj.users_collection[:]:
         if collection in collections:
             if obj.name in collection.objects:
@@ -167,38 +172,83 @@ def color_tag_collection(collection, color=Color_Tags.COLOR_05):
 """              PolyOps Collections          """
 ########################•########################
 
-def polyops_collection(context):
-    collection = get_collection(context, name='PolyOps', create_new=True)
-    color_tag_collection(collection, Color_Tags.COLOR_04)
+# KEY -> (Scene session uid, Collection name) || VAL -> Collection
+COLLECTIONS = dict()
+# KEY -> Collection session uid || VAL -> {Objects left visible by the last insert}
+SHOWN_OBJECTS = dict()
+
+
+def addon_collection(context, name='', color=Color_Tags.COLOR_04, parent_collection=None):
+    '''
+    IFO : Cached per scene, the scene is only searched when the cached collection is no longer a child of the parent
+    '''
+
+    parent_collection = parent_collection if parent_collection else context.scene.collection
+    key = (context.scene.session_uid, name)
+    collection = COLLECTIONS.get(key)
+    if collection is not None:
+        try:
+            if parent_collection.children.get(collection.name) == collection:
+                return collection
+        except ReferenceError: pass
+    collection = get_collection(context, name=name, create_new=True)
+    color_tag_collection(collection, color)
     unlink_collection(context, target_collection=collection)
-    link_collection(context, parent_collection=context.scene.collection, child_collection=collection)
+    link_collection(context, parent_collection=parent_collection, child_collection=collection)
+    COLLECTIONS[key] = collection
     return collection
 
 
+def insert_objects_into_collection(context, collection, objs=[], hide_others=lambda obj: True):
+    '''
+    IFO : Only objects not already linked solely to the collection are relinked
+    IFO : Objects shown by the previous insert are hidden unless they are in objs, the first insert sweeps the whole collection
+    '''
+
+    scene_collections = None
+    for obj in objs:
+        if len(obj.users_collection) == 1 and obj.users_collection[0] == collection:
+            continue
+        if scene_collections is None:
+            scene_collections = set(scence_collections(context))
+        unlink_object_from_all_collections(context, obj, collections=scene_collections)
+        link_object_to_collection(collection, obj)
+    key = collection.session_uid
+    shown = SHOWN_OBJECTS.get(key)
+    candidates = collection.objects if shown is None else shown
+    keep = set(objs)
+    for obj in candidates:
+        try:
+            if obj in keep or obj.name not in collection.objects or not hide_others(obj):
+                continue
+        except ReferenceError:
+            continue
+        if not obj.hide_get():
+            obj.hide_set(True)
+        if not obj.hide_render:
+            obj.hide_render = True
+    SHOWN_OBJECTS[key] = keep
+
+
+@persistent
+def reset_collection_cache(null=''):
+    COLLECTIONS.clear()
+    SHOWN_OBJECTS.clear()
+
+
+def polyops_collection(context):
+    return addon_collection(context, name='PolyOps', color=Color_Tags.COLOR_04)
+
+
 def boolean_collection(context):
-    parent_collection = polyops_collection(context)
-    collection = get_collection(context, name='Booleans', create_new=True)
-    color_tag_collection(collection, Color_Tags.COLOR_01)
-    unlink_collection(context, target_collection=collection)
-    link_collection(context, parent_collection=parent_collection, child_collection=collection)
-    return collection
+    return addon_collection(context, name='Booleans', color=Color_Tags.COLOR_01, parent_collection=polyops_collection(context))
 
 
 def utility_collection(context):
-    parent_collection = polyops_collection(context)
-    collection = get_collection(context, name='Utility', create_new=True)
-    color_tag_collection(collection, Color_Tags.COLOR_06)
-    unlink_collection(context, target_collection=collection)
-    link_collection(context, parent_collection=parent_collection, child_collection=collection)
-    return collection
+    return addon_collection(context, name='Utility', color=Color_Tags.COLOR_06, parent_collection=polyops_collection(context))
 
 
 def razor_collection(context):
-    parent_collection = polyops_collection(context)
-    collection = get_collection(context, name='Razor', create_new=True)
-    color_tag_collection(collection, Color_Tags.COLOR_05)
-    unlink_collection(context, target_collection=collection)
-    link_collection(context, parent_collection=parent_collection, child_collection=collection)
-    return collection
+    return addon_collection(context, name='Razor', color=Color_Tags.COLOR_05, parent_collection=polyops_collection(context))
 
 
@@ -3,6 +3,7 @@
 ########################•########################
 
 import bpy
+import numpy as np
 from mathutils import Vector, Matrix, Euler, Quaternion
 from .collections import link_object_to_collection
 from .context import object_mode_toggle_start, object_mode_toggle_end
@@ -22,6 +23,25 @@ def create(context, location=Vector((0,0,0)), obj_name="Curve", curve_type='CURV
     return None
 
 
+def fill_bezier_spline(spline, coords, cyclic=False, handle_type='VECTOR'):
+    '''
+    IFO : coords -> (N, 3) array || Points are added in one call and written with foreach_set
+    '''
+    points = spline.bezier_points
+    count = len(coords)
+    if count > len(points):
+        points.add(count - len(points))
+    flat = np.ascontiguousarray(coords, dtype=np.float32).ravel()
+    points.foreach_set('co', flat)
+    points.foreach_set('handle_left', flat)
+    points.foreach_set('handle_right', flat)
+    value = bpy.types.BezierSplinePoint.bl_rna.properties['handle_left_type'].enum_items[handle_type].value
+    handle_types = np.full(count, value, dtype=np.int32)
+    points.foreach_set('handle_left_type', handle_types)
+    points.foreach_set('handle_right_type', handle_types)
+    spline.use_cyclic_u = cyclic
+
+
 def delete_curve(curve):
     if isinstance(curve, bpy.types.Object) and isinstance(curve.data, bpy.types.Curve):
         data = curve.data
@@ -139,27 +159,146 @@ def transfer_props(prop_map, curve):
 
 def set_radius(curve, radius=0.5):
     if isinstance(curve, bpy.types.Object) and isinstance(curve.data, bpy.types.Curve):
-        curve.data.bevel_depth = radius
+        if curve.data.bevel_depth != radius:
+            curve.data.bevel_depth = radius
+
+
+def spline_smooth_array(curve_data):
+    values = np.empty(len(curve_data.splines), dtype=bool)
+    curve_data.splines.foreach_get('use_smooth', values)
+    return values
 
 
 def set_smooth(curve, smooth=True):
     if isinstance(curve, bpy.types.Object) and isinstance(curve.data, bpy.types.Curve):
-        for spline in curve.data.splines:
-            spline.use_smooth = smooth
+        values = spline_smooth_array(curve.data)
+        if values.size and not np.all(values == smooth):
+            values.fill(smooth)
+            curve.data.splines.foreach_set('use_smooth', values)
 
 
 def set_spline_type(curve, spline_type='BEZIER'):
     if isinstance(curve, bpy.types.Object) and isinstance(curve.data, bpy.types.Curve):
         if spline_type in {'POLY', 'BEZIER', 'NURBS'}:
             for spline in curve.data.splines:
-                spline.type = spline_type
+                if spline.type != spline_type:
+                    spline.type = spline_type
 
 
 def set_bevel_resolution(curve, resolution=0):
     if isinstance(curve, bpy.types.Object) and isinstance(curve.data, bpy.types.Curve):
-        curve.data.bevel_resolution = resolution
+        if curve.data.bevel_resolution != resolution:
+            curve.data.bevel_resolution = resolution
 
 
 def set_fill_end_caps(curve, fill_end_caps=True):
     if isinstance(curve, bpy.types.Object) and isinstance(curve.data, bpy.types.Curve):
-        curve.data.use_fill_caps = fill_end_caps
+        if curve.data.use_fill_caps != fill_end_caps:
+            curve.data.use_fill_caps = fill_end_caps
+
+########################•########################
+"""                 SNAPSHOTS                 """
+########################•########################
+
+# KEY -> Spline type || VAL -> ((Point prop, Size, dtype))
+SPLINE_POINT_PROPS = {
+    'BEZIER' : (('co', 3, np.float32), ('handle_left', 3, np.float32), ('handle_right', 3, np.float32), ('handle_left_type', 1, np.int32), ('handle_right_type', 1, np.int32), ('radius', 1, np.float32), ('tilt', 1, np.float32)),
+    'POLY'   : (('co', 4, np.float32), ('radius', 1, np.float32), ('tilt', 1, np.float32)),
+    'NURBS'  : (('co', 4, np.float32), ('radius', 1, np.float32), ('tilt', 1, np.float32)),
+}
+SPLINE_PROPS = ('order_u', 'resolution_u', 'use_endpoint_u', 'use_bezier_u')
+
+
+def spline_points(spline):
+    return spline.bezier_points if spline.type == 'BEZIER' else spline.points
+
+
+def spline_point_arrays(spline):
+    '''
+    RET : {Point prop : flat array} for the current spline type
+    '''
+    points = spline_points(spline)
+    arrays = dict()
+    for prop, size, dtype in SPLINE_POINT_PROPS.get(spline.type, ()):
+        values = np.empty(len(points) * size, dtype=dtype)
+        points.foreach_get(prop, values)
+        arrays[prop] = values
+    return arrays
+
+
+def set_spline_point_arrays(spline, arrays):
+    '''
+    RET : False if the point count no longer matches
+    '''
+    points = spline_points(spline)
+    for prop, size, dtype in SPLINE_POINT_PROPS.get(spline.type, ()):
+        values = arrays.get(prop)
+        if values is None or len(values) != len(points) * size:
+            return False
+        points.foreach_set(prop, values)
+    return True
+
+
+class CurveSnapshot:
+    '''
+    IFO : Revert state for the adjustable curve props
+    IFO : Point data is only captured before the first spline type change
+    '''
+
+    __slots__ = ('curve', 'bevel_depth', 'bevel_resolution', 'use_fill_caps', 'spline_types', 'spline_smooth', 'spline_props', 'spline_arrays')
+
+    def __init__(self, curve):
+        data = curve.data
+        self.curve = curve
+        self.bevel_depth = data.bevel_depth
+        self.bevel_resolution = data.bevel_resolution
+        self.use_fill_caps = data.use_fill_caps
+        self.spline_types = [spline.type for spline in data.splines]
+        self.spline_smooth = spline_smooth_array(data)
+        self.spline_props = None
+        self.spline_arrays = None
+
+
+    def capture_points(self):
+        if self.spline_arrays is not None:
+            return
+        splines = self.curve.data.splines
+        self.spline_props = [{prop: getattr(spline, prop) for prop in SPLINE_PROPS} for spline in splines]
+        self.spline_arrays = [spline_point_arrays(spline) for spline in splines]
+
+
+    def restore_splines(self):
+        if self.spline_arrays is None:
+            return
+        splines = self.curve.data.splines
+        if len(splines) != len(self.spline_types):
+            return
+        for spline, spline_type, props, arrays in zip(splines, self.spline_types, self.spline_props, self.spline_arrays):
+            if spline.type != spline_type:
+                spline.type = spline_type
+            if spline.type != spline_type:
+                continue
+            set_spline_point_arrays(spline, arrays)
+            for prop, value in props.items():
+                if getattr(spline, prop) != value:
+                    setattr(spline, prop, value)
+
+
+    def set_spline_type(self, spline_type='BEZIER'):
+        '''
+        IFO : Converts from the captured splines so switching back and forth is lossless
+        '''
+        self.capture_points()
+        self.restore_splines()
+        set_spline_type(self.curve, spline_type=spline_type)
+
+
+    def restore(self):
+        curve = self.curve
+        set_radius(curve, radius=self.bevel_depth)
+        set_bevel_resolution(curve, resolution=self.bevel_resolution)
+        set_fill_end_caps(curve, fill_end_caps=self.use_fill_caps)
+        self.restore_splines()
+        splines = curve.data.splines
+        if len(splines) == len(self.spline_smooth) and not np.array_equal(spline_smooth_array(curve.data), self.spline_smooth):
+            splines.foreach_set('use_smooth', self.spline_smooth)
@@ -2,70 +2,71 @@
 """                  KenzoCG                  """
 ########################•########################
 
-import bpy
-from mathutils import Vector, Matrix, Euler, Quaternion
+########################•########################
+"""                 SNAPSHOTS                 """
+########################•########################
 
+SNAPSHOT_TYPES = {'BOOLEAN', 'INT', 'FLOAT', 'STRING', 'ENUM'}
+SNAPSHOT_PROPS = dict()
 
-def capture_prop_maps(object:object):
-    ''' Copy Types : bool, int, float, str, Vector, Matrix, Euler, Quaternion '''
 
-    def recursive(object:object):
-        prop_map = dict()
-        for prop in dir(object):
-            attr = getattr(object, prop)
-            # Skip
-            if prop.startswith('__'):
-                continue
-            if prop.endswith('__'):
-                continue
-            if prop in {'bl_rna', 'rna_type'}:
-                continue
-            if callable(attr):
-                continue
-            if type(attr) in {tuple, list, dict}:
-                continue
-            # Collect
-            if type(attr) in {bool, int, float, str}:
-                prop_map[prop] = attr
-            # Collect
-            elif type(attr) in {Vector, Matrix, Euler, Quaternion}:
-                prop_map[prop] = attr.copy()
-            # Recursive
-            elif type(attr) == bpy.types.bpy_prop_collection:
-                collection_maps = []
-                for iterative_attr in attr:
-                    collection_maps.append(recursive(iterative_attr))
-                prop_map[prop] = collection_maps
-            # Recursive
-            else:
-                prop_map[prop] = recursive(attr)
-        return prop_map
-    return recursive(object)
+def rna_struct_is_id(rna):
+    while rna is not None:
+        if rna.identifier == 'ID':
+            return True
+        rna = rna.base
+    return False
 
 
-def transfer_props(prop_map:dict, object:object):
-    def recursive(prop_map, object):
-        for prop, value in prop_map.items():
-            # Skip
-            if type(prop) != str:
+def snapshot_props(rna_struct):
+    '''
+    RET : ((identifier, is_array), ...) editable scalar, vector and ID pointer props
+    IFO : Cached per RNA type, the bl_rna walk only happens once
+    '''
+
+    key = rna_struct.bl_rna.identifier
+    props = SNAPSHOT_PROPS.get(key)
+    if props is not None:
+        return props
+    collected = []
+    for prop in rna_struct.bl_rna.properties:
+        if prop.identifier == 'rna_type' or prop.is_readonly:
+            continue
+        if prop.type in SNAPSHOT_TYPES:
+            if prop.type in {'BOOLEAN', 'INT', 'FLOAT'} and prop.array_dimensions[1] > 0:
                 continue
-            if hasattr(object, prop):
-                attr = getattr(object, prop)
-                # Set
-                if type(attr) in {bool, int, float, str, Vector, Matrix, Euler, Quaternion}:
-                    try:
-                        setattr(object, prop, value)
-                    except:
-                        pass
-                # Recursive
-                elif type(attr) == bpy.types.bpy_prop_collection:
-                    for index, iterative_attr in enumerate(attr):
-                        if index >= len(value):
-                            break
-                        iterative_map = value[index]
-                        recursive(iterative_map, iterative_attr)
-                # Recursive
-                elif type(value) == dict:
-                    recursive(value, attr)
-    recursive(prop_map, object)
+            collected.append((prop.identifier, prop.type in {'BOOLEAN', 'INT', 'FLOAT'} and prop.array_length > 0))
+        elif prop.type == 'POINTER' and rna_struct_is_id(prop.fixed_type):
+            collected.append((prop.identifier, False))
+    props = tuple(collected)
+    SNAPSHOT_PROPS[key] = props
+    return props
+
+
+class PropSnapshot:
+    __slots__ = ('props', 'values')
+
+    def __init__(self, rna_struct):
+        self.props = snapshot_props(rna_struct)
+        self.values = tuple(tuple(getattr(rna_struct, identifier)) if is_array else getattr(rna_struct, identifier) for identifier, is_array in self.props)
 
+
+    def restore(self, rna_struct):
+        '''
+        RET : Count of written props
+        IFO : Only props that differ from the snapshot are written
+        '''
+
+        written = 0
+        for (identifier, is_array), value in zip(self.props, self.values):
+            current = getattr(rna_struct, identifier)
+            if is_array:
+                current = tuple(current)
+            if current == value:
+                continue
+            try:
+                setattr(rna_struct, identifier, value)
+                written += 1
+            except:
+                pass
+        return written
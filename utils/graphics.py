@@ -5,6 +5,7 @@
 import bpy
 import gpu
 import blf
+import time
 from bl_math import lerp
 from math import cos, sin, radians, pi, ceil, inf
 from mathutils import geometry, Vector, Matrix, Euler, Quaternion
@@ -21,6 +22,44 @@ from .screen import screen_factor, pixels_per_unit_at_depth
 UNIFORM_COLOR = gpu.shader.from_builtin('UNIFORM_COLOR')
 SMOOTH_COLOR = gpu.shader.from_builtin('SMOOTH_COLOR')
 
+
+def gen_fade_shader():
+    '''
+    IFO : Alpha is computed on the GPU from (time - start_time) / duration
+    IFO : Times are relative to FADE_EPOCH to stay inside float precision
+    '''
+    info = gpu.types.GPUShaderCreateInfo()
+    info.push_constant('MAT4', "ModelViewProjectionMatrix")
+    info.push_constant('VEC3', "color_start")
+    info.push_constant('VEC3', "color_end")
+    info.push_constant('FLOAT', "start_time")
+    info.push_constant('FLOAT', "duration")
+    info.push_constant('FLOAT', "alpha_scale")
+    info.push_constant('FLOAT', "time")
+    info.vertex_in(0, 'VEC3', "pos")
+    info.fragment_out(0, 'VEC4', "FragColor")
+    info.vertex_source(
+        "void main()"
+        "{"
+        "  gl_Position = ModelViewProjectionMatrix * vec4(pos, 1.0);"
+        "}")
+    info.fragment_source(
+        "void main()"
+        "{"
+        "  float alpha = clamp(1.0 - ((time - start_time) / max(duration, 0.0001)), 0.0, 1.0);"
+        "  FragColor = vec4(mix(color_end, color_start, alpha), alpha * alpha_scale);"
+        "}")
+    return gpu.shader.create_from_info(info)
+
+
+FADE_COLOR = gen_fade_shader()
+FADE_EPOCH = time.time()
+
+
+def fade_time():
+    return time.time() - FADE_EPOCH
+
+
 class COLORS:
     # --- FLAT --- #
     WHITE  = Vector((1.0, 1.0, 1.0, 1.0))
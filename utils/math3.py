@@ -148,6 +148,35 @@ def snap_point_to_vector(point, vector, origin, increment):
     snapped_point = origin + direction * snapped_length
     return snapped_point
 
+########################•########################
+"""                   PLANES                  """
+########################•########################
+
+def intersect_lines_planes(points, directions, plane_cos, plane_nos, epsilon=1e-6):
+    '''
+    RET : (N,3) intersections of the lines through points along directions || (N,) bool where the line was not parallel
+    IFO : Plane arrays broadcast || Parallel or zero length lines keep their point
+    '''
+
+    lengths = np.linalg.norm(directions, axis=1)
+    valid = lengths > epsilon
+    directions = np.divide(directions, lengths[:, None], out=np.zeros_like(directions), where=valid[:, None])
+    denoms = np.einsum('ij,ij->i', directions, np.broadcast_to(plane_nos, directions.shape))
+    valid &= np.abs(denoms) > epsilon
+    factors = np.einsum('ij,ij->i', plane_cos - points, np.broadcast_to(plane_nos, points.shape))
+    factors = np.divide(factors, denoms, out=np.zeros_like(factors), where=valid)
+    return points + directions * factors[:, None], valid
+
+
+def project_points_to_planes(points, plane_cos, plane_nos):
+    '''
+    RET : (N,3) points moved along the plane normals onto the planes
+    IFO : Plane normals must be unit length
+    '''
+
+    offsets = np.einsum('ij,ij->i', points - plane_cos, np.broadcast_to(plane_nos, points.shape))
+    return points - plane_nos * offsets[:, None]
+
 ########################•########################
 """                 QUATERNION                """
 ########################•########################
@@ -44,14 +44,19 @@ def mesh_obj_is_valid(context, obj, check_visible=True, check_select=False, chec
 """                 MESH COPY                 """
 ########################•########################
 
-def duplicate_mesh_in_place(context, target_obj, ensure_updated=True):
+def duplicate_mesh_in_place(context, target_obj, ensure_updated=True, link_data=False):
+    '''
+    IFO : link_data → the duplicate shares the mesh datablock of the target
+    '''
+
     if not (isinstance(target_obj, bpy.types.Object) and isinstance(target_obj.data, bpy.types.Mesh)):
         return
     if ensure_updated:
         if target_obj.data.is_editmode:
             target_obj.update_from_editmode()
     obj = target_obj.copy()
-    obj.data = target_obj.data.copy()
+    if not link_data:
+        obj.data = target_obj.data.copy()
     obj.animation_data_clear()
     collection = None
     # Place directly into the same collection
@@ -152,18 +157,52 @@ def vgroup_data_map(obj):
 """                  SHADING                  """
 ########################•########################
 
+def polygon_smooth_array(mesh):
+    '''
+    RET : (N,) bool array of polygon use_smooth
+    '''
+
+    values = np.empty(len(mesh.polygons), dtype=bool)
+    mesh.polygons.foreach_get('use_smooth', values)
+    return values
+
+
+def set_polygon_smooth_array(mesh, values):
+    '''
+    RET : True if any polygon changed
+    IFO : Values shorter than the polygon count only cover the leading polygons
+    '''
+
+    current = polygon_smooth_array(mesh)
+    count = min(len(current), len(values))
+    if np.array_equal(current[:count], values[:count]):
+        return False
+    current[:count] = values[:count]
+    mesh.polygons.foreach_set('use_smooth', current)
+    mesh.update()
+    return True
+
+
 def shade_polygons(obj, use_smooth=True):
     if isinstance(obj, bpy.types.Object) and isinstance(obj.data, bpy.types.Mesh):
         mesh = obj.data
         if mesh.is_editmode:
             bm = bmesh.from_edit_mesh(mesh)
+            changed = False
             for face in bm.faces:
-                face.smooth = use_smooth
-            bmesh.update_edit_mesh(mesh)
-            obj.update_from_editmode()
+                if face.smooth != use_smooth:
+                    face.smooth = use_smooth
+                    changed = True
+            if changed:
+                bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
+                obj.update_from_editmode()
         else:
-            for polygon in obj.data.polygons:
-                polygon.use_smooth = use_smooth
+            values = polygon_smooth_array(mesh)
+            if not values.size or np.all(values == use_smooth):
+                return
+            values.fill(use_smooth)
+            mesh.polygons.foreach_set('use_smooth', values)
+            mesh.update()
 
 
 def any_polygons_smooth(obj, ensure_updated=True):
@@ -171,11 +210,122 @@ def any_polygons_smooth(obj, ensure_updated=True):
         if ensure_updated:
             if obj.data.is_editmode:
                 obj.update_from_editmode()
-        for polygon in obj.data.polygons:
-            if polygon.use_smooth:
-                return True
+        return bool(np.any(polygon_smooth_array(obj.data)))
     return False
 
+########################•########################
+"""                 ATTRIBUTES                """
+########################•########################
+
+def attribute_array(mesh, name, domain='EDGE', data_type='FLOAT'):
+    '''
+    RET : (N,) array of the attribute values or zeros when the mesh does not have it
+    '''
+
+    count = len(mesh.edges) if domain == 'EDGE' else len(mesh.vertices)
+    values = np.zeros(count, dtype=bool if data_type == 'BOOLEAN' else np.float32)
+    attr = mesh.attributes.get(name)
+    if attr is not None and attr.domain == domain and attr.data_type == data_type:
+        attr.data.foreach_get('value', values)
+    return values
+
+
+def set_attribute_array(mesh, name, values, domain='EDGE', data_type='FLOAT'):
+    '''
+    RET : True if any value changed
+    IFO : Missing attributes are only created when a value is set
+    IFO : An existing attribute of another domain or type is user data and is left untouched
+    '''
+
+    attr = mesh.attributes.get(name)
+    if attr is not None and (attr.domain != domain or attr.data_type != data_type):
+        return False
+    if attr is None:
+        if not np.any(values):
+            return False
+        attr = mesh.attributes.new(name, data_type, domain)
+    elif np.array_equal(attribute_array(mesh, name, domain, data_type), values):
+        return False
+    attr.data.foreach_set('value', values)
+    return True
+
+
+def edge_seam_array(mesh):
+    values = np.empty(len(mesh.edges), dtype=bool)
+    mesh.edges.foreach_get('use_seam', values)
+    return values
+
+
+def set_edge_seam_array(mesh, values):
+    if np.array_equal(edge_seam_array(mesh), values):
+        return False
+    mesh.edges.foreach_set('use_seam', values)
+    return True
+
+
+def select_arrays(mesh):
+    '''
+    RET : (N,) vert select, (M,) edge select
+    '''
+
+    verts = np.empty(len(mesh.vertices), dtype=bool)
+    mesh.vertices.foreach_get('select', verts)
+    edges = np.empty(len(mesh.edges), dtype=bool)
+    mesh.edges.foreach_get('select', edges)
+    return verts, edges
+
+########################•########################
+"""                 TOPOLOGY                  """
+########################•########################
+
+def edge_vert_array(mesh):
+    '''
+    RET : (M, 2) int32 edge vert indices
+    '''
+
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get('vertices', edges)
+    return edges.reshape(-1, 2)
+
+
+def loop_edge_array(mesh):
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get('edge_index', loop_edges)
+    return loop_edges
+
+
+def edge_face_counts(mesh):
+    '''
+    RET : (M,) number of faces using each edge
+    '''
+
+    return np.bincount(loop_edge_array(mesh), minlength=len(mesh.edges))
+
+
+def verts_on_axis_planes(coords, x=False, y=False, z=False, epsilon=0.0001):
+    '''
+    RET : (N, 3) bool where the vert lies on the enabled world axis planes (Local Space)
+    '''
+
+    on_planes = np.zeros(coords.shape, dtype=bool)
+    for axis, enabled in enumerate((x, y, z)):
+        if enabled:
+            on_planes[:, axis] = np.abs(coords[:, axis]) <= epsilon
+    return on_planes
+
+
+def verts_under_axis_planes(coords, signs=(0, 0, 0), epsilon=0.0001):
+    '''
+    RET : (N,) bool where the vert is on or below any enabled world axis plane (Local Space)
+    IFO : signs -> Plane normal direction per axis || 0 skips the axis
+    '''
+
+    under = np.zeros(len(coords), dtype=bool)
+    for axis, sign in enumerate(signs):
+        if sign:
+            under |= coords[:, axis] * sign <= epsilon
+    return under
+
 ########################•########################
 """                    GEO                    """
 ########################•########################
@@ -310,9 +460,58 @@ def face_triangle_coords_map_from_polygon_indices(obj, polygon_indices=[], matri
 """                  HANDLES                  """
 ########################•########################
 
+# KEY -> Backup mesh name || VAL -> (Vertex count, Owner) : Ordered from least to most recently used
+BACKUP_MESHES = dict()
+
+
+def track_backup_mesh(mesh, owner=None):
+    '''
+    IFO : Meshes without an owner are never evicted
+    IFO : Owners must implement drop_backup(mesh)
+    '''
+
+    mesh.ps.is_backup = True
+    BACKUP_MESHES.pop(mesh.name, None)
+    BACKUP_MESHES[mesh.name] = (len(mesh.vertices), owner)
+    if owner is not None:
+        enforce_backup_budget(keep=mesh.name)
+
+
+def touch_backup_mesh(mesh):
+    entry = BACKUP_MESHES.pop(mesh.name, None)
+    if entry is not None:
+        BACKUP_MESHES[mesh.name] = entry
+
+
+def remove_backup_mesh(mesh):
+    BACKUP_MESHES.pop(mesh.name, None)
+    if mesh.name in bpy.data.meshes:
+        bpy.data.meshes.remove(mesh, do_unlink=True, do_id_user=True, do_ui_user=True)
+
+
+def enforce_backup_budget(keep=''):
+    budget = user_prefs().settings.undo_vert_budget
+    if budget <= 0:
+        return
+    total = sum([count for count, _ in BACKUP_MESHES.values()])
+    for name, (count, owner) in list(BACKUP_MESHES.items()):
+        if total <= budget:
+            break
+        if owner is None or name == keep:
+            continue
+        total -= count
+        BACKUP_MESHES.pop(name)
+        mesh = bpy.data.meshes.get(name)
+        if mesh is not None:
+            owner.drop_backup(mesh)
+
+
 @persistent
 def remove_backup_meshes(dummy):
-    for mesh in bpy.data.meshes[:]:
-        if mesh.ps.is_backup:
-            if mesh.users == 0:
-                bpy.data.meshes.remove(mesh)
+    for name in list(BACKUP_MESHES):
+        mesh = bpy.data.meshes.get(name)
+        if mesh is None:
+            BACKUP_MESHES.pop(name)
+        elif mesh.ps.is_backup and mesh.users == 0:
+            BACKUP_MESHES.pop(name)
+            bpy.data.meshes.remove(mesh)
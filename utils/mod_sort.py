@@ -0,0 +1,211 @@
+########################•########################
+"""                  KenzoCG                  """
+########################•########################
+
+# No bpy in here : the planner only works on descriptors and plain options
+
+from .algos import reorder_moves
+
+########################•########################
+"""                   TYPES                   """
+########################•########################
+
+class TYPES:
+    ARRAY = 'ARRAY'
+    BEVEL = 'BEVEL'
+    BOOLEAN = 'BOOLEAN'
+    CLOTH = 'CLOTH'
+    COLLISION = 'COLLISION'
+    DYNAMIC_PAINT = 'DYNAMIC_PAINT'
+    EDGE_SPLIT = 'EDGE_SPLIT'
+    EXPLODE = 'EXPLODE'
+    FLUID = 'FLUID'
+    MIRROR = 'MIRROR'
+    NODES = 'NODES'
+    OCEAN = 'OCEAN'
+    PARTICLE_INSTANCE = 'PARTICLE_INSTANCE'
+    PARTICLE_SYSTEM = 'PARTICLE_SYSTEM'
+    SIMPLE_DEFORM = 'SIMPLE_DEFORM'
+    SOFT_BODY = 'SOFT_BODY'
+    SOLIDIFY = 'SOLIDIFY'
+    SUBSURF = 'SUBSURF'
+    TRIANGULATE = 'TRIANGULATE'
+    WEIGHTED_NORMAL = 'WEIGHTED_NORMAL'
+    WELD = 'WELD'
+    WIREFRAME = 'WIREFRAME'
+    UNSORTABLE = {SOFT_BODY}
+    SORTABLE_TOP = {MIRROR, BEVEL, SOLIDIFY, SIMPLE_DEFORM, EDGE_SPLIT, SUBSURF}
+    SORTABLE_BOT = {MIRROR, WELD, NODES, WEIGHTED_NORMAL, ARRAY, SIMPLE_DEFORM, TRIANGULATE}
+
+########################•########################
+"""                DESCRIPTOR                 """
+########################•########################
+
+class ModSortDesc:
+    '''
+    IFO : Flat copy of everything the sort rules read from a modifier
+    '''
+
+    __slots__ = ('name', 'type', 'bisect', 'has_object', 'has_vgroup', 'edge_sharp', 'auto_smooth')
+
+    def __init__(self, name='', type='', bisect=False, has_object=False, has_vgroup=False, edge_sharp=False, auto_smooth=False):
+        self.name = name
+        self.type = type
+        self.bisect = bisect
+        self.has_object = has_object
+        self.has_vgroup = has_vgroup
+        self.edge_sharp = edge_sharp
+        self.auto_smooth = auto_smooth
+
+########################•########################
+"""                  PLANNER                  """
+########################•########################
+
+def plan_top(descs, indices, options):
+    if not any([options.top_mirror, options.top_bevel, options.top_solidify, options.top_deform, options.top_edge_split, options.top_subsurf]):
+        return []
+    mirrors = []
+    others = []
+    counts = {TYPES.MIRROR:0, TYPES.BEVEL:0, TYPES.SOLIDIFY:0, TYPES.SIMPLE_DEFORM:0, TYPES.EDGE_SPLIT:0, TYPES.SUBSURF:0}
+    for index in indices:
+        desc = descs[index]
+        if desc.type == TYPES.MIRROR:
+            if options.top_mirror:
+                if options.top_mirror_check_no_bisect and desc.bisect:
+                    continue
+                if options.top_mirror_check_no_object and desc.has_object:
+                    continue
+                if counts[TYPES.MIRROR] < options.top_mirror_count:
+                    counts[TYPES.MIRROR] += 1
+                    mirrors.insert(0, index)
+        elif desc.type == TYPES.BEVEL:
+            if options.top_bevel:
+                if options.top_bevel_require_vgroup and not desc.has_vgroup:
+                    continue
+                if counts[TYPES.BEVEL] < options.top_bevel_count:
+                    counts[TYPES.BEVEL] += 1
+                    others.append(index)
+        elif desc.type == TYPES.SOLIDIFY:
+            if options.top_solidify:
+                if options.top_solidify_require_vgroup and not desc.has_vgroup:
+                    continue
+                if counts[TYPES.SOLIDIFY] < options.top_solidify_count:
+                    counts[TYPES.SOLIDIFY] += 1
+                    others.append(index)
+        elif desc.type == TYPES.SIMPLE_DEFORM:
+            if options.top_deform:
+                if options.top_deform_require_vgroup and not desc.has_vgroup:
+                    continue
+                if counts[TYPES.SIMPLE_DEFORM] < options.top_deform_count:
+                    counts[TYPES.SIMPLE_DEFORM] += 1
+                    others.append(index)
+        elif desc.type == TYPES.EDGE_SPLIT:
+            if options.top_edge_split:
+                if options.top_edge_split_require_sharp and not desc.edge_sharp:
+                    continue
+                if counts[TYPES.EDGE_SPLIT] < options.top_edge_split_count:
+                    counts[TYPES.EDGE_SPLIT] += 1
+                    others.append(index)
+        elif desc.type == TYPES.SUBSURF:
+            if options.top_subsurf:
+                if counts[TYPES.SUBSURF] < options.top_subsurf_count:
+                    counts[TYPES.SUBSURF] += 1
+                    others.append(index)
+    return mirrors + others
+
+
+def plan_mid(descs, indices, options):
+    '''
+    RET : indices with the booleans below the last boolean target moved right above it
+    '''
+    targets = set()
+    if options.boolean_to_bevel: targets.add(TYPES.BEVEL)
+    if options.boolean_to_solidify: targets.add(TYPES.SOLIDIFY)
+    if options.boolean_to_subsurf: targets.add(TYPES.SUBSURF)
+    if options.boolean_to_mirror: targets.add(TYPES.MIRROR)
+    if options.boolean_to_array: targets.add(TYPES.ARRAY)
+    booleans = []
+    for position in range(len(indices) - 1, -1, -1):
+        desc = descs[indices[position]]
+        if desc.type in targets:
+            if not booleans:
+                return indices
+            booleans.reverse()
+            moved = set(booleans)
+            head = indices[:position]
+            tail = [index for index in indices[position:] if index not in moved]
+            return head + booleans + tail
+        elif desc.type == TYPES.BOOLEAN:
+            booleans.append(indices[position])
+    return indices
+
+
+def plan_bot(descs, indices, options):
+    '''
+    RET : indices of the last modifier per enabled bottom rule, in bottom order
+    '''
+    rules = [
+        (options.bottom_mirror, lambda desc: desc.type == TYPES.MIRROR),
+        (options.bottom_weld, lambda desc: desc.type == TYPES.WELD),
+        (options.bottom_autosmooth, lambda desc: desc.type == TYPES.NODES and desc.auto_smooth),
+        (options.bottom_weighted_normal, lambda desc: desc.type == TYPES.WEIGHTED_NORMAL),
+        (options.bottom_array, lambda desc: desc.type == TYPES.ARRAY),
+        (options.bottom_deform, lambda desc: desc.type == TYPES.SIMPLE_DEFORM),
+        (options.bottom_triangulate, lambda desc: desc.type == TYPES.TRIANGULATE)]
+    bottom = []
+    for enabled, match in rules:
+        if not enabled:
+            continue
+        for index in reversed(indices):
+            if index not in bottom and match(descs[index]):
+                bottom.append(index)
+                break
+    return bottom
+
+
+def plan_mod_order(descs, options):
+    '''
+    RET : [index] where the value at position k is the current index of the modifier that belongs at k
+    IFO : options needs the attributes of PS_PROPS_Sort
+    '''
+    count = len(descs)
+    order = list(range(count))
+    if count < 2 or not options.sort_enabled:
+        return order
+
+    ignore_str = options.ignore_sort_str.replace(" ", "")
+    ignored = [index for index in order if ignore_str and ignore_str in descs[index].name]
+    ignored_set = set(ignored)
+    sortable = [index for index in order if index not in ignored_set]
+
+    # Pinned first
+    head = []
+    if descs[0].type in TYPES.UNSORTABLE and 0 in sortable:
+        head.append(0)
+        sortable.remove(0)
+
+    # Top
+    top = plan_top(descs, [index for index in sortable if descs[index].type in TYPES.SORTABLE_TOP], options)
+    top_set = set(top)
+    rest = [index for index in sortable if index not in top_set]
+
+    # Mid
+    rest = plan_mid(descs, rest, options)
+
+    # Bottom
+    bottom = plan_bot(descs, rest, options)
+    bottom_set = set(bottom)
+    rest = [index for index in rest if index not in bottom_set]
+
+    # Ignored keep their index
+    order = head + top + rest + bottom
+    for index in ignored:
+        order.insert(index, index)
+    return order
+
+
+def plan_mod_moves(descs, options):
+    '''
+    RET : [(from_index, to_index)] the fewest moves that sort the stack
+    '''
+    return reorder_moves(plan_mod_order(descs, options))
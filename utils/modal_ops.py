@@ -13,14 +13,14 @@ from bpy_extras.view3d_utils import location_3d_to_region_2d
 from mathutils.geometry import intersect_point_line
 from .addon import user_prefs
 from .bme import OPTIONS, HitInfo, BmeshController
-from .bmu import ops_trace_edges
+from .bmu import edge_graph_from_mesh
 from .context import set_component_selection, object_mode_toggle_reset, object_mode_toggle_start, object_mode_toggle_end
 from .event import LMB_press, RMB_press, reset_mouse_drag, pass_through, confirmed, cancelled
 from .graphics import Label2D, draw_circle_2d, draw_label, draw_line, draw_arrow_3d, draw_point, draw_text, label_dims, max_text_height, draw_action_line_3d
 from .modal_status import OPS_STATUS, MODAL_STATUS
-from .mesh import shade_polygons, any_polygons_smooth
+from .mesh import shade_polygons, any_polygons_smooth, polygon_smooth_array, set_polygon_smooth_array
 from .modifiers import last_auto_smooth_mod, last_auto_smooth_angle, last_weighted_normal_mod, setup_shading, referenced_booleans
-from .object import apply_scale, scale_obj, get_visible_mesh_obj_by_name
+from .object import apply_scale, get_visible_mesh_obj_by_name, ScaleController
 from .ray import cast_onto_plane, cast_to_view_plane_pick_side, cast_onto_view_plane_with_angle_from_point, cast_onto_view_plane
 from .screen import screen_factor, pixels_per_unit_at_depth
 from .notifications import init as notify
@@ -109,13 +109,13 @@ class StandardOps:
         self.objs = [obj for obj in objs if isinstance(obj, bpy.types.Object)]
         # Objects
         self.show_wire = any([obj.show_wire for obj in objs])
-        self.scale_map = {obj: obj.scale.copy() for obj in self.objs} if track_scale else {}
+        self.scale_controller = ScaleController(self.objs) if track_scale else None
         self.wire_display_map = {obj: obj.show_wire for obj in self.objs}
         self.obj_shading_mods_map = {obj:{'USE_SMOOTH':any_polygons_smooth(obj), 'USE_AUTO_SMOOTH':bool(last_auto_smooth_mod(obj)), 'ANGLE':last_auto_smooth_angle(obj), 'USE_WEIGHTED_NORMAL':bool(last_weighted_normal_mod(obj))} for obj in self.objs} if track_shading_mods else {}
         # Meshes
         mesh_objs = [obj for obj in self.objs if obj.type == 'MESH']
         self.vgroup_map = {obj : {vgroup for vgroup in obj.vertex_groups} for obj in mesh_objs} if track_vgroups else {}
-        self.mesh_poly_shading_map = {obj.data.name : {polygon.index : polygon.use_smooth for polygon in obj.data.polygons} for obj in mesh_objs} if track_polygon_shading else {}
+        self.mesh_poly_shading_map = {obj.data.name : polygon_smooth_array(obj.data) for obj in mesh_objs} if track_polygon_shading else {}
         # Curves
         curve_objs = [obj for obj in self.objs if obj.type == 'CURVE']
         self.spline_shading_map = {obj : {index : spline.use_smooth for index, spline in enumerate(obj.data.splines)} for obj in curve_objs} if track_spline_shading else {}
@@ -151,8 +151,11 @@ class StandardOps:
 
 
     def set_object_scale(self):
-        for obj in self.objs:
-            apply_scale(obj)
+        if self.scale_controller:
+            self.scale_controller.apply()
+        else:
+            for obj in self.objs:
+                apply_scale(obj)
 
 
     def set_shading(self, specified_objs=[], use_smooth=True, use_weighted_normal=True, angle=radians(30), smooth_boolean_objs=True):
@@ -165,15 +168,13 @@ class StandardOps:
                     if self.mesh_poly_shading_map:
                         mesh = boolean.data
                         if mesh.name not in self.mesh_poly_shading_map:
-                            self.mesh_poly_shading_map[mesh.name] = {polygon.index : polygon.use_smooth for polygon in mesh.polygons}
+                            self.mesh_poly_shading_map[mesh.name] = polygon_smooth_array(mesh)
                     shade_polygons(boolean, use_smooth=use_smooth)
 
 
     def revert_object_scale(self):
-        for obj, scale in self.scale_map.items():
-            if obj and isinstance(obj, bpy.types.Object):
-                if obj.scale != scale:
-                    scale_obj(obj, scale)
+        if self.scale_controller:
+            self.scale_controller.revert()
 
 
     def revert_shading(self):
@@ -182,13 +183,9 @@ class StandardOps:
             if obj and isinstance(obj, bpy.types.Object):
                 setup_shading(obj, use_smooth=shade_settings['USE_SMOOTH'], auto_smooth=shade_settings['USE_AUTO_SMOOTH'], weighted_normal=shade_settings['USE_WEIGHTED_NORMAL'], angle=shade_settings['ANGLE'])
         # Meshes
-        for mesh_name, poly_shading_map in self.mesh_poly_shading_map.items():
+        for mesh_name, poly_shading in self.mesh_poly_shading_map.items():
             if mesh_name in bpy.data.meshes:
-                mesh = bpy.data.meshes[mesh_name]
-                polygons = mesh.polygons
-                for polygon in polygons:
-                    if polygon.index in poly_shading_map:
-                        polygon.use_smooth = poly_shading_map[polygon.index]
+                set_polygon_smooth_array(bpy.data.meshes[mesh_name], poly_shading)
         # Curves
         for obj, spline_shading_map in self.spline_shading_map.items():
             if obj and isinstance(obj, bpy.types.Object):
@@ -592,6 +589,8 @@ class EdgeLoopSelectV3D:
         self.break_at_intersections = True
         # Event
         self.mouse = Vector((0,0))
+        # KEY -> Mesh name || VAL -> (Topology key, EdgeGraph)
+        self.edge_graphs = dict()
         self.clear_mesh_data()
 
 
@@ -656,11 +655,17 @@ class EdgeLoopSelectV3D:
         hit_co_ws = hit_info.edge_co_ws_nearest
         mat_ws = hit_info.mat_ws
 
+        # Edge Graph || Rebuilt when the hovered mesh changes
+        graph_key = (len(mesh.vertices), len(mesh.edges), len(mesh.loops))
+        cached = self.edge_graphs.get(mesh.name)
+        if cached is None or cached[0] != graph_key:
+            cached = (graph_key, edge_graph_from_mesh(mesh))
+            self.edge_graphs[mesh.name] = cached
+        graph = cached[1]
+
         # Casted Edge Data
         index_direction = -1
-        edge = mesh.edges[edge_index]
-        v1 = mat_ws @ mesh.vertices[edge.vertices[0]].co
-        v2 = mat_ws @ mesh.vertices[edge.vertices[1]].co
+        v1, v2 = (Vector(co) for co in graph.edge_lines([edge_index], mat_ws))
 
         # Directional Vert
         ret = intersect_point_line(hit_co_ws, v1, v2)
@@ -672,13 +677,10 @@ class EdgeLoopSelectV3D:
                 index_direction = 1
 
         # TRACE || Capture
-        self.edge_indices = ops_trace_edges(context, obj,
+        self.edge_indices = graph.trace_from_edge(edge_index,
+            vert_dir_index=index_direction,
             step_limit=self.step_limit,
             angle_limit=self.angle_limit,
-            select_traced=False,
-            from_selected=False,
-            from_index=edge_index,
-            vert_dir_index=index_direction,
             break_at_intersections=self.break_at_intersections,
             break_at_boundary=self.break_at_boundary)
         self.obj_name = obj.name
@@ -700,22 +702,15 @@ class EdgeLoopSelectV3D:
         self.edge_p1_batch = batch_for_shader(UNIFORM_COLOR, 'POINTS', {"pos": [v1]})
         self.edge_p2_batch = batch_for_shader(UNIFORM_COLOR, 'POINTS', {"pos": [v2]})
         # BATCH || Traced Edges
-        lines = []
-        for index in self.edge_indices:
-            if index == edge_index:
-                continue
-            edge = mesh.edges[index]
-            v1 = mat_ws @ mesh.vertices[edge.vertices[0]].co
-            lines.append(v1)
-            v2 = mat_ws @ mesh.vertices[edge.vertices[1]].co
-            lines.append(v2)
+        traced = [index for index in self.edge_indices if index != edge_index]
+        lines = graph.edge_lines(traced, mat_ws) if traced else []
         self.edges_L_batch = None
         self.edges_C_batch = None
         self.edges_R_batch = None
         if index_direction < 0:
             self.edges_C_batch = batch_for_shader(UNIFORM_COLOR, 'LINES', {"pos": lines})
         elif index_direction < 1:
-            self.edges_L_batch = batch_for_shader(UNIFORM_COLOR, 'LINES', {"pos": lines})        
+            self.edges_L_batch = batch_for_shader(UNIFORM_COLOR, 'LINES', {"pos": lines})
         elif index_direction > 0:
             self.edges_R_batch = batch_for_shader(UNIFORM_COLOR, 'LINES', {"pos": lines})
 
@@ -8,11 +8,13 @@ from math import radians
 from ..resources.blends import autosmooth_nodes
 from .bmu import query_any_polygons_shaded_smooth, query_sel_vert_indices
 from .context import object_mode_toggle_start, object_mode_toggle_end
-from .collections import boolean_collection, link_object_to_collection, collection_path_settings, unlink_object_from_all_collections
-from .data import capture_prop_maps, transfer_props
+from .collections import boolean_collection, collection_path_settings, insert_objects_into_collection
+from .data import PropSnapshot
 from .mesh import duplicate_mesh_in_place, create_vgroup, vgroup_data_map, shade_polygons
-from .object import parent_object, wire_display, obj_has_flat_dim
+from .object import parent_object, wire_display, obj_has_flat_dim, swap_mesh_delete
 from .addon import user_prefs
+from .mod_sort import TYPES, ModSortDesc, plan_mod_moves
+from .ref_graph import boolean_objs_from_mods, forget_object_refs
 from .guards import except_guard
 
 ########################•########################
@@ -108,32 +110,20 @@ def setup_shading(obj, use_smooth=True, auto_smooth=True, weighted_normal=True,
 """                  MANAGMENT                """
 ########################•########################
 
-class TYPES:
-    ARRAY = 'ARRAY'
-    BEVEL = 'BEVEL'
-    BOOLEAN = 'BOOLEAN'
-    CLOTH = 'CLOTH'
-    COLLISION = 'COLLISION'
-    DYNAMIC_PAINT = 'DYNAMIC_PAINT'
-    EDGE_SPLIT = 'EDGE_SPLIT'
-    EXPLODE = 'EXPLODE'
-    FLUID = 'FLUID'
-    MIRROR = 'MIRROR'
-    NODES = 'NODES'
-    OCEAN = 'OCEAN'
-    PARTICLE_INSTANCE = 'PARTICLE_INSTANCE'
-    PARTICLE_SYSTEM = 'PARTICLE_SYSTEM'
-    SIMPLE_DEFORM = 'SIMPLE_DEFORM'
-    SOFT_BODY = 'SOFT_BODY'
-    SOLIDIFY = 'SOLIDIFY'
-    SUBSURF = 'SUBSURF'
-    TRIANGULATE = 'TRIANGULATE'
-    WEIGHTED_NORMAL = 'WEIGHTED_NORMAL'
-    WELD = 'WELD'
-    WIREFRAME = 'WIREFRAME'
-    UNSORTABLE = {SOFT_BODY}
-    SORTABLE_TOP = {MIRROR, BEVEL, SOLIDIFY, SIMPLE_DEFORM, EDGE_SPLIT, SUBSURF}
-    SORTABLE_BOT = {MIRROR, WELD, NODES, WEIGHTED_NORMAL, ARRAY, SIMPLE_DEFORM, TRIANGULATE}
+def mod_sort_descriptor(mod):
+    desc = ModSortDesc(name=mod.name, type=mod.type)
+    if mod.type == TYPES.MIRROR:
+        desc.bisect = any(mod.use_bisect_axis)
+        desc.has_object = mod.mirror_object is not None
+    elif mod.type == TYPES.BEVEL:
+        desc.has_vgroup = mod.limit_method == 'VGROUP' and bool(mod.vertex_group)
+    elif mod.type in {TYPES.SOLIDIFY, TYPES.SIMPLE_DEFORM}:
+        desc.has_vgroup = bool(mod.vertex_group)
+    elif mod.type == TYPES.EDGE_SPLIT:
+        desc.edge_sharp = mod.use_edge_sharp
+    elif mod.type == TYPES.NODES:
+        desc.auto_smooth = is_auto_smooth_modifier(mod)
+    return desc
 
 
 def sort_all_mods(obj):
@@ -144,196 +134,9 @@ def sort_all_mods(obj):
     options = user_prefs().sort
     if not options.sort_enabled:
         return
-
-    ignore_str = options.ignore_sort_str.replace(" ", "")
-    ignored_mods_map = {mod.name: index for index, mod in enumerate(obj.modifiers) if ignore_str in mod.name}
-
-    top_sorted_mods = set(sort_top_mods(obj))
-    sort_mid_mods(obj, top_sorted_mods=top_sorted_mods)
-    sort_bot_mods(obj, top_sorted_mods=top_sorted_mods)
-
-    if ignored_mods_map:
-        for mod_name, to_index in ignored_mods_map.items():
-            from_index = obj.modifiers.find(mod_name)
-            if from_index >= 0 and to_index < len(obj.modifiers) and from_index != to_index:
-                obj.modifiers.move(from_index, to_index)
-
-
-def sort_top_mods(obj, perform_move=True):
-    if not isinstance(obj, bpy.types.Object):
-        return []
-    if len(obj.modifiers) < 2:
-        return []
-    options = user_prefs().sort
-    if not options.sort_enabled:
-        return []
-    if not any([options.top_mirror, options.top_bevel, options.top_solidify, options.top_deform, options.top_edge_split, options.top_subsurf]):
-        return []
-    mods = [mod for mod in obj.modifiers if mod.type in TYPES.SORTABLE_TOP]
-    if not mods:
-        return []
-    ignore_str = options.ignore_sort_str.replace(" ", "")
-    sorted_mods = []
-    top_counts = {TYPES.MIRROR:0, TYPES.BEVEL:0, TYPES.SOLIDIFY:0, TYPES.SIMPLE_DEFORM:0, TYPES.EDGE_SPLIT:0, TYPES.SUBSURF:0}
-    for mod in mods:
-        # Ignore
-        if ignore_str and ignore_str in mod.name:
-            continue
-        # Types Check
-        if mod.type == TYPES.MIRROR:
-            if options.top_mirror:
-                if options.top_mirror_check_no_bisect and any([mod.use_bisect_axis[i] for i in range(3)]):
-                    continue
-                if options.top_mirror_check_no_object and mod.mirror_object:
-                    continue
-                if top_counts[TYPES.MIRROR] < options.top_mirror_count:
-                    top_counts[TYPES.MIRROR] += 1
-                    sorted_mods.insert(0, mod)
-        elif mod.type == TYPES.BEVEL:
-            if options.top_bevel:
-                if options.top_bevel_require_vgroup and (mod.limit_method != 'VGROUP' or not mod.vertex_group):
-                    continue
-                if top_counts[TYPES.BEVEL] < options.top_bevel_count:
-                    top_counts[TYPES.BEVEL] += 1
-                    sorted_mods.append(mod)
-        elif mod.type == TYPES.SOLIDIFY:
-            if options.top_solidify:
-                if options.top_solidify_require_vgroup and not mod.vertex_group:
-                    continue
-                if top_counts[TYPES.SOLIDIFY] < options.top_solidify_count:
-                    top_counts[TYPES.SOLIDIFY] += 1
-                    sorted_mods.append(mod)
-        elif mod.type == TYPES.SIMPLE_DEFORM:
-            if options.top_deform:
-                if options.top_deform_require_vgroup and not mod.vertex_group:
-                    continue
-                if top_counts[TYPES.SIMPLE_DEFORM] < options.top_deform_count:
-                    top_counts[TYPES.SIMPLE_DEFORM] += 1
-                    sorted_mods.append(mod)
-        elif mod.type == TYPES.EDGE_SPLIT:
-            if options.top_edge_split:
-                if options.top_edge_split_require_sharp and not mod.use_edge_sharp:
-                    continue
-                if top_counts[TYPES.EDGE_SPLIT] < options.top_edge_split_count:
-                    top_counts[TYPES.EDGE_SPLIT] += 1
-                    sorted_mods.append(mod)
-        elif mod.type == TYPES.SUBSURF:
-            if options.top_subsurf:
-                if top_counts[TYPES.SUBSURF] < options.top_subsurf_count:
-                    top_counts[TYPES.SUBSURF] += 1
-                    sorted_mods.append(mod)
-    if perform_move:
-        min_index = 1 if obj.modifiers[0].type in TYPES.UNSORTABLE else 0
-        for index, mod in enumerate(sorted_mods):
-            from_index = obj.modifiers.find(mod.name)
-            to_index = min_index + index
-            if from_index != to_index:
-                obj.modifiers.move(from_index, to_index)
-    return sorted_mods
-
-
-def sort_mid_mods(obj, top_sorted_mods=set()):
-    if not isinstance(obj, bpy.types.Object):
-        return
-    if len(obj.modifiers) < 2:
-        return
-    options = user_prefs().sort
-    if not options.sort_enabled:
-        return
-    top_sorted_mods = top_sorted_mods if top_sorted_mods else set(sort_top_mods(obj, perform_move=False))
-    mods = [mod for mod in obj.modifiers if mod not in top_sorted_mods]
-    ignore_str = options.ignore_sort_str.replace(" ", "")
-    mid_mods = []
-    target_mod = None
-    for mod in reversed(mods):
-        # Ignore
-        if ignore_str and ignore_str in mod.name:
-            continue
-        # Types
-        if mod.type == TYPES.BEVEL:
-            if options.boolean_to_bevel:
-                target_mod = mod
-                break
-        elif mod.type == TYPES.SOLIDIFY:
-            if options.boolean_to_solidify:
-                target_mod = mod
-                break
-        elif mod.type == TYPES.SUBSURF:
-            if options.boolean_to_subsurf:
-                target_mod = mod
-                break
-        elif mod.type == TYPES.ARRAY:
-            if options.boolean_to_array:
-                target_mod = mod
-                break
-        elif mod.type == TYPES.BOOLEAN:
-            mid_mods.append(mod)
-    if target_mod and mid_mods:
-        for mod in mid_mods:
-            from_index = obj.modifiers.find(mod.name)
-            to_index = obj.modifiers.find(target_mod.name)
-            if from_index >= 0 and to_index >= 0:
-                if from_index < len(obj.modifiers) and to_index < len(obj.modifiers):
-                    if from_index != to_index:
-                        obj.modifiers.move(from_index, to_index)
-
-
-def sort_bot_mods(obj, top_sorted_mods=set()):
-    if not isinstance(obj, bpy.types.Object):
-        return
-    if len(obj.modifiers) < 2:
-        return
-    options = user_prefs().sort
-    if not options.sort_enabled:
-        return
-    top_sorted_mods = top_sorted_mods if top_sorted_mods else set(sort_top_mods(obj, perform_move=False))
-    ignore_str = options.ignore_sort_str.replace(" ", "")
-    mods = [mod for mod in obj.modifiers if (mod not in top_sorted_mods) and (ignore_str and ignore_str not in mod.name)]
-    mods.reverse()
-    mod_types = {mod.type for mod in mods}
-    sorted_mods = []
-    if TYPES.MIRROR in mod_types:
-        for mod in mods:
-            if mod.type == TYPES.MIRROR:
-                sorted_mods.append(mod)
-                break
-    if TYPES.WELD in mod_types:
-        for mod in mods:
-            if mod.type == TYPES.WELD:
-                sorted_mods.append(mod)
-                break
-    if TYPES.NODES in mod_types:
-        for mod in mods:
-            if mod.type == TYPES.NODES:
-                if is_auto_smooth_modifier(mod):
-                    sorted_mods.append(mod)
-                    break
-    if TYPES.WEIGHTED_NORMAL in mod_types:
-        for mod in mods:
-            if mod.type == TYPES.WEIGHTED_NORMAL:
-                sorted_mods.append(mod)
-                break
-    if TYPES.ARRAY in mod_types:
-        for mod in mods:
-            if mod.type == TYPES.ARRAY:
-                sorted_mods.append(mod)
-                break
-    if TYPES.SIMPLE_DEFORM in mod_types:
-        for mod in mods:
-            if mod.type == TYPES.SIMPLE_DEFORM:
-                sorted_mods.append(mod)
-                break
-    if TYPES.TRIANGULATE in mod_types:
-        for mod in mods:
-            if mod.type == TYPES.TRIANGULATE:
-                sorted_mods.append(mod)
-                break
-    to_index = len(obj.modifiers) - 1
-    if to_index >= 0:
-        for mod in sorted_mods:
-            from_index = obj.modifiers.find(mod.name)
-            if from_index != to_index:
-                obj.modifiers.move(from_index, to_index)
+    descs = [mod_sort_descriptor(mod) for mod in obj.modifiers]
+    for from_index, to_index in plan_mod_moves(descs, options):
+        obj.modifiers.move(from_index, to_index)
 
 
 def get_all_of_type(obj, mod_type=TYPES.MIRROR):
@@ -357,28 +160,61 @@ def set_vp_visibility_from_map(obj, vis_map={}):
             mod.show_viewport = vis_map[mod]
 
 
+def apply_mods(context, obj, mods=[]):
+    '''
+    RET : True if any modifier was applied
+    IFO : Mesh objects are evaluated once with every other modifier disabled, the baked mesh is swapped in and the applied modifiers are removed
+    IFO : Curves, shape keys and hidden objects fall back to the apply operator
+    '''
+
+    applied = set(mods)
+    mods = [mod for mod in obj.modifiers if mod in applied and mod.show_viewport]
+    if not mods:
+        return False
+    # Operator
+    if obj.type != 'MESH' or obj.data.shape_keys or not obj.visible_get(view_layer=context.view_layer):
+        if obj.data.users > 1:
+            obj.data = obj.data.copy()
+        original_active = context.view_layer.objects.active
+        context.view_layer.objects.active = obj
+        for mod in mods:
+            bpy.ops.object.modifier_apply(modifier=mod.name)
+        context.view_layer.objects.active = original_active
+        return True
+    # Bake
+    hidden_mods = [mod for mod in obj.modifiers if mod not in applied and mod.show_viewport]
+    for mod in hidden_mods:
+        mod.show_viewport = False
+    depsgraph = context.evaluated_depsgraph_get()
+    mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph)
+    for mod in hidden_mods:
+        mod.show_viewport = True
+    for mod in mods:
+        obj.modifiers.remove(mod)
+    # Linked meshes stay with their other users
+    if obj.data.users > 1:
+        obj.data = mesh
+    else:
+        swap_mesh_delete(obj, mesh)
+    forget_object_refs(obj)
+    return True
+
+
 def apply_with_map(context, obj_mods_map={}):
     if not obj_mods_map: return
-    original_active = context.view_layer.objects.active
     toggle = object_mode_toggle_start(context)
     for obj, mods in obj_mods_map.items():
         if isinstance(obj, bpy.types.Object) and isinstance(mods, list):
             if obj.name in context.scene.objects:
-                context.view_layer.objects.active = obj
-                for mod in mods:
-                    if isinstance(mod, bpy.types.Modifier):
-                        bpy.ops.object.modifier_apply(modifier=mod.name)
+                apply_mods(context, obj, [mod for mod in mods if isinstance(mod, bpy.types.Modifier)])
     if toggle: object_mode_toggle_end(context)
-    context.view_layer.objects.active = original_active
 
 
 def apply_mods_with_leave_opts(context, obj, leave_first_bevel=False, leave_last_auto_smooth=False, leave_last_weighted_normal=False):
     if not isinstance(obj, bpy.types.Object): return
     if obj.name not in context.scene.objects: return
     if obj.name not in context.view_layer.objects: return
-    original_active = context.view_layer.objects.active
     toggle = object_mode_toggle_start(context)
-    context.view_layer.objects.active = obj
 
     mods_to_skip = set()
     if leave_last_auto_smooth or leave_last_weighted_normal:
@@ -397,159 +233,52 @@ def apply_mods_with_leave_opts(context, obj, leave_first_bevel=False, leave_last
                 mods_to_skip.add(mod)
                 break
 
-    for mod in obj.modifiers[:]:
-        if mod not in mods_to_skip:
-            bpy.ops.object.modifier_apply(modifier=mod.name)
+    apply_mods(context, obj, [mod for mod in obj.modifiers if mod not in mods_to_skip])
 
     if toggle: object_mode_toggle_end(context)
-    context.view_layer.objects.active = original_active
 
 
 def apply_all_booleans(context, obj):
     if not isinstance(obj, bpy.types.Object): return
     if obj.name not in context.scene.objects: return
     if obj.name not in context.view_layer.objects: return
-    original_active = context.view_layer.objects.active
     toggle = object_mode_toggle_start(context)
-    context.view_layer.objects.active = obj
 
-    for mod in obj.modifiers[:]:
-        if mod.type == TYPES.BOOLEAN:
-            bpy.ops.object.modifier_apply(modifier=mod.name)
+    apply_mods(context, obj, [mod for mod in obj.modifiers if mod.type == TYPES.BOOLEAN])
 
     if toggle: object_mode_toggle_end(context)
-    context.view_layer.objects.active = original_active
 
 
 def apply_mods_with_vgroups(context, obj):
     if not isinstance(obj, bpy.types.Object): return
     if obj.name not in context.scene.objects: return
     if obj.name not in context.view_layer.objects: return
-    original_active = context.view_layer.objects.active
     toggle = object_mode_toggle_start(context)
-    context.view_layer.objects.active = obj
 
-    for mod in obj.modifiers[:]:
+    mods = []
+    for mod in obj.modifiers:
         if hasattr(mod, 'vertex_group'):
             if mod.type == TYPES.BEVEL and mod.limit_method == 'VGROUP':
-                bpy.ops.object.modifier_apply(modifier=mod.name)
+                mods.append(mod)
             elif mod.vertex_group:
-                bpy.ops.object.modifier_apply(modifier=mod.name)
+                mods.append(mod)
+    apply_mods(context, obj, mods)
 
     if toggle: object_mode_toggle_end(context)
-    context.view_layer.objects.active = original_active
 
 
 def apply_first_mirror(context, obj):
     if not isinstance(obj, bpy.types.Object): return
     if obj.name not in context.scene.objects: return
     if obj.name not in context.view_layer.objects: return
-    original_active = context.view_layer.objects.active
     toggle = object_mode_toggle_start(context)
-    context.view_layer.objects.active = obj
 
-    for mod in obj.modifiers[:]:
+    for mod in obj.modifiers:
         if mod.type == TYPES.MIRROR:
-            bpy.ops.object.modifier_apply(modifier=mod.name)
+            apply_mods(context, obj, [mod])
             break
 
     if toggle: object_mode_toggle_end(context)
-    context.view_layer.objects.active = original_active
-
-########################•########################
-"""                  CAPTURE                  """
-########################•########################
-
-def objects_from_node_tree(tree):
-    
-    def traverse(tree, objs, visited):
-        if tree in visited:
-            return        
-        visited.add(tree)
-        for node in tree.nodes:
-            if type(node) == bpy.types.GeometryNodeGroup:
-                if hasattr(node, 'node_tree'):
-                    traverse(node.node_tree, objs, visited)
-            for socket in node.inputs:
-                if socket.bl_idname == 'NodeSocketObject':
-                    if socket.is_linked:
-                        for link in socket.links:
-                            from_socket = link.from_socket
-                            if from_socket.bl_idname == 'NodeSocketObject':
-                                obj = from_socket.default_value
-                                if obj:
-                                    objs.add(obj)
-                    else:
-                        obj = socket.default_value
-                        if obj:
-                            objs.add(obj)
-    objs = set()
-    visited = set()
-    traverse(tree, objs, visited)
-    return list(objs)
-
-
-def referenced_objects(obj):
-
-    def recursive(obj, objs):
-        if obj in objs:
-            return
-        if obj is None:
-            return
-        objs.add(obj)
-        if not hasattr(obj, 'modifiers'):
-            return
-        for mod in obj.modifiers:
-            if mod.type == 'NODES':
-                tree_objs = objects_from_node_tree(mod.node_group)
-                for tree_obj in tree_objs:
-                    recursive(tree_obj, objs)
-                continue
-            for item in dir(mod):
-                attr = getattr(mod, item)
-                if type(attr) == bpy.types.Object:
-                    recursive(attr, objs)
-    objs = set()
-    recursive(obj, objs)
-    return list(objs)
-
-
-def referenced_booleans(obj):
-
-    def recursive(obj, objs):
-        if obj in objs:
-            return
-        if obj is None:
-            return
-        if not hasattr(obj, 'modifiers'):
-            return
-        objs.add(obj)
-        for mod in obj.modifiers:
-            if mod.type == TYPES.BOOLEAN:
-                for item in dir(mod):
-                    attr = getattr(mod, item)
-                    if type(attr) == bpy.types.Object:
-                        if attr.type == 'MESH':
-                            recursive(attr, objs)
-    starting_obj = obj
-    objs = set()
-    recursive(obj, objs)
-    if starting_obj in objs:
-        objs.remove(starting_obj)
-    return list(objs)
-
-
-def boolean_objs_from_mods(obj):
-    objs = []
-    for mod in obj.modifiers:
-        if mod.type == TYPES.BOOLEAN:
-            for item in dir(mod):
-                attr = getattr(mod, item)
-                if type(attr) == bpy.types.Object:
-                    if attr.type == 'MESH':
-                        objs.append(attr)
-                        break
-    return objs
 
 ########################•########################
 """               MOD SETUP SYSTEMS           """
@@ -808,10 +537,10 @@ def boolean_operations(context, target_obj, boolean_objs=[], boolean_ops=BOOLEAN
         boolean_mod_map = {}
         sub_objs = set()
         for boolean_obj in boolean_objs:
-            sub_obj = duplicate_mesh_in_place(context, target_obj)
+            # Slices share the target mesh and its shading until they are applied
+            sub_obj = duplicate_mesh_in_place(context, target_obj, link_data=True)
             sub_objs.add(sub_obj)
             shade_polygons(boolean_obj, use_smooth=set_shading)
-            shade_polygons(sub_obj, use_smooth=set_shading)
             parent_object(child=sub_obj, parent=target_obj)
             mod = setup_boolean(context, target_obj, boolean_obj, 'DIFFERENCE')
             if target_obj in boolean_mod_map:
@@ -857,6 +586,7 @@ def setup_boolean(context, target_obj, boolean_obj, operation):
     mod.object = boolean_obj
     mod.solver = user_prefs().settings.boolean_solver_mode
     mod.show_in_editmode = True
+    forget_object_refs(target_obj)
     parent_object(child=boolean_obj, parent=target_obj)
     wire_display(boolean_obj)
     boolean_obj.ps.use_for_boolean = True
@@ -865,15 +595,8 @@ def setup_boolean(context, target_obj, boolean_obj, operation):
 
 def insert_booleans_into_collecion(context, boolean_objs):
     collection = boolean_collection(context)
-    for obj in boolean_objs:
-        unlink_object_from_all_collections(context, obj)
-        link_object_to_collection(collection, obj)
     collection_path_settings(context, collection, exclude=False, hide_viewport=False, hide_render=True)
-    for obj in collection.objects:
-        if obj not in boolean_objs:
-            if obj.ps.use_for_boolean:
-                obj.hide_set(True)
-                obj.hide_render = True
+    insert_objects_into_collection(context, collection, objs=boolean_objs, hide_others=lambda obj: obj.ps.use_for_boolean)
 
 
 def delete_booleans_if_valid(boolean_objs=[]):
@@ -901,7 +624,7 @@ class ModController:
         self.mod_type = mod_type
         self.mods = [mod for mod in obj.modifiers if mod.type == mod_type]
         self.mod_names_map = {mod : mod.name for mod in obj.modifiers if mod.type == mod_type}
-        self.prop_maps = {}
+        self.snapshots = {}
         self.mod = None
         self.created_mods = []
         self.original_stack_order = [(index, mod.name) for index, mod in enumerate(obj.modifiers)]
@@ -913,7 +636,7 @@ class ModController:
             # Set to last
             else:
                 self.mod = self.mods[-1]
-            # Revert prop maps
+            # Revert snapshots
             for mod in self.mods:
                 self.__capture_props(mod)
 
@@ -973,6 +696,27 @@ class ModController:
         return False
 
 
+    def sync_from(self, source, props=[]):
+        '''
+        RET : Count of written props
+        IFO : Equal values are never written
+        '''
+
+        if not isinstance(self.mod, bpy.types.Modifier) or self.mod == source:
+            return 0
+        written = 0
+        for prop in props:
+            value = getattr(source, prop)
+            current = getattr(self.mod, prop)
+            if hasattr(value, '__len__') and not isinstance(value, str):
+                value = tuple(value)
+                current = tuple(current)
+            if current != value:
+                setattr(self.mod, prop, value)
+                written += 1
+        return written
+
+
     def move_curent_mod(self, move_up=True, flag_to_ignore_sort=True):
         if isinstance(self.obj, bpy.types.Object) and isinstance(self.mod, bpy.types.Modifier) and len(self.obj.modifiers) > 1:
             from_index = self.obj.modifiers.find(self.mod.name)
@@ -1000,9 +744,8 @@ class ModController:
             for mod in self.mods:
                 if remove_created and mod in self.created_mods:
                     continue
-                if mod.name in self.prop_maps:
-                    prop_map = self.prop_maps[mod.name]
-                    transfer_props(prop_map, mod)
+                if mod in self.snapshots:
+                    self.snapshots[mod].restore(mod)
         def remove():
             mods = list(set(self.created_mods))
             for mod in mods[:]:
@@ -1031,5 +774,4 @@ class ModController:
 
 
     def __capture_props(self, mod):
-        prop_map = capture_prop_maps(mod)
-        self.prop_maps[mod.name] = prop_map
+        self.snapshots[mod] = PropSnapshot(mod)
@@ -4,6 +4,7 @@
 
 import bpy
 import bmesh
+import numpy as np
 from mathutils import Vector, Matrix, Euler, Quaternion
 from .collections import link_object_to_collection, collection_path_settings, scence_collections, ensure_object_collections_visible
 from .math3 import loc_matrix, rot_matrix, sca_matrix
@@ -44,6 +45,91 @@ def scale_obj(obj, scale=Vector((1,1,1))):
     obj.scale = scale
 
 
+class ScaleController:
+    '''
+    IFO : Applies scale once per mesh datablock and reverts from saved coordinates
+    IFO : Shared meshes are skipped when their users disagree on scale or are not all tracked
+    '''
+
+    def __init__(self, objs=[]):
+        self.scale_map = {obj : obj.scale.copy() for obj in objs if isinstance(obj, bpy.types.Object) and isinstance(obj.data, bpy.types.Mesh)}
+        self.mesh_objs_map = dict()
+        for obj in self.scale_map:
+            if obj.data in self.mesh_objs_map:
+                self.mesh_objs_map[obj.data].append(obj)
+            else:
+                self.mesh_objs_map[obj.data] = [obj]
+        self.coords_map = dict()
+        self.child_matrix_map = dict()
+
+
+    def apply(self):
+        for mesh, objs in self.mesh_objs_map.items():
+            scale = objs[0].scale.copy()
+            if all([n == 1 for n in scale]):
+                continue
+            if any([obj.scale != scale for obj in objs]) or mesh.users > len(objs):
+                continue
+            mat = Matrix.Diagonal(scale).to_4x4()
+            if mesh.is_editmode:
+                objs[0].update_from_editmode()
+                if mesh not in self.coords_map:
+                    self.coords_map[mesh] = mesh_coords(mesh)
+                bm = bmesh.from_edit_mesh(mesh)
+                bmesh.ops.transform(bm, matrix=mat, verts=bm.verts)
+                bmesh.update_edit_mesh(mesh, loop_triangles=True, destructive=False)
+            else:
+                if mesh not in self.coords_map:
+                    self.coords_map[mesh] = mesh_coords(mesh)
+                mesh.transform(mat)
+            for obj in objs:
+                for child in obj.children:
+                    if child not in self.child_matrix_map:
+                        self.child_matrix_map[child] = child.matrix_local.copy()
+                    child.matrix_local = mat @ child.matrix_local
+                obj.scale = Vector((1,1,1))
+
+
+    def revert(self):
+        for mesh, coords in self.coords_map.items():
+            objs = self.mesh_objs_map[mesh]
+            if objs[0].scale == self.scale_map[objs[0]]:
+                continue
+            if not set_mesh_coords(mesh, coords):
+                scale_obj(objs[0], self.scale_map[objs[0]])
+        for child, matrix in self.child_matrix_map.items():
+            child.matrix_local = matrix
+        for obj, scale in self.scale_map.items():
+            if obj.scale != scale:
+                obj.scale = scale
+
+
+def mesh_coords(mesh):
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', coords)
+    return coords
+
+
+def set_mesh_coords(mesh, coords):
+    '''
+    RET : False if the vertex count no longer matches
+    '''
+
+    if mesh.is_editmode:
+        bm = bmesh.from_edit_mesh(mesh)
+        if len(bm.verts) * 3 != len(coords):
+            return False
+        for vert, co in zip(bm.verts, coords.reshape(-1, 3).tolist()):
+            vert.co = co
+        bmesh.update_edit_mesh(mesh, loop_triangles=True, destructive=False)
+    else:
+        if len(mesh.vertices) * 3 != len(coords):
+            return False
+        mesh.vertices.foreach_set('co', coords)
+        mesh.update()
+    return True
+
+
 def apply_location(obj):
     obj.data.transform(loc_matrix(obj.location))
     obj.location = Vector((0,0,0))
@@ -3,49 +3,88 @@
 ########################•########################
 
 import bpy
-import time
-import gpu
-import bmesh
+import math
 import numpy as np
 from gpu import state
 from gpu_extras.batch import batch_for_shader
 from bpy.app.handlers import persistent
 from mathutils import Vector, Matrix
 from .addon import user_prefs
-from .graphics import COLORS
+from .graphics import COLORS, FADE_COLOR, fade_time
 
-UNIFORM_COLOR = gpu.shader.from_builtin('UNIFORM_COLOR')
 INTERVAL = 0.03
-DURATION = 1.0
 HANDLE = None
 # List of Data Instances
 DRAW_DATA = []
+# Screens that created fades (Only these are tagged while fading)
+SCREENS = set()
 
 class Data:
     def __init__(self, line_batch=None, point_batch=None):
-        self.start_time = time.time()
-        self.alpha = 1.0
+        self.start_time = fade_time()
+        self.duration = 1.0
         self.color_a = None
         self.color_b = None
         self.line_batch = line_batch
         self.point_batch = point_batch
 
 
-def init(obj=None, points=[], lines=[], bounding_box_only=False, color_a=COLORS.WHITE, color_b=COLORS.BLACK):
+def decimate_coords(coords=[], budget=0, stride=1):
+    '''
+    RET : Coords reduced to the budget by keeping every Nth group of stride coords
+    IFO : stride = 2 for LINES so that segments stay paired
+    '''
+    count = len(coords) // stride
+    if budget <= 0 or count <= budget:
+        return coords
+    step = math.ceil(count / budget)
+    return [coords[i + j] for i in range(0, count * stride, step * stride) for j in range(stride)]
+
+
+def transformed_coords(coords, matrix):
+    '''
+    RET : (N, 3) float32 array of coords transformed by the matrix in one pass
+    '''
+    mat = np.array(matrix, dtype=np.float32)
+    return coords @ mat[:3, :3].T + mat[:3, 3]
+
+
+def mesh_edge_arrays(mesh):
+    '''
+    RET : (N, 3) float32 vert coords, (M, 2) int32 edge vert indices
+    '''
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', coords)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get('vertices', edges)
+    return coords.reshape(-1, 3), edges.reshape(-1, 2)
+
+
+def bmesh_edge_arrays(edges=[]):
+    '''
+    RET : (N * 2, 3) float32 line coords from bmesh edges (Local Space)
+    '''
+    if not edges:
+        return np.empty((0, 3), dtype=np.float32)
+    return np.array([vert.co for edge in edges if edge.is_valid for vert in edge.verts], dtype=np.float32).reshape(-1, 3)
+
+
+def init(obj=None, points=[], lines=[], coords=None, edges=None, bounding_box_only=False, color_a=COLORS.WHITE, color_b=COLORS.BLACK):
+    '''
+    IFO : points / lines -> World Space coords
+    IFO : coords -> Local Space array || With edges as index pairs (Indexed) or as line pairs (Not Indexed)
+    '''
     if not isinstance(obj, bpy.types.Object):
         return
     prefs = user_prefs()
-    if not bounding_box_only:
-        if len(points) + len(lines) > prefs.settings.mesh_fade_geo_limit:
-            bounding_box_only = True
-        elif isinstance(obj.data, bpy.types.Mesh):
-            if len(obj.data.vertices) > prefs.settings.mesh_fade_geo_limit:
-                bounding_box_only = True
-    global DURATION, DRAW_DATA
-    DURATION = prefs.settings.mesh_fade_duration
+    budget = prefs.settings.mesh_fade_geo_limit
+    if budget <= 0:
+        bounding_box_only = True
+    global DRAW_DATA
     data = Data()
-    data.color_b = Vector((color_a[0], color_a[1], color_a[2]))
-    data.color_a = Vector((color_b[0], color_b[1], color_b[2]))
+    data.duration = prefs.settings.mesh_fade_duration
+    data.color_a = (color_a[0], color_a[1], color_a[2])
+    data.color_b = (color_b[0], color_b[1], color_b[2])
     # Bounding Box
     if bounding_box_only:
         mat_ws = obj.matrix_world
@@ -73,21 +112,33 @@ def init(obj=None, points=[], lines=[], bounding_box_only=False, color_a=COLORS.
             # Back
             p4, p3, p3, p7, p7, p8, p8, p4]
     # Mesh
-    elif not lines and not points and isinstance(obj.data, bpy.types.Mesh):
-        mat_ws = obj.matrix_world
-        bm = bmesh.new(use_operators=False)
-        bm.from_mesh(obj.data)
-        bm.transform(mat_ws)
-        bm.verts.ensure_lookup_table()
-        bm.edges.ensure_lookup_table()
-        lines = [vert.co for edge in bm.edges for vert in edge.verts]
+    elif coords is None and not lines and not points and isinstance(obj.data, bpy.types.Mesh):
+        coords, edges = mesh_edge_arrays(obj.data)
+    # Level of Detail
+    else:
+        points = decimate_coords(points, budget=budget, stride=1)
+        lines = decimate_coords(lines, budget=budget, stride=2)
+    # Arrays
+    if coords is not None and not bounding_box_only:
+        if edges is None:
+            coords = coords.reshape(-1, 2, 3)
+            step = max(math.ceil(len(coords) / budget), 1)
+            coords = coords[::step].reshape(-1, 3)
+        else:
+            step = max(math.ceil(len(edges) / budget), 1)
+            edges = edges[::step]
+        if len(coords) and (edges is None or len(edges)):
+            coords = transformed_coords(coords, obj.matrix_world)
+            data.line_batch = batch_for_shader(FADE_COLOR, 'LINES', {"pos": coords}, indices=edges)
     # Batches
-    if points or lines:
-        if points:
-            data.point_batch = batch_for_shader(UNIFORM_COLOR, 'POINTS', {"pos": [coord for coord in points if isinstance(coord, Vector)]})
-        if lines:
-            data.line_batch = batch_for_shader(UNIFORM_COLOR, 'LINES', {"pos": [coord for coord in lines if isinstance(coord, Vector)]})
+    if points:
+        data.point_batch = batch_for_shader(FADE_COLOR, 'POINTS', {"pos": [coord for coord in points if isinstance(coord, Vector)]})
+    if lines:
+        data.line_batch = batch_for_shader(FADE_COLOR, 'LINES', {"pos": [coord for coord in lines if isinstance(coord, Vector)]})
+    if data.line_batch or data.point_batch:
         DRAW_DATA.append(data)
+        if bpy.context.screen:
+            SCREENS.add(bpy.context.screen)
         assign_poly_fade_handle()
 
 ########################•########################
@@ -96,12 +147,10 @@ def init(obj=None, points=[], lines=[], bounding_box_only=False, color_a=COLORS.
 
 def process_timer():
     global DRAW_DATA
+    now = fade_time()
     for data in DRAW_DATA[:]:
-        delta = time.time() - data.start_time
-        if delta >= DURATION:
+        if now - data.start_time >= data.duration:
             DRAW_DATA.remove(data)
-        else:
-            data.alpha = min(max((1 - (delta / DURATION)), 0), 1)
     if len(DRAW_DATA) == 0:
         remove_poly_fade_handle()
 
@@ -116,6 +165,7 @@ def remove_poly_fade_handle(null=''):
         except Exception as e: print("Poly Fade: Did not remove draw handle", e)
     HANDLE = None
     DRAW_DATA.clear()
+    SCREENS.clear()
 
 
 def assign_poly_fade_handle():
@@ -136,25 +186,31 @@ def draw():
     state.blend_set('ALPHA')
     state.line_width_set(1)
     state.point_size_set(1)
+    FADE_COLOR.bind()
+    FADE_COLOR.uniform_float("time", fade_time())
+    FADE_COLOR.uniform_float("alpha_scale", 1.0)
     for data in DRAW_DATA:
-        color = data.color_a.lerp(data.color_b, data.alpha)
-        color = (color[0], color[1], color[2], data.alpha)
-        UNIFORM_COLOR.uniform_float("color", color)
+        FADE_COLOR.uniform_float("color_start", data.color_a)
+        FADE_COLOR.uniform_float("color_end", data.color_b)
+        FADE_COLOR.uniform_float("start_time", data.start_time)
+        FADE_COLOR.uniform_float("duration", data.duration)
         if data.line_batch:
-            data.line_batch.draw(UNIFORM_COLOR)
+            data.line_batch.draw(FADE_COLOR)
         if data.point_batch:
-            data.point_batch.draw(UNIFORM_COLOR)
+            data.point_batch.draw(FADE_COLOR)
     state.blend_set('NONE')
 
 
 def view3d_tag_redraw():
+    process_timer()
+    # Final pass clears the fade from every view
+    screens = SCREENS if HANDLE else None
     for window in bpy.context.window_manager.windows:
+        if screens is not None and window.screen not in screens:
+            continue
         for area in window.screen.areas:
             if area.type == 'VIEW_3D':
                 area.tag_redraw()
-    process_timer()
     if HANDLE:
         return INTERVAL
     return None
-
-
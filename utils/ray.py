@@ -5,6 +5,7 @@
 import bpy
 import bmesh
 import time
+import numpy as np
 from math import radians, inf, sin, cos, pi
 from mathutils import geometry, Vector, Matrix
 from mathutils.geometry import distance_point_to_plane, intersect_line_plane, intersect_line_sphere, intersect_point_line, convex_hull_2d, intersect_point_quad_2d
@@ -13,7 +14,7 @@ from mathutils.kdtree import KDTree
 from mathutils.bvhtree import BVHTree
 from .math3 import sphere_from_obj_bounds
 from .object import get_visible_mesh_obj_by_name
-from .screen import screen_factor, units_per_pixel_at_depth
+from .screen import screen_factor, units_per_pixel_at_depth, view_snapshot
 from .vec_fade import init as init_vec_fade
 
 ########################•########################
@@ -36,15 +37,8 @@ def mouse_ray(context, event):
 
 
 def is_mouse_over_bounding_box(context, event, obj=None):
-    perp_mat = context.region_data.perspective_matrix
     mat_ws = obj.matrix_world
-    bb_corners = [perp_mat @ mat_ws @ Vector((x, y, z, 1)) for x,y,z in obj.bound_box]
-    points = []
-    wh = context.area.width / 2
-    hh = context.area.height / 2
-    for corner in bb_corners:
-        if corner.w > 0.0:
-            points.append(Vector((wh + wh * (corner.x / corner.w), hh + hh * (corner.y / corner.w))))
+    points = cast_points_to_ss(context, [mat_ws @ Vector(corner) for corner in obj.bound_box])
     if not points:
         return False
     indices = convex_hull_2d(points)
@@ -82,25 +76,14 @@ def bounding_box_radius(obj):
 
 
 def cast_points_to_ss(context, points=[]):
-    hw = context.area.width / 2
-    hh = context.area.height / 2
-    perp_mat = context.region_data.perspective_matrix
-    casted_points = []
-    for point in points:
-        prj = perp_mat @ Vector((point[0], point[1], point[2], 1.0))
-        if prj.w > 0.0:
-            casted_points.append(Vector((hw + hw * (prj.x / prj.w), hh + hh * (prj.y / prj.w))))
-    return casted_points
+    if len(points) == 0:
+        return []
+    ss_cos, visible = view_snapshot(context).project_array(points)
+    return [Vector(ss_co) for ss_co in ss_cos[visible]]
 
 
 def cast_point_to_ss(context, point=None):
-    hw = context.area.width / 2
-    hh = context.area.height / 2
-    perp_mat = context.region_data.perspective_matrix
-    prj = perp_mat @ Vector((point[0], point[1], point[2], 1.0))
-    if prj.w > 0.0:
-        return Vector((hw + hw * (prj.x / prj.w), hh + hh * (prj.y / prj.w)))
-    return None
+    return view_snapshot(context).project(point)
 
 
 def point_on_obj_is_obstructed_from_view(context, event, obj, point, ray_org, deps=None):
@@ -139,9 +122,7 @@ def closest_vert_to_mouse_from_polygon(context, event, obj, polygon_index=-1):
         return result, delta_dist_ss, hit_coord_ls, hit_coord_ws, hit_vert_index
     if not (polygon_index < len(obj.data.polygons) and polygon_index >= 0):
         return result, delta_dist_ss, hit_coord_ls, hit_coord_ws, hit_vert_index
-    hw = context.area.width / 2
-    hh = context.area.height / 2
-    perp_mat = context.region_data.perspective_matrix
+    snapshot = view_snapshot(context)
     mouse = Vector((event.mouse_region_x, event.mouse_region_y))
     mat_ws = obj.matrix_world
     polygon = obj.data.polygons[polygon_index]
@@ -150,9 +131,8 @@ def closest_vert_to_mouse_from_polygon(context, event, obj, polygon_index=-1):
     for poly_vert_index in poly_vert_indices:
         vert_co_ls = verts[poly_vert_index].co
         vert_co_ws = mat_ws @ vert_co_ls
-        prj = perp_mat @ vert_co_ws.to_4d()
-        if prj.w > 0.0:
-            vert_co_ss = Vector((hw + hw * (prj.x / prj.w), hh + hh * (prj.y / prj.w)))
+        vert_co_ss = snapshot.project(vert_co_ws)
+        if vert_co_ss:
             distance = (mouse - vert_co_ss).length
             if distance < delta_dist_ss:
                 result = True
@@ -212,7 +192,7 @@ def closest_edge_to_point_from_polygon(context, obj, point_ws=Vector((0,0,0)), p
 
 
 def closest_vert_to_mouse_from_edit_mode(context, event, objs=[], update_obj=True, tolerance_PX=20):
-    ''' SLOW : (Maybe make a kd tree from a new bmesh but transformed to the view plane) '''
+    ''' IFO : Verts are projected in one pass per object, obstruction is only tested nearest first '''
     tolerance_PX *= screen_factor()
     if context.mode != 'EDIT_MESH':
         return None, None, None
@@ -222,11 +202,8 @@ def closest_vert_to_mouse_from_edit_mode(context, event, objs=[], update_obj=Tru
     wire_frame = context.space_data.shading.type == 'WIREFRAME'
     deps = context.evaluated_depsgraph_get() if wire_frame else None
     mouse, m_ray_org, m_ray_nor, m_ray_end = mouse_ray(context, event)
-    region = context.region
-    rv3d = context.region_data
-    hw = context.area.width / 2
-    hh = context.area.height / 2
-    perp_mat = context.region_data.perspective_matrix
+    snapshot = view_snapshot(context)
+    mouse_array = np.array(mouse, dtype=np.float64)
     # Hit Data
     delta_dist = inf
     hit_coord_ws = None
@@ -245,24 +222,25 @@ def closest_vert_to_mouse_from_edit_mode(context, event, objs=[], update_obj=Tru
             continue
         mat_ws = obj.matrix_world
         vertices = obj.data.vertices
-        for vert in vertices:
-            world_co = mat_ws @ vert.co
-            prj = perp_mat @ Vector((world_co[0], world_co[1], world_co[2], 1.0))
-            ss_co = Vector((0,0))
-            if prj.w <= 0.0:
-                continue
-            ss_co = Vector((hw + hw * (prj.x / prj.w), hh + hh * (prj.y / prj.w)))
-            dist_2d = (ss_co - mouse).length
-            if (dist_2d > delta_dist) or (dist_2d > tolerance_PX):
-                continue
+        coords = np.empty(len(vertices) * 3, dtype=np.float64)
+        vertices.foreach_get('co', coords)
+        mat = np.array(mat_ws, dtype=np.float64)
+        world_cos = coords.reshape(-1, 3) @ mat[:3, :3].T + mat[:3, 3]
+        ss_cos, visible = snapshot.project_array(world_cos)
+        dists_2d = np.linalg.norm(ss_cos - mouse_array, axis=1)
+        candidates = np.flatnonzero(visible & (dists_2d <= tolerance_PX) & (dists_2d <= delta_dist))
+        # Nearest first : the first unobstructed candidate wins
+        for vert_index in candidates[np.argsort(dists_2d[candidates], kind='stable')]:
+            world_co = Vector(world_cos[vert_index])
             # Reject solid view interferences
             if not wire_frame:
                 if point_on_obj_is_obstructed_from_view(context, event, obj, world_co, m_ray_org, deps=deps):
                     continue
-            delta_dist = dist_2d
-            hit_coord_ws = world_co.copy()
-            hit_vert_index = vert.index
+            delta_dist = dists_2d[vert_index]
+            hit_coord_ws = world_co
+            hit_vert_index = int(vert_index)
             hit_obj = obj
+            break
     result = False
     if isinstance(hit_coord_ws, Vector) and isinstance(hit_vert_index, int) and isinstance(hit_obj, bpy.types.Object) and isinstance(hit_obj.data, bpy.types.Mesh):
         if hit_vert_index < len(hit_obj.data.vertices) and hit_vert_index >= 0:
@@ -0,0 +1,171 @@
+########################•########################
+"""                  KenzoCG                  """
+########################•########################
+
+import bpy
+from bpy.app.handlers import persistent
+
+# KEY -> RNA identifier || VAL -> (Object pointer prop identifiers)
+MOD_OBJECT_PROPS = dict()
+# KEY -> Node tree session uid || VAL -> [Objects]
+TREE_OBJECTS = dict()
+# KEY -> Object session uid || VAL -> ObjRefs
+OBJECT_REFS = dict()
+
+########################•########################
+"""                   CACHE                   """
+########################•########################
+
+class ObjRefs:
+    __slots__ = ('objects', 'booleans')
+
+    def __init__(self, objects, booleans):
+        # Every object referenced by the modifier stack
+        self.objects = objects
+        # Mesh objects referenced by boolean modifiers, in stack order
+        self.booleans = booleans
+
+
+    def is_valid(self):
+        try:
+            for obj in self.objects:
+                obj.name
+        except ReferenceError:
+            return False
+        return True
+
+
+def mod_object_props(mod):
+    key = mod.bl_rna.identifier
+    props = MOD_OBJECT_PROPS.get(key)
+    if props is None:
+        props = tuple(prop.identifier for prop in mod.bl_rna.properties if prop.type == 'POINTER' and prop.fixed_type.identifier == 'Object')
+        MOD_OBJECT_PROPS[key] = props
+    return props
+
+
+def objects_from_node_tree(tree):
+    if tree is None:
+        return []
+    key = tree.session_uid
+    objs = TREE_OBJECTS.get(key)
+    if objs is not None:
+        return objs
+
+    def traverse(tree, objs, visited):
+        if tree in visited:
+            return
+        visited.add(tree)
+        for node in tree.nodes:
+            if type(node) == bpy.types.GeometryNodeGroup:
+                if hasattr(node, 'node_tree') and node.node_tree:
+                    traverse(node.node_tree, objs, visited)
+            for socket in node.inputs:
+                if socket.bl_idname == 'NodeSocketObject':
+                    if socket.is_linked:
+                        for link in socket.links:
+                            from_socket = link.from_socket
+                            if from_socket.bl_idname == 'NodeSocketObject':
+                                obj = from_socket.default_value
+                                if obj:
+                                    objs.add(obj)
+                    else:
+                        obj = socket.default_value
+                        if obj:
+                            objs.add(obj)
+    objs = set()
+    visited = set()
+    traverse(tree, objs, visited)
+    objs = list(objs)
+    TREE_OBJECTS[key] = objs
+    return objs
+
+
+def object_refs(obj):
+    '''
+    RET : ObjRefs for the direct modifier references of obj
+    IFO : Cached until the depsgraph reports a geometry update on obj
+    '''
+
+    key = obj.session_uid
+    refs = OBJECT_REFS.get(key)
+    if refs is not None and refs.is_valid():
+        return refs
+    objects = []
+    booleans = []
+    for mod in obj.modifiers:
+        if mod.type == 'NODES':
+            objects.extend(objects_from_node_tree(mod.node_group))
+            continue
+        for prop in mod_object_props(mod):
+            ref = getattr(mod, prop)
+            if ref is None:
+                continue
+            objects.append(ref)
+            if mod.type == 'BOOLEAN' and ref.type == 'MESH':
+                booleans.append(ref)
+    refs = ObjRefs(objects, booleans)
+    OBJECT_REFS[key] = refs
+    return refs
+
+
+def forget_object_refs(obj):
+    OBJECT_REFS.pop(obj.session_uid, None)
+
+########################•########################
+"""                   QUERY                   """
+########################•########################
+
+def referenced_objects(obj):
+    if obj is None:
+        return []
+    objs = set()
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if obj in objs:
+            continue
+        objs.add(obj)
+        stack.extend(object_refs(obj).objects)
+    return list(objs)
+
+
+def referenced_booleans(obj):
+    if obj is None:
+        return []
+    objs = set()
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if current in objs:
+            continue
+        objs.add(current)
+        stack.extend(object_refs(current).booleans)
+    objs.discard(obj)
+    return list(objs)
+
+
+def boolean_objs_from_mods(obj):
+    return list(object_refs(obj).booleans)
+
+########################•########################
+"""                  HANDLES                  """
+########################•########################
+
+@persistent
+def tag_ref_graph(scene, depsgraph):
+    for update in depsgraph.updates:
+        data = update.id
+        if isinstance(data, bpy.types.NodeTree):
+            TREE_OBJECTS.clear()
+            OBJECT_REFS.clear()
+            return
+        if isinstance(data, bpy.types.Object) and update.is_updated_geometry:
+            OBJECT_REFS.pop(data.session_uid, None)
+
+
+@persistent
+def reset_ref_graph(null=''):
+    MOD_OBJECT_PROPS.clear()
+    TREE_OBJECTS.clear()
+    OBJECT_REFS.clear()
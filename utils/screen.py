@@ -4,6 +4,7 @@
 
 import bpy
 import math
+import numpy as np
 from mathutils import Vector
 from bpy_extras.view3d_utils import region_2d_to_origin_3d, region_2d_to_vector_3d, region_2d_to_location_3d, location_3d_to_region_2d
 from mathutils.geometry import distance_point_to_plane
@@ -17,35 +18,11 @@ def screen_factor():
 
 
 def depth_factor_from_clip_extents(context, point_3d):
-    region = context.region
-    rv3d = context.region_data
-    clip_dist = context.space_data.clip_end - context.space_data.clip_start
-    cx = context.area.width / 2
-    cy = context.area.height / 2
-    ray_org = region_2d_to_origin_3d(region, rv3d, (cx, cy))
-    ray_nor = region_2d_to_vector_3d(region, rv3d, (cx, cy))
-    point_dist = distance_point_to_plane(ray_org, point_3d, -ray_nor)
-    factor = 1 / (clip_dist / point_dist)
-    if factor < 0:
-        return 1
-    if factor > 1:
-        return 0
-    return factor
+    return view_snapshot(context).depth_factor(point_3d)
 
 
 def pixels_per_unit_at_depth(context, point_3d, fallback=0):
-    rv3d = context.region_data
-    tangent = rv3d.view_rotation @ Vector((1,1,0))
-    tangent.normalize()
-    tangent *= .5
-    v3d_p1 = point_3d + tangent
-    v3d_p2 = point_3d - tangent
-    region = context.region
-    ss_p1 = location_3d_to_region_2d(region, rv3d, v3d_p1)
-    ss_p2 = location_3d_to_region_2d(region, rv3d, v3d_p2)
-    if ss_p1 and ss_p2:
-        return (ss_p1 - ss_p2).length
-    return fallback
+    return view_snapshot(context).pixels_per_unit(point_3d, fallback=fallback)
 
 
 def units_per_pixel_at_depth(context, point_3d, fallback=0):
@@ -54,6 +31,143 @@ def units_per_pixel_at_depth(context, point_3d, fallback=0):
         return 1 / pixels_per_unit
     return fallback
 
+########################•########################
+"""                 SNAPSHOT                  """
+########################•########################
+
+MEMO_LIMIT = 4096
+SNAPSHOT = None
+
+class ViewSnapshot:
+    '''
+    IFO : View state captured once per frame (Rebuilt when the region, area or region size, or perspective matrix changes)
+    IFO : project uses the area size like cast_point_to_ss || pixels_per_unit uses the region size like location_3d_to_region_2d
+    IFO : Use view_snapshot(context) instead of creating directly
+    '''
+    __slots__ = (
+        'region_pointer', 'width', 'height', 'half_width', 'half_height', 'region_width', 'region_height',
+        'perspective_matrix', 'perspective_array', 'view_rotation', 'view_tangent',
+        'view_origin', 'view_normal', 'clip_distance', 'ss_memo', 'ppu_memo')
+
+    def __init__(self, context):
+        region = context.region
+        rv3d = context.region_data
+        self.region_pointer = region.as_pointer()
+        self.width = context.area.width
+        self.height = context.area.height
+        self.half_width = self.width / 2
+        self.half_height = self.height / 2
+        self.region_width = region.width
+        self.region_height = region.height
+        self.perspective_matrix = rv3d.perspective_matrix.copy()
+        self.perspective_array = np.array(self.perspective_matrix, dtype=np.float64)
+        self.view_rotation = rv3d.view_rotation.copy()
+        tangent = self.view_rotation @ Vector((1,1,0))
+        tangent.normalize()
+        self.view_tangent = tangent * .5
+        center = (self.half_width, self.half_height)
+        self.view_origin = region_2d_to_origin_3d(region, rv3d, center)
+        self.view_normal = region_2d_to_vector_3d(region, rv3d, center)
+        self.clip_distance = context.space_data.clip_end - context.space_data.clip_start
+        self.ss_memo = {}
+        self.ppu_memo = {}
+
+
+    def is_valid_for(self, context):
+        region = context.region
+        if region is None or region.as_pointer() != self.region_pointer:
+            return False
+        if context.area.width != self.width or context.area.height != self.height:
+            return False
+        if region.width != self.region_width or region.height != self.region_height:
+            return False
+        return context.region_data.perspective_matrix == self.perspective_matrix
+
+
+    def project(self, point):
+        '''
+        RET : Screen space Vector or None if behind the view
+        '''
+        key = (point[0], point[1], point[2])
+        if key in self.ss_memo:
+            ss_co = self.ss_memo[key]
+            return ss_co.copy() if ss_co else None
+        prj = self.perspective_matrix @ Vector((key[0], key[1], key[2], 1.0))
+        ss_co = None
+        if prj.w > 0.0:
+            ss_co = Vector((self.half_width + self.half_width * (prj.x / prj.w), self.half_height + self.half_height * (prj.y / prj.w)))
+        if len(self.ss_memo) > MEMO_LIMIT:
+            self.ss_memo.clear()
+        self.ss_memo[key] = ss_co
+        return ss_co.copy() if ss_co else None
+
+
+    def project_array(self, points):
+        '''
+        RET : (N, 2) float64 screen coords, (N,) bool visible mask
+        IFO : Coords behind the view are set to NaN
+        '''
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        mat = self.perspective_array
+        prj = points @ mat[:2, :3].T + mat[:2, 3]
+        w = points @ mat[3, :3] + mat[3, 3]
+        visible = w > 0.0
+        ss_cos = np.full((len(points), 2), np.nan, dtype=np.float64)
+        ss_cos[visible] = prj[visible] / w[visible, None]
+        ss_cos[:, 0] = self.half_width + self.half_width * ss_cos[:, 0]
+        ss_cos[:, 1] = self.half_height + self.half_height * ss_cos[:, 1]
+        return ss_cos, visible
+
+
+    def project_to_region(self, point):
+        '''
+        RET : Region space Vector or None if behind the view
+        '''
+        prj = self.perspective_matrix @ Vector((point[0], point[1], point[2], 1.0))
+        if prj.w > 0.0:
+            half_width = self.region_width / 2
+            half_height = self.region_height / 2
+            return Vector((half_width + half_width * (prj.x / prj.w), half_height + half_height * (prj.y / prj.w)))
+        return None
+
+
+    def pixels_per_unit(self, point, fallback=0):
+        key = (point[0], point[1], point[2])
+        if key in self.ppu_memo:
+            pixels = self.ppu_memo[key]
+            return fallback if pixels is None else pixels
+        point = Vector(key)
+        ss_p1 = self.project_to_region(point + self.view_tangent)
+        ss_p2 = self.project_to_region(point - self.view_tangent)
+        pixels = (ss_p1 - ss_p2).length if ss_p1 and ss_p2 else None
+        if len(self.ppu_memo) > MEMO_LIMIT:
+            self.ppu_memo.clear()
+        self.ppu_memo[key] = pixels
+        return fallback if pixels is None else pixels
+
+
+    def depth_factor(self, point):
+        point_dist = distance_point_to_plane(self.view_origin, point, -self.view_normal)
+        factor = 1 / (self.clip_distance / point_dist)
+        if factor < 0:
+            return 1
+        if factor > 1:
+            return 0
+        return factor
+
+
+def view_snapshot(context):
+    '''
+    RET : ViewSnapshot shared by all callers until the view changes
+    '''
+    global SNAPSHOT
+    if SNAPSHOT is None or not SNAPSHOT.is_valid_for(context):
+        SNAPSHOT = ViewSnapshot(context)
+    return SNAPSHOT
+
+########################•########################
+"""                   VIEW                    """
+########################•########################
 
 def object_location_to_screen_coords(context, obj):
     if not isinstance(obj, bpy.types.Object):
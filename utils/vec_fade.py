@@ -3,7 +3,6 @@
 ########################•########################
 
 import bpy
-import time
 import gpu
 import numpy as np
 from random import choice
@@ -11,7 +10,7 @@ from gpu_extras.batch import batch_for_shader
 from bpy.app.handlers import persistent
 from mathutils import Vector, Matrix
 from .addon import user_prefs
-from .graphics import draw_matrix, gen_line_batches_for_wire_sphere, gen_triangles_from_sphere, gen_tri_batch_from_triangles
+from .graphics import FADE_COLOR, fade_time, draw_matrix, gen_line_batches_for_wire_sphere, gen_triangles_from_sphere, gen_tri_batch_from_triangles
 
 
 UNIFORM_COLOR = gpu.shader.from_builtin('UNIFORM_COLOR')
@@ -21,19 +20,20 @@ DURATION = 2.5
 HANDLE = None
 # List of Data Instances
 DRAW_DATA = []
+# Screens that created fades (Only these are tagged while fading)
+SCREENS = set()
 
 class Data:
     def __init__(self):
         # TIME
-        self.start_time = time.time()
+        self.start_time = fade_time()
         self.duration = None
         # DRAW
-        self.alpha = 1.0
+        self.alpha_scale = 1.0
         self.point_size = 1
         self.line_width = 1
         self.color_a = None
         self.color_b = None
-        self.use_half_alpha = False
         # BATCH
         self.point_batch = None
         self.line_batch = None
@@ -67,11 +67,11 @@ def init(
     data = Data()
 
     data.duration = duration
-    data.use_half_alpha = use_half_alpha
+    data.alpha_scale = 1 / 6 if use_half_alpha else 1.0
 
     if random_color:
-        data.color_a = Vector(choice(COLORS))
-        data.color_b = Vector(choice(COLORS))
+        data.color_a = choice(COLORS)
+        data.color_b = choice(COLORS)
     else:
         if color_a is None:
             color_a = (0,1,0)
@@ -81,22 +81,22 @@ def init(
                 color_b = color_a
             else:
                 color_b = (1,1,1)
-        data.color_a = Vector((color_a[0], color_a[1], color_a[2]))
-        data.color_b = Vector((color_b[0], color_b[1], color_b[2]))
+        data.color_a = (color_a[0], color_a[1], color_a[2])
+        data.color_b = (color_b[0], color_b[1], color_b[2])
 
     data.matrix = matrix
     data.point_size = point_size
 
     if points:
-        data.point_batch = batch_for_shader(UNIFORM_COLOR, 'POINTS', {"pos": points})
+        data.point_batch = batch_for_shader(FADE_COLOR, 'POINTS', {"pos": points})
 
     if lines:
-        data.line_batch = batch_for_shader(UNIFORM_COLOR, 'LINES', {"pos": lines})
+        data.line_batch = batch_for_shader(FADE_COLOR, 'LINES', {"pos": lines})
     
     if tris:
         points = [vec for tri in tris for vec in tri]
         indices = [(i, i+1, i+2) for i in range(0, len(points), 3)]
-        data.tri_batch = batch_for_shader(UNIFORM_COLOR, 'TRIS', {"pos": points}, indices=indices)
+        data.tri_batch = batch_for_shader(FADE_COLOR, 'TRIS', {"pos": points}, indices=indices)
 
     if plane_origin is not None and plane_normal is not None:
 
@@ -109,7 +109,7 @@ def init(
         bot_R = mat @ Vector(( 0.5, -0.5, 0))
         top_L = mat @ Vector((-0.5,  0.5, 0))
         top_R = mat @ Vector(( 0.5,  0.5, 0))
-        data.plane_batch = batch_for_shader(UNIFORM_COLOR, 'LINES', {"pos": (bot_L, top_L, top_L, top_R, top_R, bot_R, bot_R, bot_L, plane_origin, plane_origin + plane_normal)})
+        data.plane_batch = batch_for_shader(FADE_COLOR, 'LINES', {"pos": (bot_L, top_L, top_L, top_R, top_R, bot_R, bot_R, bot_L, plane_origin, plane_origin + plane_normal)})
 
     if sphere_center and sphere_radius:
         if sphere_as_wire:
@@ -119,6 +119,8 @@ def init(
             data.sphere_batch = gen_tri_batch_from_triangles(triangles)
 
     DRAW_DATA.append(data)
+    if bpy.context.screen:
+        SCREENS.add(bpy.context.screen)
     assign_v_fade_handle(handle_type)
 
 ########################•########################
@@ -127,14 +129,10 @@ def init(
 
 def process_timer():
     global DRAW_DATA
+    now = fade_time()
     for data in DRAW_DATA[:]:
-        delta = time.time() - data.start_time
-        if delta >= data.duration or data.duration <= 0:
+        if now - data.start_time >= data.duration or data.duration <= 0:
             DRAW_DATA.remove(data)
-        elif data.use_half_alpha:
-            data.alpha = min(max((1 - (delta / data.duration)), 0), 1) / 6
-        else:
-            data.alpha = min(max((1 - (delta / data.duration)), 0), 1)
     if len(DRAW_DATA) == 0:
         remove_vec_fade_handle()
 
@@ -152,6 +150,7 @@ def remove_vec_fade_handle(null=''):
         except Exception as e: print("Poly Fade: Did not remove draw handle", e)
     HANDLE = None
     DRAW_DATA.clear()
+    SCREENS.clear()
 
 
 def assign_v_fade_handle(handle_type="POST_VIEW"):
@@ -171,39 +170,47 @@ def draw():
         return
     gpu.state.depth_mask_set(False)
     gpu.state.blend_set('ALPHA')
+    FADE_COLOR.bind()
+    FADE_COLOR.uniform_float("time", fade_time())
     for data in DRAW_DATA:
-        color = data.color_b.lerp(data.color_a, data.alpha)
-        color = (color[0], color[1], color[2], data.alpha)
-        UNIFORM_COLOR.uniform_float("color", color)
+        FADE_COLOR.uniform_float("color_start", data.color_a)
+        FADE_COLOR.uniform_float("color_end", data.color_b)
+        FADE_COLOR.uniform_float("start_time", data.start_time)
+        FADE_COLOR.uniform_float("duration", data.duration)
+        FADE_COLOR.uniform_float("alpha_scale", data.alpha_scale)
         if data.line_batch:
             gpu.state.line_width_set(data.line_width)
-            data.line_batch.draw(UNIFORM_COLOR)
+            data.line_batch.draw(FADE_COLOR)
             gpu.state.line_width_set(1)
         if data.point_batch:
             gpu.state.point_size_set(data.point_size)
-            data.point_batch.draw(UNIFORM_COLOR)
+            data.point_batch.draw(FADE_COLOR)
         if data.tri_batch:
-            data.tri_batch.draw(UNIFORM_COLOR)
-        if data.matrix:
-            draw_matrix(matrix=data.matrix)
+            data.tri_batch.draw(FADE_COLOR)
         if data.plane_batch:
             gpu.state.line_width_set(data.line_width)
-            data.plane_batch.draw(UNIFORM_COLOR)
+            data.plane_batch.draw(FADE_COLOR)
             gpu.state.line_width_set(1)
         if data.sphere_batch:
             if type(data.sphere_batch) == tuple:
                 for batch in data.sphere_batch:
-                    batch.draw(UNIFORM_COLOR)
+                    batch.draw(FADE_COLOR)
             else:
-                data.sphere_batch.draw(UNIFORM_COLOR)
+                data.sphere_batch.draw(FADE_COLOR)
+        if data.matrix:
+            draw_matrix(matrix=data.matrix)
     gpu.state.blend_set('NONE')
 
 
 def view3d_tag_redraw():
+    process_timer()
+    # Final pass clears the fade from every view
+    screens = SCREENS if HANDLE else None
     for window in bpy.context.window_manager.windows:
+        if screens is not None and window.screen not in screens:
+            continue
         for area in window.screen.areas:
             if area.type == 'VIEW_3D':
                 area.tag_redraw()
-    process_timer()
     if HANDLE: return INTERVAL
     return None